@@ -0,0 +1,1302 @@
+"""
+Routing Benchmarks - Jakarta Waterways
+======================================
+Benchmark performa RoutingAlgorithms pada graf waterways sintetis yang jauh
+lebih besar dari jaringan 16 node Jakarta, sehingga perilaku scaling setiap
+algoritma benar-benar terlihat.
+
+Cara menjalankan:
+    python benchmark_routing.py              # semua benchmark
+    python benchmark_routing.py traversal    # benchmark tertentu
+
+Nama benchmark yang tersedia ada di dictionary BENCHMARKS di akhir file.
+"""
+
+import asyncio
+import csv
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from collections import deque
+
+import networkx as nx
+import numpy as np
+import pandas as pd
+
+from bulk_loader import NetworkTables
+from contraction_hierarchies import ContractionHierarchy
+from dispatch import FleetDispatcher
+from dynamic_sssp import DynamicShortestPaths
+from graph_file import open_graph, write_graph
+from hub_labels import HubLabels
+from overlay_routing import MultiLevelOverlay
+from priority_queues import PRIORITY_QUEUES, CountingQueue, make_queue
+from routing_service import RoutingService, load_test
+from scenario_sweep import run_sweep, summarize_sweep
+from synthetic_waterways import generate_waterways
+from time_dependent_routing import TimeDependentGraph
+from water_ambulance_routing import (CSRGraph, JakartaWaterwaysNetwork, RoutingAlgorithms,
+                                     VersionedGraph)
+
+# ============================================================================
+# SYNTHETIC GRAPHS
+# ============================================================================
+
+def make_corridor_network(length: int, width: int = 3, dermaga_every: int = 50,
+                          seed: int = 0) -> CSRGraph:
+    """
+    Koridor pesisir panjang (length x width) dari generator sintetis.
+    Graf ini sangat "dalam" sehingga path DFS/BFS bisa ribuan node.
+    """
+    return generate_waterways(length * width, width=width, dermaga_every=dermaga_every,
+                              seed=seed).to_csr()
+
+
+def make_city_network(rows: int, cols: int, drop: float = 0.15, seed: int = 0) -> CSRGraph:
+    """
+    Grid kanal kota (rows x cols) dari generator sintetis dengan sebagian
+    ruas ditutup secara acak (graf tetap terhubung).
+    """
+    return generate_waterways(rows * cols, width=rows, canal_density=1 - drop,
+                              seed=seed).to_csr()
+
+
+def make_canal_dag(n: int, out_degree: int = 5, span: int = 20, seed: int = 0) -> CSRGraph:
+    """
+    Sistem kanal satu arah: setiap node mengalir ke out_degree node di
+    hilirnya (maksimal span langkah), sehingga graf directed tanpa cycle
+    dengan rantai sepanjang ribuan node.
+    """
+    rng = np.random.default_rng(seed)
+    sources = np.repeat(np.arange(n), out_degree)
+    targets = sources + rng.integers(1, span + 1, size=len(sources))
+    keep = targets < n
+    sources, targets = sources[keep], targets[keep]
+    weights = rng.integers(1, 11, size=len(sources)).astype(np.float64)
+    return CSRGraph.from_arcs([f"N{i}" for i in range(n)], sources, targets, weights,
+                              times=weights, distances=weights * 150, directed=True)
+
+# ============================================================================
+# LEGACY IMPLEMENTATIONS (path copy per push, untuk pembanding)
+# ============================================================================
+
+def legacy_dfs(csr: CSRGraph, s: int, g: int):
+    """DFS versi lama: setiap push menyalin seluruh path"""
+    indptr, indices, _ = csr.adjacency_lists()
+    visited = set()
+    stack = [(s, [s])]
+    while stack:
+        node, path = stack.pop()
+        if node == g:
+            return path
+        if node not in visited:
+            visited.add(node)
+            for neighbor in indices[indptr[node]:indptr[node + 1]]:
+                if neighbor not in visited:
+                    stack.append((neighbor, path + [neighbor]))
+    return []
+
+
+def legacy_bfs(csr: CSRGraph, s: int, g: int):
+    """BFS versi lama: setiap push menyalin seluruh path"""
+    indptr, indices, _ = csr.adjacency_lists()
+    visited = {s}
+    queue = deque([(s, [s])])
+    while queue:
+        node, path = queue.popleft()
+        if node == g:
+            return path
+        for neighbor in indices[indptr[node]:indptr[node + 1]]:
+            if neighbor not in visited:
+                visited.add(neighbor)
+                queue.append((neighbor, path + [neighbor]))
+    return []
+
+
+def legacy_multi_source_bfs(csr: CSRGraph, s: int, g: int):
+    """Multi-Source BFS versi lama: BFS round-robin dengan path copy"""
+    indptr, indices, _ = csr.adjacency_lists()
+    sources = csr.nodes_of_type('dermaga').tolist()
+    visited = {src: {src} for src in sources}
+    queues = {src: deque([(src, [src])]) for src in sources}
+    while any(queues.values()):
+        for source in sources:
+            if not queues[source]:
+                continue
+            node, path = queues[source].popleft()
+            if node == g and source == s:
+                return path
+            for neighbor in indices[indptr[node]:indptr[node + 1]]:
+                if neighbor not in visited[source]:
+                    visited[source].add(neighbor)
+                    queues[source].append((neighbor, path + [neighbor]))
+    return []
+
+
+def legacy_floyd_warshall(csr: CSRGraph):
+    """Floyd-Warshall versi lama: triple loop Python pada dict (i, j)"""
+    indptr, indices, weights = csr.adjacency_lists()
+    nodes = range(csr.n_nodes)
+    dist = {(i, j): float('inf') for i in nodes for j in nodes}
+    for i in nodes:
+        dist[(i, i)] = 0
+    for u in nodes:
+        for e in range(indptr[u], indptr[u + 1]):
+            dist[(u, indices[e])] = min(dist[(u, indices[e])], weights[e])
+    for k in nodes:
+        for i in nodes:
+            for j in nodes:
+                if dist[(i, j)] > dist[(i, k)] + dist[(k, j)]:
+                    dist[(i, j)] = dist[(i, k)] + dist[(k, j)]
+    return dist
+
+
+def legacy_bellman_ford(csr: CSRGraph, s: int):
+    """Bellman-Ford versi lama: selalu n - 1 ronde penuh atas semua edge"""
+    arcs = csr.edge_arcs()
+    edges = list(zip(csr.tails[arcs].tolist(), csr.indices[arcs].tolist(),
+                     csr.weights[arcs].tolist()))
+    distances = [float('inf')] * csr.n_nodes
+    distances[s] = 0
+    relaxations = 0
+    for _ in range(csr.n_nodes - 1):
+        for u, v, weight in edges:
+            relaxations += 1
+            if distances[u] + weight < distances[v]:
+                distances[v] = distances[u] + weight
+            if not csr.directed and distances[v] + weight < distances[u]:
+                distances[u] = distances[v] + weight
+    return distances, relaxations
+
+
+def legacy_topological_sort(csr: CSRGraph, s: int, g: int):
+    """Topological sort versi lama: dfs_visit rekursif"""
+    indptr, indices, weights = csr.adjacency_lists()
+    visited = [False] * csr.n_nodes
+    stack = []
+
+    def dfs_visit(node):
+        visited[node] = True
+        for neighbor in indices[indptr[node]:indptr[node + 1]]:
+            if not visited[neighbor]:
+                dfs_visit(neighbor)
+        stack.append(node)
+
+    for node in range(csr.n_nodes):
+        if not visited[node]:
+            dfs_visit(node)
+
+    distances = [float('inf')] * csr.n_nodes
+    distances[s] = 0
+    for node in reversed(stack):
+        if distances[node] != float('inf'):
+            for e in range(indptr[node], indptr[node + 1]):
+                distances[indices[e]] = min(distances[indices[e]], distances[node] + weights[e])
+    return distances[g]
+
+# ============================================================================
+# MEASUREMENT HELPERS
+# ============================================================================
+
+def measure(func, *args, repeat: int = 1):
+    """Jalankan func dan kembalikan (hasil, waktu ms terbaik, peak memory KB)"""
+    best = float('inf')
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        result = func(*args)
+        best = min(best, (time.perf_counter() - t0) * 1000)
+
+    tracemalloc.start()
+    func(*args)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, best, peak / 1024
+
+# ============================================================================
+# BENCHMARKS
+# ============================================================================
+
+def benchmark_traversal(lengths=(500, 2000, 6000), width: int = 3):
+    """Parent-pointer DFS/BFS dan Multi-Source BFS satu frontier vs versi path copy"""
+    print("\n" + "=" * 80)
+    print("TRAVERSAL BENCHMARK: parent pointers vs path copy (deep corridor graphs)")
+    print("=" * 80)
+
+    rows = []
+    for length in lengths:
+        csr = make_corridor_network(length, width, dermaga_every=max(1, length // 4))
+        algorithms = RoutingAlgorithms(csr)
+        csr.adjacency_lists()
+        start, goal = csr.node_ids[0], csr.node_ids[-1]
+        s, g = csr.index[start], csr.index[goal]
+
+        cases = [
+            ('DFS', algorithms.dfs, legacy_dfs),
+            ('BFS', algorithms.bfs, legacy_bfs),
+            ('Multi-Source BFS', algorithms.multi_source_bfs, legacy_multi_source_bfs),
+        ]
+        for name, new_func, old_func in cases:
+            (path, _, _), new_ms, new_kb = measure(new_func, start, goal)
+            old_path, old_ms, old_kb = measure(old_func, csr, s, g)
+            old_ids = [csr.node_ids[i] for i in old_path]
+            # Multi-Source BFS satu frontier boleh memilih path lain dengan hop sama
+            assert (len(path) == len(old_ids) if name == 'Multi-Source BFS'
+                    else path == old_ids)
+            rows.append({
+                'Algorithm': name,
+                'Nodes': csr.n_nodes,
+                'Path Length': len(path) - 1,
+                'Path Copy (ms)': round(old_ms, 2),
+                'Parent Ptr (ms)': round(new_ms, 2),
+                'Path Copy Peak (KB)': round(old_kb, 1),
+                'Parent Ptr Peak (KB)': round(new_kb, 1),
+                'Memory Ratio': round(old_kb / max(new_kb, 1e-9), 1),
+            })
+
+    df = pd.DataFrame(rows)
+    print(df.to_string(index=False))
+    return df
+
+
+def benchmark_floyd_warshall(sizes=(60, 120, 240, 480), legacy_limit: int = 240):
+    """Floyd-Warshall NumPy vs triple loop Python, plus biaya query setelah cache"""
+    print("\n" + "=" * 80)
+    print("FLOYD-WARSHALL BENCHMARK: vectorized all-pairs vs dict triple loop")
+    print("=" * 80)
+
+    rows = []
+    for n in sizes:
+        csr = make_corridor_network(n // 3, 3)
+        csr.adjacency_lists()
+        algorithms = RoutingAlgorithms(csr)
+
+        t0 = time.perf_counter()
+        dist, _ = algorithms.all_pairs_shortest_paths()
+        build_ms = (time.perf_counter() - t0) * 1000
+
+        t0 = time.perf_counter()
+        algorithms.floyd_warshall(csr.node_ids[0], csr.node_ids[-1])
+        query_ms = (time.perf_counter() - t0) * 1000
+
+        legacy_ms = None
+        if n <= legacy_limit:
+            t0 = time.perf_counter()
+            legacy = legacy_floyd_warshall(csr)
+            legacy_ms = round((time.perf_counter() - t0) * 1000, 2)
+            assert legacy[(0, csr.n_nodes - 1)] == dist[0, -1]
+
+        rows.append({
+            'Nodes': csr.n_nodes,
+            'Dict Loop (ms)': legacy_ms,
+            'NumPy All-Pairs (ms)': round(build_ms, 2),
+            'Cached Query (ms)': round(query_ms, 4),
+        })
+
+    df = pd.DataFrame(rows)
+    print(df.to_string(index=False))
+    return df
+
+
+def benchmark_a_star(shapes=((100, 10), (300, 30), (600, 60)), landmarks: int = 8,
+                     queries: int = 20, seed: int = 0):
+    """Node yang di-pop Dijkstra vs A* geometris vs A* ALT (landmark)"""
+    print("\n" + "=" * 80)
+    print("A* BENCHMARK: Dijkstra vs geometric lower bound vs ALT landmarks")
+    print("=" * 80)
+
+    rng = np.random.default_rng(seed)
+    rows = []
+    for length, width in shapes:
+        csr = make_corridor_network(length, width)
+        algorithms = RoutingAlgorithms(csr)
+        csr.adjacency_lists()
+
+        t0 = time.perf_counter()
+        algorithms.prepare_landmarks(landmarks)
+        preprocess_ms = (time.perf_counter() - t0) * 1000
+
+        pairs = rng.integers(0, csr.n_nodes, size=(queries, 2))
+        cases = [
+            ('Dijkstra', algorithms.dijkstra),
+            ('A* geometric', lambda s, g: algorithms.a_star(s, g, heuristic='geometric')),
+            ('A* ALT', lambda s, g: algorithms.a_star(s, g, heuristic='alt')),
+        ]
+        reference = None
+        for name, func in cases:
+            t0 = time.perf_counter()
+            results = [func(csr.node_ids[s], csr.node_ids[g]) for s, g in pairs]
+            elapsed = (time.perf_counter() - t0) * 1000
+            costs = [cost for _, cost, _ in results]
+            if reference is None:
+                reference = costs
+            assert np.allclose(costs, reference)
+            rows.append({
+                'Nodes': csr.n_nodes,
+                'Method': name,
+                'Avg Pops': round(np.mean([it for _, _, it in results]), 1),
+                'Avg Query (ms)': round(elapsed / queries, 3),
+                'Preprocess (ms)': round(preprocess_ms, 1) if name == 'A* ALT' else None,
+            })
+
+    df = pd.DataFrame(rows)
+    print(df.to_string(index=False))
+    return df
+
+
+def benchmark_bidirectional(shapes=((100, 10), (300, 30), (600, 60)), landmarks: int = 8,
+                            queries: int = 20, seed: int = 0):
+    """Pencarian satu arah vs bidirectional (Dijkstra dan A* ALT)"""
+    print("\n" + "=" * 80)
+    print("BIDIRECTIONAL BENCHMARK: unidirectional vs bidirectional search")
+    print("=" * 80)
+
+    rng = np.random.default_rng(seed)
+    rows = []
+    for length, width in shapes:
+        csr = make_corridor_network(length, width)
+        algorithms = RoutingAlgorithms(csr)
+        csr.adjacency_lists()
+        algorithms.prepare_landmarks(landmarks)
+
+        pairs = rng.integers(0, csr.n_nodes, size=(queries, 2))
+        cases = [
+            ('Dijkstra', algorithms.dijkstra),
+            ('Bidirectional Dijkstra', algorithms.bidirectional_dijkstra),
+            ('A* ALT', algorithms.a_star),
+            ('Bidirectional A* ALT', algorithms.bidirectional_a_star),
+        ]
+        reference = None
+        for name, func in cases:
+            t0 = time.perf_counter()
+            results = [func(csr.node_ids[s], csr.node_ids[g]) for s, g in pairs]
+            elapsed = (time.perf_counter() - t0) * 1000
+            costs = [cost for _, cost, _ in results]
+            if reference is None:
+                reference = costs
+            assert np.allclose(costs, reference)
+            rows.append({
+                'Nodes': csr.n_nodes,
+                'Method': name,
+                'Avg Pops': round(np.mean([it for _, _, it in results]), 1),
+                'Avg Query (ms)': round(elapsed / queries, 3),
+            })
+
+    df = pd.DataFrame(rows)
+    print(df.to_string(index=False))
+    return df
+
+
+def benchmark_contraction_hierarchies(shapes=((30, 30), (60, 60), (100, 100)),
+                                      queries: int = 200, seed: int = 0):
+    """Preprocessing CH sekali, lalu latency query CH vs Dijkstra"""
+    print("\n" + "=" * 80)
+    print("CONTRACTION HIERARCHIES BENCHMARK: query latency vs Dijkstra")
+    print("=" * 80)
+
+    rng = np.random.default_rng(seed)
+    rows = []
+    for r, c in shapes:
+        csr = make_city_network(r, c, seed=seed)
+        algorithms = RoutingAlgorithms(csr)
+        csr.adjacency_lists()
+        hierarchy = ContractionHierarchy.build(csr)
+
+        pairs = [(csr.node_ids[s], csr.node_ids[g])
+                 for s, g in rng.integers(0, csr.n_nodes, size=(queries, 2))]
+
+        t0 = time.perf_counter()
+        reference = [algorithms.dijkstra(s, g) for s, g in pairs]
+        dijkstra_ms = (time.perf_counter() - t0) * 1000 / queries
+
+        t0 = time.perf_counter()
+        results = [hierarchy.query(s, g) for s, g in pairs]
+        ch_ms = (time.perf_counter() - t0) * 1000 / queries
+
+        t0 = time.perf_counter()
+        for s, g in pairs:
+            hierarchy.distance(s, g)
+        distance_ms = (time.perf_counter() - t0) * 1000 / queries
+
+        assert np.allclose([d for _, d, _ in results], [d for _, d, _ in reference])
+        rows.append({
+            'Nodes': csr.n_nodes,
+            'Arcs': csr.n_arcs,
+            'Shortcuts': hierarchy.stats['shortcuts'],
+            'Preprocess (s)': round(hierarchy.stats['preprocess_seconds'], 2),
+            'Dijkstra (ms)': round(dijkstra_ms, 3),
+            'CH Path (ms)': round(ch_ms, 3),
+            'CH Distance (ms)': round(distance_ms, 3),
+            'Dijkstra Pops': round(np.mean([it for _, _, it in reference]), 1),
+            'CH Pops': round(np.mean([it for _, _, it in results]), 1),
+        })
+
+    df = pd.DataFrame(rows)
+    print(df.to_string(index=False))
+    return df
+
+
+def benchmark_multi_source(shapes=((60, 60), (120, 120), (200, 200)), facilities: int = 40,
+                           seed: int = 0):
+    """Nearest-facility: satu Multi-Source Dijkstra vs satu Dijkstra per source"""
+    print("\n" + "=" * 80)
+    print("MULTI-SOURCE BENCHMARK: single pass vs one full Dijkstra per dermaga")
+    print("=" * 80)
+
+    rng = np.random.default_rng(seed)
+    rows = []
+    for r, c in shapes:
+        csr = make_city_network(r, c, seed=seed)
+        algorithms = RoutingAlgorithms(csr)
+        csr.adjacency_lists()
+        sources = rng.choice(csr.n_nodes, size=facilities, replace=False).tolist()
+
+        t0 = time.perf_counter()
+        distances, nearest, iterations = algorithms.multi_source_dijkstra(
+            [csr.node_ids[i] for i in sources])
+        single_ms = (time.perf_counter() - t0) * 1000
+
+        t0 = time.perf_counter()
+        separate = np.array([algorithms._dijkstra_tree(src)[0] for src in sources])
+        separate_ms = (time.perf_counter() - t0) * 1000
+
+        assert np.allclose(separate.min(axis=0), distances)
+        rows.append({
+            'Nodes': csr.n_nodes,
+            'Sources': facilities,
+            'Separate Searches (ms)': round(separate_ms, 1),
+            'Single Pass (ms)': round(single_ms, 1),
+            'Speedup': round(separate_ms / single_ms, 1),
+            'Single Pass Pops': iterations,
+        })
+
+    df = pd.DataFrame(rows)
+    print(df.to_string(index=False))
+    return df
+
+
+def benchmark_batch(shapes=((60, 60), (120, 120)), sources: int = 10, targets: int = 50,
+                    seed: int = 0):
+    """Many-to-many: satu tree per source vs satu Dijkstra per pasangan"""
+    print("\n" + "=" * 80)
+    print("BATCH BENCHMARK: many_to_many vs individual dijkstra queries")
+    print("=" * 80)
+
+    rng = np.random.default_rng(seed)
+    rows = []
+    for r, c in shapes:
+        csr = make_city_network(r, c, seed=seed)
+        algorithms = RoutingAlgorithms(csr)
+        csr.adjacency_lists()
+        starts = [csr.node_ids[i] for i in rng.choice(csr.n_nodes, sources, replace=False)]
+        goals = [csr.node_ids[i] for i in rng.choice(csr.n_nodes, targets, replace=False)]
+
+        t0 = time.perf_counter()
+        batch = algorithms.many_to_many(starts, goals)
+        batch_ms = (time.perf_counter() - t0) * 1000
+
+        t0 = time.perf_counter()
+        single = np.array([[algorithms.dijkstra(s, g)[1] for g in goals] for s in starts])
+        single_ms = (time.perf_counter() - t0) * 1000
+
+        assert np.allclose(batch.distances, single)
+        rows.append({
+            'Nodes': csr.n_nodes,
+            'Queries': sources * targets,
+            'Individual (ms)': round(single_ms, 1),
+            'Batch (ms)': round(batch_ms, 1),
+            'Speedup': round(single_ms / batch_ms, 1),
+        })
+
+    df = pd.DataFrame(rows)
+    print(df.to_string(index=False))
+    return df
+
+
+def benchmark_dynamic_updates(shapes=((60, 60), (120, 120)), sources: int = 8,
+                              batch_sizes=(1, 10, 50), rounds: int = 5, seed: int = 0):
+    """Perbaikan inkremental shortest-path tree vs Dijkstra ulang per source"""
+    print("\n" + "=" * 80)
+    print("DYNAMIC SSSP BENCHMARK: incremental repair vs full recomputation")
+    print("=" * 80)
+
+    rng = np.random.default_rng(seed)
+    rows = []
+    for r, c in shapes:
+        csr = make_city_network(r, c, seed=seed)
+        algorithms = RoutingAlgorithms(csr)
+        source_ids = [csr.node_ids[i] for i in rng.choice(csr.n_nodes, sources, replace=False)]
+        dynamic = DynamicShortestPaths(algorithms, source_ids)
+        arcs = csr.edge_arcs()
+
+        for batch in batch_sizes:
+            repair_ms = full_ms = 0.0
+            affected = 0
+            for _ in range(rounds):
+                picked = rng.choice(arcs, batch, replace=False)
+                factors = rng.choice([0.5, 0.8, 1.5, 3.0], size=batch)
+                updates = [(csr.node_ids[csr.tails[e]], csr.node_ids[csr.indices[e]],
+                            max(1.0, round(dynamic.weights[e] * f)))
+                           for e, f in zip(picked, factors)]
+
+                t0 = time.perf_counter()
+                stats = dynamic.update_edges(updates)
+                repair_ms += (time.perf_counter() - t0) * 1000
+                affected += stats['affected']
+
+                t0 = time.perf_counter()
+                current = dynamic._current_csr()
+                current.adjacency_lists()
+                full = [algorithms._dijkstra_tree(csr.index[src], csr=current)[0]
+                        for src in source_ids]
+                full_ms += (time.perf_counter() - t0) * 1000
+
+                for src, expected in zip(source_ids, full):
+                    assert np.allclose(dynamic.dist[csr.index[src]], expected)
+
+            rows.append({
+                'Nodes': csr.n_nodes,
+                'Sources': sources,
+                'Edges/Batch': batch,
+                'Full Recompute (ms)': round(full_ms / rounds, 2),
+                'Incremental (ms)': round(repair_ms / rounds, 2),
+                'Speedup': round(full_ms / max(repair_ms, 1e-9), 1),
+                'Avg Affected Nodes': round(affected / rounds, 1),
+            })
+
+    df = pd.DataFrame(rows)
+    print(df.to_string(index=False))
+    return df
+
+
+def benchmark_time_dependent(shape=(120, 120), breakpoints=(1, 4, 24, 96, 288),
+                             queries: int = 30, seed: int = 0):
+    """Biaya query time-dependent Dijkstra/A* terhadap jumlah breakpoint per edge"""
+    print("\n" + "=" * 80)
+    print("TIME-DEPENDENT BENCHMARK: query cost vs breakpoints per edge")
+    print("=" * 80)
+
+    csr = make_city_network(*shape, seed=seed)
+    algorithms = RoutingAlgorithms(csr)
+    rng = np.random.default_rng(seed)
+    pairs = [tuple(csr.node_ids[i] for i in rng.choice(csr.n_nodes, 2, replace=False))
+             for _ in range(queries)]
+    departures = rng.uniform(0, 1440, size=queries)
+
+    t0 = time.perf_counter()
+    for start, goal in pairs:
+        algorithms.dijkstra(start, goal)
+    static_ms = (time.perf_counter() - t0) * 1000 / queries
+
+    rows = []
+    for k in breakpoints:
+        t0 = time.perf_counter()
+        td = TimeDependentGraph.synthetic_tides(csr, breakpoints=k, seed=seed)
+        build_ms = (time.perf_counter() - t0) * 1000
+
+        row = {'Nodes': csr.n_nodes, 'Breakpoints/Edge': k,
+               'Profile MB': round((td.bp_times.nbytes + td.bp_values.nbytes
+                                    + td.bp_indptr.nbytes) / 2 ** 20, 2),
+               'Build (ms)': round(build_ms, 1),
+               'Static Dijkstra (ms)': round(static_ms, 2)}
+        for label, heuristic in (('TD-Dijkstra', None), ('TD-A*', 'geometric')):
+            iterations = 0
+            t0 = time.perf_counter()
+            for (start, goal), departure in zip(pairs, departures):
+                iterations += td.earliest_arrival(start, goal, departure, heuristic=heuristic)[2]
+            row[f'{label} (ms)'] = round((time.perf_counter() - t0) * 1000 / queries, 2)
+            row[f'{label} Iter'] = iterations // queries
+        rows.append(row)
+
+    df = pd.DataFrame(rows)
+    print(df.to_string(index=False))
+    return df
+
+
+def benchmark_k_shortest(shapes=((30, 30), (60, 60)), ks=(1, 5, 10, 20),
+                         max_detour: float = 1.2, queries: int = 5, seed: int = 0):
+    """Yen k-shortest paths: biaya terhadap k, dengan dan tanpa batas detour"""
+    print("\n" + "=" * 80)
+    print("K-SHORTEST PATHS BENCHMARK: Yen with pruned spur searches")
+    print("=" * 80)
+
+    rng = np.random.default_rng(seed)
+    rows = []
+    for r, c in shapes:
+        csr = make_city_network(r, c, seed=seed)
+        algorithms = RoutingAlgorithms(csr)
+        pairs = [tuple(csr.node_ids[i] for i in rng.choice(csr.n_nodes, 2, replace=False))
+                 for _ in range(queries)]
+
+        for k in ks:
+            row = {'Nodes': csr.n_nodes, 'k': k}
+            for label, detour in (('Unbounded', None), (f'Detour<={max_detour}', max_detour)):
+                found = iterations = 0
+                t0 = time.perf_counter()
+                for start, goal in pairs:
+                    routes, its = algorithms.k_shortest_paths(start, goal, k, max_detour=detour)
+                    found += len(routes)
+                    iterations += its
+                row[f'{label} (ms)'] = round((time.perf_counter() - t0) * 1000 / queries, 1)
+                row[f'{label} Iter'] = iterations // queries
+                row[f'{label} Paths'] = round(found / queries, 1)
+            rows.append(row)
+
+    df = pd.DataFrame(rows)
+    print(df.to_string(index=False))
+    return df
+
+
+def benchmark_bellman_ford(shapes=((20, 20), (40, 40), (80, 80)), legacy_limit: int = 500,
+                           seed: int = 0):
+    """Bellman-Ford: ronde penuh lama vs early exit vs SPFA vs NumPy"""
+    print("\n" + "=" * 80)
+    print("BELLMAN-FORD BENCHMARK: rounds and relaxations per mode")
+    print("=" * 80)
+
+    rows = []
+    for r, c in shapes:
+        csr = make_city_network(r, c, seed=seed)
+        csr.adjacency_lists()
+        algorithms = RoutingAlgorithms(csr)
+        reference = None
+
+        if csr.n_nodes <= legacy_limit:
+            t0 = time.perf_counter()
+            reference, relaxations = legacy_bellman_ford(csr, 0)
+            rows.append({'Nodes': csr.n_nodes, 'Mode': 'full rounds (old)',
+                         'Rounds': csr.n_nodes - 1,
+                         'Expanded': (csr.n_nodes - 1) * csr.n_nodes, 'Relaxations': relaxations,
+                         'Time (ms)': round((time.perf_counter() - t0) * 1000, 2)})
+
+        for mode in ('rounds', 'spfa', 'numpy'):
+            t0 = time.perf_counter()
+            distances, _, rounds, relaxations, expanded = algorithms._bellman_ford_tree(0, mode)
+            elapsed = (time.perf_counter() - t0) * 1000
+            if reference is None:
+                reference = distances
+            assert np.allclose(distances, reference)
+            rows.append({'Nodes': csr.n_nodes, 'Mode': mode, 'Rounds': rounds,
+                         'Expanded': expanded, 'Relaxations': relaxations, 'Time (ms)': round(elapsed, 2)})
+
+    df = pd.DataFrame(rows)
+    print(df.to_string(index=False))
+    return df
+
+
+def benchmark_dag(sizes=(10_000, 50_000, 200_000), out_degree: int = 5):
+    """Topological sort iteratif + DAG shortest path vs rekursif lama vs Dijkstra"""
+    print("\n" + "=" * 80)
+    print("DAG BENCHMARK: one-way canal systems")
+    print("=" * 80)
+
+    rows = []
+    for n in sizes:
+        csr = make_canal_dag(n, out_degree)
+        csr.adjacency_lists()
+        algorithms = RoutingAlgorithms(csr)
+        start, goal = csr.node_ids[0], csr.node_ids[-1]
+
+        t0 = time.perf_counter()
+        is_dag = algorithms.is_dag()
+        order_ms = (time.perf_counter() - t0) * 1000
+
+        (_, distance, _), dag_ms, _ = measure(algorithms.topological_sort, start, goal)
+        (_, expected, _), dijkstra_ms, _ = measure(algorithms.dijkstra, start, goal)
+        assert is_dag and distance == expected
+
+        try:
+            t0 = time.perf_counter()
+            legacy_topological_sort(csr, csr.index[start], csr.index[goal])
+            legacy = round((time.perf_counter() - t0) * 1000, 2)
+        except RecursionError:
+            legacy = 'RecursionError'
+
+        rows.append({
+            'Nodes': n,
+            'Arcs': csr.n_arcs,
+            'Recursive (ms)': legacy,
+            'Kahn Order (ms)': round(order_ms, 2),
+            'DAG Query (ms)': round(dag_ms, 2),
+            'Dijkstra (ms)': round(dijkstra_ms, 2),
+        })
+
+    df = pd.DataFrame(rows)
+    print(df.to_string(index=False))
+    return df
+
+
+def benchmark_priority_queues(shapes=((60, 60), (120, 120), (250, 250)), queries: int = 10,
+                              seed: int = 0):
+    """Matriks backend priority queue x algoritma: pushes, pops, waktu"""
+    print("\n" + "=" * 80)
+    print("PRIORITY QUEUE BENCHMARK: binary heap vs Dial buckets vs radix heap")
+    print("=" * 80)
+
+    rng = np.random.default_rng(seed)
+    rows = []
+    for r, c in shapes:
+        csr = make_city_network(r, c, seed=seed)
+        csr.adjacency_lists()
+        algorithms = RoutingAlgorithms(csr)
+        algorithms.prepare_landmarks(8)
+        algorithms.johnson_potentials()
+        span = int(csr.weights.max())
+        pairs = [tuple(csr.node_ids[i] for i in rng.choice(csr.n_nodes, 2, replace=False))
+                 for _ in range(queries)]
+
+        cases = [
+            ('Dijkstra SSSP', lambda q, a, b: algorithms._dijkstra_tree(csr.index[a], queue=q)[2]),
+            ('Dijkstra P2P', lambda q, a, b: algorithms.dijkstra(a, b, queue=q)[2]),
+            ('A* (ALT)', lambda q, a, b: algorithms.a_star(a, b, heuristic='alt', queue=q)[2]),
+            ('Johnson', lambda q, a, b: algorithms.johnson(a, b, queue=q)[2]),
+        ]
+        for label, run in cases:
+            reference = None
+            for name in PRIORITY_QUEUES:
+                pushes = pops = 0
+                elapsed = 0.0
+                for start, goal in pairs:
+                    queue = make_queue(name, span)
+                    t0 = time.perf_counter()
+                    run(queue, start, goal)
+                    elapsed += time.perf_counter() - t0
+                    # Hitungan dari run kedua agar pembungkus tidak ikut terukur
+                    counter = CountingQueue(make_queue(name, span))
+                    run(counter, start, goal)
+                    pushes += counter.pushes
+                    pops += counter.pops
+                if reference is None:
+                    reference = elapsed
+                rows.append({
+                    'Nodes': csr.n_nodes,
+                    'Algorithm': label,
+                    'Queue': name,
+                    'Pushes': pushes // queries,
+                    'Pops': pops // queries,
+                    'Time (ms)': round(elapsed * 1000 / queries, 2),
+                    'vs Heap': round(reference / max(elapsed, 1e-9), 2),
+                })
+
+    df = pd.DataFrame(rows)
+    print(df.to_string(index=False))
+    return df
+
+
+def benchmark_dispatch(shape=(120, 120), fleets=((50, 50), (100, 100), (300, 300), (300, 30)),
+                       depots: int = 40, sample: int = 100, seed: int = 0):
+    """Dispatch armada: matriks one-to-many + Hungarian vs estimasi N x M query"""
+    print("\n" + "=" * 80)
+    print("DISPATCH BENCHMARK: boats x incidents assignment")
+    print("=" * 80)
+
+    rng = np.random.default_rng(seed)
+    csr = make_city_network(*shape, seed=seed)
+    csr.adjacency_lists()
+    algorithms = RoutingAlgorithms(csr)
+    dispatcher = FleetDispatcher(algorithms, hospitals=[csr.node_ids[i] for i in
+                                                        rng.choice(csr.n_nodes, 10, replace=False)])
+    depot_ids = [csr.node_ids[i] for i in rng.choice(csr.n_nodes, depots, replace=False)]
+
+    # Biaya rata-rata satu query Dijkstra sebagai dasar estimasi N x M
+    pairs = [tuple(csr.node_ids[i] for i in rng.choice(csr.n_nodes, 2, replace=False))
+             for _ in range(sample)]
+    t0 = time.perf_counter()
+    for start, goal in pairs:
+        algorithms.dijkstra(start, goal)
+    per_query_ms = (time.perf_counter() - t0) * 1000 / sample
+
+    rows = []
+    for n_boats, n_incidents in fleets:
+        boats = [depot_ids[i] for i in rng.integers(0, depots, n_boats)]
+        incidents = [csr.node_ids[i] for i in rng.choice(csr.n_nodes, n_incidents, replace=False)]
+
+        t0 = time.perf_counter()
+        plan = dispatcher.dispatch(boats, incidents)
+        total_ms = (time.perf_counter() - t0) * 1000
+
+        rows.append({
+            'Nodes': csr.n_nodes,
+            'Boats': n_boats,
+            'Incidents': n_incidents,
+            'Assigned': len(plan),
+            'Searches': plan.stats['searches'],
+            'Matrix (ms)': round(plan.stats['matrix_ms'], 1),
+            'Hospital Leg (ms)': round(plan.stats['hospital_ms'], 1),
+            'Hungarian (ms)': round(plan.stats['assignment_ms'], 2),
+            'Total (ms)': round(total_ms, 1),
+            'N x M Queries (est. ms)': round(per_query_ms * n_boats * n_incidents),
+        })
+
+    df = pd.DataFrame(rows)
+    print(df.to_string(index=False))
+    return df
+
+
+def benchmark_isochrones(shapes=((120, 120), (250, 250)), budgets=(15, 60, 120),
+                         depots: int = 20, hospitals: int = 5, seed: int = 0):
+    """Isochrone terbatas budget vs Dijkstra penuh, dan coverage multi-source vs pairwise"""
+    print("\n" + "=" * 80)
+    print("ISOCHRONE BENCHMARK: budget-bounded search and coverage report")
+    print("=" * 80)
+
+    rng = np.random.default_rng(seed)
+    rows = []
+    for r, c in shapes:
+        csr = make_city_network(r, c, seed=seed)
+        csr.adjacency_lists()
+        algorithms = RoutingAlgorithms(csr)
+        start = csr.node_ids[int(rng.integers(csr.n_nodes))]
+        depot_ids = [csr.node_ids[i] for i in rng.choice(csr.n_nodes, depots, replace=False)]
+        hospital_ids = [csr.node_ids[i] for i in rng.choice(csr.n_nodes, hospitals, replace=False)]
+
+        _, full_ms, _ = measure(algorithms._dijkstra_tree, csr.index[start])
+
+        t0 = time.perf_counter()
+        for depot in depot_ids:
+            for hospital in hospital_ids:
+                algorithms.dijkstra(depot, hospital)
+        pairwise_ms = (time.perf_counter() - t0) * 1000
+
+        for budget in budgets:
+            reached, bounded_ms, _ = measure(algorithms.reachable_within, start, budget)
+            _, multi_ms, _ = measure(algorithms.isochrones, start, (budget / 3, budget * 2 / 3, budget))
+            report, coverage_ms, _ = measure(algorithms.coverage_report, budget,
+                                             depot_ids, hospital_ids)
+            rows.append({
+                'Nodes': csr.n_nodes,
+                'Budget (min)': budget,
+                'Reached': len(reached),
+                'Full Dijkstra (ms)': round(full_ms, 2),
+                'Bounded (ms)': round(bounded_ms, 2),
+                '3 Isochrones (ms)': round(multi_ms, 2),
+                'Covered Pairs': int(report.iloc[:, 1].sum()),
+                'Coverage (ms)': round(coverage_ms, 2),
+                'Pairwise (ms)': round(pairwise_ms, 2),
+            })
+
+    df = pd.DataFrame(rows)
+    print(df.to_string(index=False))
+    return df
+
+
+def benchmark_hub_labels(shapes=((30, 30), (60, 60), (100, 100)), degree_limit: int = 900,
+                         queries: int = 200, depots: int = 40, hospitals: int = 10,
+                         seed: int = 0):
+    """Hub labeling: ukuran label dan latensi query vs Dijkstra"""
+    print("\n" + "=" * 80)
+    print("HUB LABELING BENCHMARK: label sizes and distance query latency")
+    print("=" * 80)
+
+    rng = np.random.default_rng(seed)
+    rows = []
+    for r, c in shapes:
+        csr = make_city_network(r, c, seed=seed)
+        csr.adjacency_lists()
+        algorithms = RoutingAlgorithms(csr)
+        pairs = [tuple(csr.node_ids[i] for i in rng.choice(csr.n_nodes, 2, replace=False))
+                 for _ in range(queries)]
+        depot_ids = [csr.node_ids[i] for i in rng.choice(csr.n_nodes, depots, replace=False)]
+        hospital_ids = [csr.node_ids[i] for i in rng.choice(csr.n_nodes, hospitals, replace=False)]
+
+        t0 = time.perf_counter()
+        expected = [algorithms.dijkstra(start, goal)[1] for start, goal in pairs]
+        dijkstra_us = (time.perf_counter() - t0) * 1e6 / queries
+
+        for order in ('degree', 'ch'):
+            if order == 'degree' and csr.n_nodes > degree_limit:
+                continue
+            labels = HubLabels.build(csr, order=order)
+            stats = labels.label_stats()
+
+            t0 = time.perf_counter()
+            got = [labels.distance(start, goal) for start, goal in pairs]
+            merge_us = (time.perf_counter() - t0) * 1e6 / queries
+            assert got == expected
+
+            t0 = time.perf_counter()
+            labels.distance_table(depot_ids, hospital_ids)
+            table_us = (time.perf_counter() - t0) * 1e6 / (depots * hospitals)
+
+            rows.append({
+                'Nodes': csr.n_nodes,
+                'Order': order,
+                'Build (s)': round(labels.stats['preprocess_seconds'], 2),
+                'Avg Label': round(stats['avg_label'], 1),
+                'P99 Label': int(stats['p99_label']),
+                'Max Label': stats['max_label'],
+                'Labels (MB)': round(stats['megabytes'], 2),
+                'Dijkstra (us)': round(dijkstra_us, 1),
+                'Label Merge (us)': round(merge_us, 2),
+                'Table (us/pair)': round(table_us, 2),
+                'Speedup': round(dijkstra_us / merge_us),
+            })
+
+    df = pd.DataFrame(rows)
+    print(df.to_string(index=False))
+    return df
+
+
+def benchmark_overlay(networks=(('corridor', 40_000), ('city', 200)),
+                      cell_sizes=(256, 4096, 32768), queries: int = 20, changes: int = 20,
+                      seed: int = 0):
+    """Multi-level overlay: waktu customization (penuh/inkremental) dan query vs Dijkstra"""
+    print("\n" + "=" * 80)
+    print("MULTI-LEVEL OVERLAY BENCHMARK: customization and query latency")
+    print("=" * 80)
+
+    rng = np.random.default_rng(seed)
+    rows = []
+    for kind, size in networks:
+        csr = make_corridor_network(size) if kind == 'corridor' else make_city_network(size, size,
+                                                                                        seed=seed)
+        algorithms = RoutingAlgorithms(csr)
+        pairs = [tuple(csr.node_ids[i] for i in rng.choice(csr.n_nodes, 2, replace=False))
+                 for _ in range(queries)]
+
+        t0 = time.perf_counter()
+        expected = [algorithms.dijkstra(start, goal)[1] for start, goal in pairs]
+        dijkstra_ms = (time.perf_counter() - t0) * 1e3 / queries
+
+        overlay = MultiLevelOverlay.build(csr, cell_sizes)
+        full = overlay.customize()
+        overlay.distance(*pairs[0])  # adjacency list query dibangun sekali di awal
+
+        t0 = time.perf_counter()
+        got = [overlay.distance(start, goal) for start, goal in pairs]
+        distance_ms = (time.perf_counter() - t0) * 1e3 / queries
+        t0 = time.perf_counter()
+        paths = [overlay.query(start, goal) for start, goal in pairs]
+        query_ms = (time.perf_counter() - t0) * 1e3 / queries
+        assert np.allclose(got, expected)
+        assert np.allclose([cost for _, cost, _ in paths], expected)
+
+        weights = overlay.weights.copy()
+        weights[rng.choice(csr.n_arcs, changes, replace=False)] *= 1.5
+        incremental = overlay.customize(weights)
+
+        levels = overlay.level_stats()
+        rows.append({
+            'Network': kind,
+            'Nodes': csr.n_nodes,
+            'Arcs': csr.n_arcs,
+            'Cells': '/'.join(str(level['cells']) for level in levels),
+            'Boundary': '/'.join(str(level['boundary_nodes']) for level in levels),
+            'Partition (s)': round(overlay.stats['partition_seconds'], 2),
+            'Full Custom. (s)': round(full['seconds'], 3),
+            f'{changes} Arcs (s)': round(incremental['seconds'], 3),
+            'Dijkstra (ms)': round(dijkstra_ms, 1),
+            'Distance (ms)': round(distance_ms, 2),
+            'Path (ms)': round(query_ms, 2),
+            'Speedup': round(dijkstra_ms / distance_ms, 1),
+        })
+
+    df = pd.DataFrame(rows)
+    print(df.to_string(index=False))
+    return df
+
+
+def benchmark_service(executors=('thread', 'process'), requests: int = 5000,
+                      concurrency: int = 64, workers: int = 2, seed: int = 0):
+    """Routing service: throughput dan latency HTTP di localhost (jaringan Jakarta)"""
+    print("\n" + "=" * 80)
+    print("ROUTING SERVICE BENCHMARK: localhost HTTP throughput and tail latency")
+    print("=" * 80)
+
+    network = JakartaWaterwaysNetwork()
+    nodes = list(network.G.nodes)
+    rng = np.random.default_rng(seed)
+    algorithms = ('dijkstra', 'a_star', 'bidirectional_dijkstra')
+    random_pairs = [(nodes[a], nodes[b], algorithms[k]) for a, b, k in
+                    rng.integers(0, [len(nodes), len(nodes), len(algorithms)], size=(requests, 3))]
+    workloads = {
+        # Cache dimatikan: setiap request yang tidak bertabrakan dihitung worker
+        'random pairs': (random_pairs, 0),
+        # Burst dari banyak konsol untuk insiden yang sama
+        'same incident': ([('D1', 'H1', 'bellman_ford')] * requests, 0),
+        'random + cache': (random_pairs, 4096),
+    }
+
+    async def run(executor, queries, cache_size):
+        service = RoutingService(network, workers=workers, executor=executor,
+                                 cache_size=cache_size)
+        await service.start('127.0.0.1', 0)
+        try:
+            result = await load_test('127.0.0.1', service.port, queries, concurrency)
+        finally:
+            await service.stop()
+        return result, service.counters
+
+    rows = []
+    for executor in executors:
+        for name, (queries, cache_size) in workloads.items():
+            result, counters = asyncio.run(run(executor, queries, cache_size))
+            rows.append({
+                'Executor': executor,
+                'Workload': name,
+                'Requests': result['requests'],
+                'Computed': counters['computations'],
+                'Coalesced': counters['coalesced'],
+                'Cache Hits': counters['cache_hits'],
+                'Req/s': round(result['throughput']),
+                'p50 (ms)': round(result['p50_ms'], 2),
+                'p99 (ms)': round(result['p99_ms'], 2),
+                'Max (ms)': round(result['max_ms'], 2),
+            })
+
+    df = pd.DataFrame(rows)
+    print(df.to_string(index=False))
+    return df
+
+
+def benchmark_sweep(shape=(120, 120), sample: int = 200, workers=None,
+                    algorithms=('bfs', 'dijkstra', 'a_star', 'bidirectional_dijkstra',
+                                'bidirectional_a_star', 'johnson'),
+                    seed: int = 0):
+    """Scenario sweep: scaling ProcessPoolExecutor + graf di shared memory"""
+    print("\n" + "=" * 80)
+    print("SCENARIO SWEEP BENCHMARK: process pool scaling with shared-memory graph")
+    print("=" * 80)
+
+    if workers is None:
+        cores = os.cpu_count() or 1
+        workers = sorted({2 ** i for i in range(cores.bit_length()) if 2 ** i <= cores} | {cores})
+    csr = make_city_network(*shape, seed=seed)
+    rows = []
+    baseline = None
+    for count in workers:
+        df = run_sweep(csr, sample=sample, algorithms=algorithms, workers=count, seed=seed)
+        stats = df.attrs['stats']
+        baseline = baseline or stats['seconds']
+        rows.append({
+            'Nodes': stats['nodes'],
+            'Pairs': stats['pairs'],
+            'Workers': count,
+            'Tasks': stats['tasks'],
+            'Seconds': round(stats['seconds'], 2),
+            'Pairs/s': round(stats['pairs_per_second'], 1),
+            'Speedup': round(baseline / stats['seconds'], 2),
+            'Efficiency (%)': round(baseline / stats['seconds'] / count * 100),
+        })
+
+    print(f"CPU cores available: {os.cpu_count()}")
+    print(pd.DataFrame(rows).to_string(index=False))
+    print("\nPer-algorithm distributions (last run):")
+    summary = summarize_sweep(df)
+    print(summary.to_string(index=False))
+    return summary
+
+
+def _to_networkx(csr: CSRGraph) -> nx.Graph:
+    """Graf networkx setara (atribut node/edge seperti JakartaWaterwaysNetwork)"""
+    G = nx.Graph()
+    for u, node in enumerate(csr.node_ids):
+        G.add_node(node, type=csr.node_type(u), lat=csr.lat[u], lon=csr.lon[u])
+    tails = csr.tails
+    for e in csr.edge_arcs():
+        G.add_edge(csr.node_ids[tails[e]], csr.node_ids[csr.indices[e]],
+                   distance=csr.distances[e], time=csr.times[e], weight=csr.weights[e])
+    return G
+
+
+def benchmark_graph_file(shapes=((100, 100), (300, 300), (600, 600)), seed: int = 0):
+    """File graf biner memmap vs membangun graf networkx + kompilasi CSR saat startup"""
+    print("\n" + "=" * 80)
+    print("GRAPH FILE BENCHMARK: memory-mapped open vs networkx startup")
+    print("=" * 80)
+
+    rows = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for r, c in shapes:
+            csr = make_city_network(r, c, seed=seed)
+            path = os.path.join(tmp, f'city_{r}x{c}.wgraph')
+            t0 = time.perf_counter()
+            write_graph(csr, path)
+            write_s = time.perf_counter() - t0
+
+            _, startup_ms, startup_kb = measure(
+                lambda: CSRGraph.from_networkx(_to_networkx(csr)))
+            opened, open_ms, open_kb = measure(open_graph, path, repeat=5)
+            start, goal = csr.node_ids[0], csr.node_ids[-1]
+            _, query_ms, _ = measure(RoutingAlgorithms(opened).dijkstra, start, goal)
+            assert RoutingAlgorithms(opened).dijkstra(start, goal) == \
+                RoutingAlgorithms(csr).dijkstra(start, goal)
+
+            rows.append({
+                'Nodes': csr.n_nodes,
+                'Arcs': csr.n_arcs,
+                'File (MB)': round(os.path.getsize(path) / 2 ** 20, 1),
+                'Write (s)': round(write_s, 2),
+                'networkx+CSR (ms)': round(startup_ms, 1),
+                'networkx Peak (MB)': round(startup_kb / 1024, 1),
+                'open_graph (ms)': round(open_ms, 3),
+                'open Peak (KB)': round(open_kb, 1),
+                'Startup Speedup': round(startup_ms / open_ms),
+                'First Dijkstra (ms)': round(query_ms, 1),
+            })
+            del opened
+
+    df = pd.DataFrame(rows)
+    print(df.to_string(index=False))
+    return df
+
+
+def _write_network_csv(csr: CSRGraph, nodes_path: str, edges_path: str):
+    """Tulis CSRGraph dalam format csv/waterways_nodes.csv + csv/waterways_edges.csv"""
+    ids = np.asarray(csr.node_ids, dtype=object)
+    types = np.asarray(csr.type_labels or ('junction',), dtype=object)[csr.type_codes]
+    pd.DataFrame({'Id': ids, 'Label': ids, 'Type': types, 'Latitude': csr.lat,
+                  'Longitude': csr.lon}).to_csv(nodes_path, index=False)
+    arcs = csr.edge_arcs()
+    pd.DataFrame({'Source': ids[csr.tails[arcs]], 'Target': ids[csr.indices[arcs]],
+                  'Type': 'Undirected', 'Distance': csr.distances[arcs],
+                  'Time': csr.times[arcs], 'Weight': csr.weights[arcs]}).to_csv(edges_path,
+                                                                              index=False)
+
+
+def legacy_csv_network(nodes_path: str, edges_path: str) -> CSRGraph:
+    """Versi per-baris: csv.DictReader + add_node/add_edge lalu kompilasi CSR"""
+    G = VersionedGraph()
+    with open(nodes_path, newline='') as f:
+        for row in csv.DictReader(f):
+            G.add_node(row['Id'], name=row['Label'], type=row['Type'],
+                       lat=float(row['Latitude']), lon=float(row['Longitude']))
+    with open(edges_path, newline='') as f:
+        for row in csv.DictReader(f):
+            G.add_edge(row['Source'], row['Target'], distance=float(row['Distance']),
+                       time=float(row['Time']), weight=float(row['Weight']))
+    return CSRGraph.from_networkx(G)
+
+
+def benchmark_bulk_load(shapes=((100, 100), (300, 300), (1000, 1000)),
+                        legacy_limit: int = 100_000, seed: int = 0):
+    """Bulk loader CSV (chunk + kolom bertipe + validasi vectorized) vs per-baris"""
+    print("\n" + "=" * 80)
+    print("BULK LOADER BENCHMARK: waterways CSV -> CSRGraph")
+    print("=" * 80)
+
+    rows = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for r, c in shapes:
+            csr = make_city_network(r, c, seed=seed)
+            nodes_path = os.path.join(tmp, 'nodes.csv')
+            edges_path = os.path.join(tmp, 'edges.csv')
+            _write_network_csv(csr, nodes_path, edges_path)
+
+            t0 = time.perf_counter()
+            tables = NetworkTables.from_csv(nodes_path, edges_path)
+            load_s = time.perf_counter() - t0
+            t0 = time.perf_counter()
+            loaded = tables.to_csr()
+            csr_s = time.perf_counter() - t0
+            assert np.array_equal(np.sort(loaded.weights), np.sort(csr.weights))
+
+            legacy_s = np.nan
+            if csr.n_nodes <= legacy_limit:
+                t0 = time.perf_counter()
+                legacy_csv_network(nodes_path, edges_path)
+                legacy_s = time.perf_counter() - t0
+
+            rows.append({
+                'Nodes': tables.n_nodes,
+                'Edges': tables.n_edges,
+                'CSV (MB)': round((os.path.getsize(nodes_path)
+                                   + os.path.getsize(edges_path)) / 2 ** 20, 1),
+                'Bulk Load (s)': round(load_s, 2),
+                'To CSR (s)': round(csr_s, 2),
+                'Edges/s': round(tables.n_edges / (load_s + csr_s)),
+                'Per-row + networkx (s)': round(legacy_s, 2),
+                'Speedup': round(legacy_s / (load_s + csr_s), 1),
+                'Columns (MB)': round(tables.nbytes / 2 ** 20, 1),
+            })
+
+    df = pd.DataFrame(rows)
+    print(df.to_string(index=False))
+    return df
+
+
+def benchmark_generator(sizes=(10 ** 2, 10 ** 3, 10 ** 4, 10 ** 5, 10 ** 6), queries: int = 5,
+                        seed: int = 0):
+    """Generator waterways sintetis: waktu/memori generate dan Dijkstra per ukuran jaringan"""
+    print("\n" + "=" * 80)
+    print("SYNTHETIC WATERWAYS BENCHMARK: generator throughput and routing at scale")
+    print("=" * 80)
+
+    rng = np.random.default_rng(seed)
+    rows = []
+    for n in sizes:
+        tracemalloc.start()
+        t0 = time.perf_counter()
+        tables = generate_waterways(n, seed=seed)
+        generate_s = time.perf_counter() - t0
+        peak_mb = tracemalloc.get_traced_memory()[1] / 2 ** 20
+        tracemalloc.stop()
+
+        t0 = time.perf_counter()
+        csr = tables.to_csr()
+        csr_s = time.perf_counter() - t0
+
+        algorithms = RoutingAlgorithms(csr)
+        dermaga = np.flatnonzero(tables.type_codes == 1)
+        hospitals = np.flatnonzero(tables.type_codes == 2)
+        t0 = time.perf_counter()
+        for _ in range(queries):
+            path, minutes, _ = algorithms.dijkstra(csr.node_ids[int(rng.choice(dermaga))],
+                                                   csr.node_ids[int(rng.choice(hospitals))])
+            assert path and np.isfinite(minutes)
+        dijkstra_ms = (time.perf_counter() - t0) * 1e3 / queries
+
+        speed = tables.distances / tables.times * 60 / 1000
+        rows.append({
+            'Nodes': tables.n_nodes,
+            'Edges': tables.n_edges,
+            'Dermaga': len(dermaga),
+            'Hospitals': len(hospitals),
+            'Generate (s)': round(generate_s, 3),
+            'Nodes/s': round(n / generate_s),
+            'Peak (MB)': round(peak_mb, 1),
+            'To CSR (s)': round(csr_s, 3),
+            'Dijkstra D->H (ms)': round(dijkstra_ms, 1),
+            'Mean km/h': round(float(speed.mean()), 1),
+            'Dist/Time Corr': round(float(np.corrcoef(tables.distances, tables.times)[0, 1]), 2),
+        })
+
+    df = pd.DataFrame(rows)
+    print(df.to_string(index=False))
+    return df
+
+BENCHMARKS = {
+    'traversal': benchmark_traversal,
+    'floyd': benchmark_floyd_warshall,
+    'astar': benchmark_a_star,
+    'bidirectional': benchmark_bidirectional,
+    'ch': benchmark_contraction_hierarchies,
+    'multisource': benchmark_multi_source,
+    'batch': benchmark_batch,
+    'dynamic': benchmark_dynamic_updates,
+    'timedependent': benchmark_time_dependent,
+    'kshortest': benchmark_k_shortest,
+    'bellman': benchmark_bellman_ford,
+    'dag': benchmark_dag,
+    'queues': benchmark_priority_queues,
+    'dispatch': benchmark_dispatch,
+    'isochrone': benchmark_isochrones,
+    'hublabels': benchmark_hub_labels,
+    'overlay': benchmark_overlay,
+    'service': benchmark_service,
+    'sweep': benchmark_sweep,
+    'graphfile': benchmark_graph_file,
+    'bulkload': benchmark_bulk_load,
+    'generator': benchmark_generator,
+}
+
+
+def main():
+    names = sys.argv[1:] or list(BENCHMARKS)
+    for name in names:
+        BENCHMARKS[name]()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,284 @@
+"""
+Bulk Loader - Jakarta Waterways
+===============================
+Memuat tabel node dan edge jaringan waterways (format csv/waterways_nodes.csv
+dan csv/waterways_edges.csv) secara vectorized. CSV dibaca per chunk dengan
+kolom bertipe (float64 untuk angka, category untuk tipe), id node di edge
+dipetakan ke integer dengan satu lookup hash per chunk, dan validasi skema
+dijalankan sebagai operasi mask NumPy. Hasilnya NetworkTables: kolom NumPy yang
+langsung dikompilasi ke CSRGraph atau dipakai JakartaWaterwaysNetwork.
+
+Memori puncak dibatasi: kolom numerik dialokasikan sekali sesuai jumlah baris
+file, dan string hanya hidup selama satu chunk.
+
+Contoh:
+    tables = NetworkTables.from_csv('csv/waterways_nodes.csv', 'csv/waterways_edges.csv')
+    network = JakartaWaterwaysNetwork(tables)
+    csr = network.to_csr()          # tanpa membangun graf networkx
+"""
+
+from typing import Iterable, List
+
+import numpy as np
+import pandas as pd
+
+from water_ambulance_routing import CSRGraph, NodeIdTable, _index_dtype
+
+NODE_DTYPES = {'Id': str, 'Label': str, 'Type': 'category',
+               'Latitude': np.float64, 'Longitude': np.float64}
+EDGE_DTYPES = {'Source': str, 'Target': str, 'Type': 'category',
+               'Distance': np.float64, 'Time': np.float64, 'Weight': np.float64}
+
+NODE_REQUIRED = ('Id', 'Type', 'Latitude', 'Longitude')
+EDGE_REQUIRED = ('Source', 'Target', 'Distance', 'Time')
+
+DEFAULT_CHUNKSIZE = 1_000_000
+
+
+class SchemaError(ValueError):
+    """Tabel tidak sesuai skema; pesan berisi kolom, jumlah dan contoh baris"""
+
+# ============================================================================
+# VALIDATION HELPERS
+# ============================================================================
+
+def _check(mask: np.ndarray, source: str, column: str, problem: str, first_row: int):
+    """Raise SchemaError bila ada baris yang melanggar (mask True)"""
+    mask = np.asarray(mask)
+    if mask.any():
+        # +2: nomor baris file 1-based setelah header
+        lines = (np.flatnonzero(mask)[:5] + first_row + 2).tolist()
+        raise SchemaError(f"{source}: {int(mask.sum())} rows with {problem} in column "
+                          f"'{column}' (lines {lines})")
+
+
+def _require_columns(source: str, columns: Iterable[str], required: Iterable[str]):
+    missing = [name for name in required if name not in columns]
+    if missing:
+        raise SchemaError(f"{source}: missing columns {missing}")
+
+
+def _count_rows(path: str, block: int = 1 << 24) -> int:
+    """Jumlah baris data (tanpa header) dengan menghitung newline per blok"""
+    rows, last = 0, b'\n'
+    with open(path, 'rb') as f:
+        while True:
+            data = f.read(block)
+            if not data:
+                break
+            rows += data.count(b'\n')
+            last = data[-1:]
+    return max(rows + (last != b'\n') - 1, 0)
+
+
+class _Column:
+    """Array numerik yang diisi per chunk; tumbuh bila estimasi baris kurang"""
+
+    def __init__(self, capacity: int, dtype):
+        self.data = np.empty(capacity, dtype=dtype)
+        self.size = 0
+
+    def extend(self, values: np.ndarray):
+        end = self.size + len(values)
+        if end > len(self.data):
+            self.data = np.resize(self.data, max(end, 2 * len(self.data)))
+        self.data[self.size:end] = values
+        self.size = end
+
+    def finish(self) -> np.ndarray:
+        return self.data[:self.size] if self.size < len(self.data) else self.data
+
+
+def _category_codes(values: pd.Series, labels: List[str]) -> np.ndarray:
+    """Kode integer dari kolom category terhadap daftar label global (urutan kemunculan)"""
+    for label in values.dropna().unique():
+        if label not in labels:
+            labels.append(label)
+    lookup = np.asarray([labels.index(c) for c in values.cat.categories], dtype=np.int64)
+    codes = values.cat.codes.to_numpy()
+    return np.where(codes >= 0, lookup[codes] if len(lookup) else -1, -1)
+
+# ============================================================================
+# NETWORK TABLES
+# ============================================================================
+
+class NetworkTables:
+    """
+    Kolom node (id, name, type, lat, lon) dan edge (source, target sebagai
+    integer id node, distance, time, weight) jaringan waterways. Setiap edge
+    undirected disimpan sekali.
+
+    node_ids boleh berupa NodeIdTable (tanpa objek str per node) dan names
+    boleh None (nama = id), mis. untuk jaringan sintetis berukuran besar.
+    """
+
+    def __init__(self, node_ids, names, type_codes, type_labels, lat, lon,
+                 sources, targets, distances, times, weights):
+        self.node_ids = node_ids if isinstance(node_ids, NodeIdTable) else list(node_ids)
+        self.names = None if names is None else np.asarray(names, dtype=object)
+        self.type_codes = np.asarray(type_codes, dtype=np.int8)
+        self.type_labels = tuple(type_labels)
+        self.lat = np.asarray(lat, dtype=np.float64)
+        self.lon = np.asarray(lon, dtype=np.float64)
+        self.sources = np.asarray(sources)
+        self.targets = np.asarray(targets)
+        self.distances = np.asarray(distances, dtype=np.float64)
+        self.times = np.asarray(times, dtype=np.float64)
+        self.weights = np.asarray(weights, dtype=np.float64)
+
+    @classmethod
+    def from_csv(cls, nodes_path: str, edges_path: str,
+                 chunksize: int = DEFAULT_CHUNKSIZE) -> 'NetworkTables':
+        """Baca CSV node dan edge per chunk (kolom tambahan seperti Color diabaikan)"""
+        node_columns = pd.read_csv(nodes_path, nrows=0).columns
+        _require_columns(nodes_path, node_columns, NODE_REQUIRED)
+        usecols = [name for name in NODE_DTYPES if name in node_columns]
+        node_chunks = pd.read_csv(nodes_path, usecols=usecols, chunksize=chunksize,
+                                  dtype={name: NODE_DTYPES[name] for name in usecols})
+
+        edge_columns = pd.read_csv(edges_path, nrows=0).columns
+        _require_columns(edges_path, edge_columns, EDGE_REQUIRED)
+        usecols = [name for name in EDGE_DTYPES if name in edge_columns]
+        edge_chunks = pd.read_csv(edges_path, usecols=usecols, chunksize=chunksize,
+                                  dtype={name: EDGE_DTYPES[name] for name in usecols})
+
+        return cls._build(node_chunks, edge_chunks, nodes_path, edges_path,
+                          _count_rows(nodes_path), _count_rows(edges_path))
+
+    @classmethod
+    def from_frames(cls, nodes: pd.DataFrame, edges: pd.DataFrame) -> 'NetworkTables':
+        """Tabel dari DataFrame in-memory dengan kolom yang sama seperti CSV"""
+        _require_columns('nodes', nodes.columns, NODE_REQUIRED)
+        _require_columns('edges', edges.columns, EDGE_REQUIRED)
+        frames = []
+        for source, frame, dtypes in (('nodes', nodes, NODE_DTYPES), ('edges', edges, EDGE_DTYPES)):
+            # Kolom string dibiarkan apa adanya agar nilai kosong tetap NaN
+            try:
+                frames.append(frame.astype({name: dtype for name, dtype in dtypes.items()
+                                            if name in frame.columns and dtype is not str}))
+            except (ValueError, TypeError) as exc:
+                raise SchemaError(f"{source}: {exc}") from exc
+        nodes, edges = frames
+        return cls._build([nodes], [edges], 'nodes', 'edges', len(nodes), len(edges))
+
+    @classmethod
+    def _build(cls, node_chunks, edge_chunks, nodes_source: str, edges_source: str,
+               n_hint: int, m_hint: int) -> 'NetworkTables':
+        ids, names, type_labels = [], [], []
+        type_codes = _Column(n_hint, np.int8)
+        lat, lon = _Column(n_hint, np.float64), _Column(n_hint, np.float64)
+
+        try:
+            for chunk in node_chunks:
+                first = type_codes.size
+                _check(chunk['Id'].isna(), nodes_source, 'Id', 'missing values', first)
+                _check(chunk['Type'].isna(), nodes_source, 'Type', 'missing values', first)
+                la, lo = chunk['Latitude'].to_numpy(), chunk['Longitude'].to_numpy()
+                _check(~(np.abs(la) <= 90), nodes_source, 'Latitude',
+                       'missing or out-of-range values', first)
+                _check(~(np.abs(lo) <= 180), nodes_source, 'Longitude',
+                       'missing or out-of-range values', first)
+                ids.append(chunk['Id'].to_numpy())
+                names.append(chunk['Label'].to_numpy() if 'Label' in chunk else chunk['Id'].to_numpy())
+                type_codes.extend(_category_codes(chunk['Type'], type_labels))
+                lat.extend(la)
+                lon.extend(lo)
+        except ValueError as exc:
+            if isinstance(exc, SchemaError):
+                raise
+            raise SchemaError(f"{nodes_source}: {exc}") from exc
+
+        node_ids = np.concatenate(ids) if ids else np.empty(0, dtype=object)
+        index = pd.Index(node_ids)
+        duplicated = index.duplicated()
+        _check(duplicated, nodes_source, 'Id', 'duplicate node ids', 0)
+        n = len(node_ids)
+
+        id_dtype = _index_dtype(n)
+        sources, targets = _Column(m_hint, id_dtype), _Column(m_hint, id_dtype)
+        distances, times = _Column(m_hint, np.float64), _Column(m_hint, np.float64)
+        weights = _Column(m_hint, np.float64)
+        try:
+            for chunk in edge_chunks:
+                first = sources.size
+                # Satu lookup hash tabel id node untuk seluruh kolom chunk
+                ends = []
+                for column in ('Source', 'Target'):
+                    end = index.get_indexer(chunk[column].to_numpy())
+                    _check(end < 0, edges_source, column, 'missing or unknown node ids', first)
+                    ends.append(end)
+                _check(ends[0] == ends[1], edges_source, 'Target', 'self-loops', first)
+                if 'Type' in chunk:
+                    # Cek per kategori, bukan per baris string
+                    kinds = chunk['Type'].cat
+                    directed = np.asarray([str(c).lower() != 'undirected'
+                                           for c in kinds.categories] + [False])
+                    _check(directed[kinds.codes.to_numpy()], edges_source, 'Type',
+                           "values other than 'Undirected'", first)
+
+                columns = {'Distance': chunk['Distance'].to_numpy(),
+                           'Time': chunk['Time'].to_numpy()}
+                columns['Weight'] = (chunk['Weight'].to_numpy() if 'Weight' in chunk
+                                     else columns['Time'])
+                for column, values in columns.items():
+                    _check(~(values >= 0) | ~np.isfinite(values), edges_source, column,
+                           'missing, negative or infinite values', first)
+
+                sources.extend(ends[0])
+                targets.extend(ends[1])
+                distances.extend(columns['Distance'])
+                times.extend(columns['Time'])
+                weights.extend(columns['Weight'])
+        except ValueError as exc:
+            if isinstance(exc, SchemaError):
+                raise
+            raise SchemaError(f"{edges_source}: {exc}") from exc
+
+        sources, targets = sources.finish(), targets.finish()
+        if len(sources):
+            # Edge undirected duplikat (u, v) / (v, u): key min * n + max
+            keys = (np.minimum(sources, targets).astype(np.int64) * n
+                    + np.maximum(sources, targets))
+            order = np.argsort(keys, kind='stable')
+            repeated = np.zeros(len(keys), dtype=bool)
+            repeated[order[1:]] = keys[order[1:]] == keys[order[:-1]]
+            _check(repeated, edges_source, 'Source/Target', 'duplicate edges', 0)
+
+        return cls(node_ids.tolist(), np.concatenate(names) if names else [],
+                   type_codes.finish(), type_labels, lat.finish(), lon.finish(),
+                   sources, targets, distances.finish(), times.finish(), weights.finish())
+
+    @property
+    def n_nodes(self) -> int:
+        return len(self.node_ids)
+
+    @property
+    def n_edges(self) -> int:
+        return len(self.sources)
+
+    @property
+    def nbytes(self) -> int:
+        """Ukuran kolom NumPy (tanpa string id/nama)"""
+        return sum(arr.nbytes for arr in (self.type_codes, self.lat, self.lon, self.sources,
+                                          self.targets, self.distances, self.times,
+                                          self.weights))
+
+    def to_csr(self) -> CSRGraph:
+        """
+        Kompilasi langsung ke CSRGraph. Setiap edge dicerminkan jadi dua arc
+        yang berselang-seling (u->v, v->u per edge), sehingga setelah stable
+        sort urutan tetangga sama dengan urutan insersi networkx dan
+        algoritma yang sensitif urutan (DFS/BFS) memberi hasil identik.
+        """
+        def interleave(a, b):
+            return np.column_stack([a, b]).ravel()
+
+        return CSRGraph.from_arcs(
+            self.node_ids, interleave(self.sources, self.targets),
+            interleave(self.targets, self.sources), np.repeat(self.weights, 2),
+            np.repeat(self.times, 2), np.repeat(self.distances, 2),
+            lat=self.lat, lon=self.lon, type_codes=self.type_codes,
+            type_labels=self.type_labels)
+
+    def __repr__(self):
+        return f"NetworkTables({self.n_nodes} nodes, {self.n_edges} edges)"
@@ -0,0 +1,322 @@
+"""
+Contraction Hierarchies - Jakarta Waterways
+===========================================
+Preprocessing Contraction Hierarchies (CH) di atas bobot edge jaringan
+waterways. Node dikontraksi satu per satu (urutan berdasarkan edge difference),
+shortcut ditambahkan hanya bila witness search tidak menemukan jalur
+alternatif, lalu query menjalankan pencarian bidirectional yang hanya naik
+ke node dengan rank lebih tinggi. Hasil query di-unpack kembali menjadi path
+node lengkap seperti RoutingAlgorithms.dijkstra.
+"""
+
+import heapq
+import time
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+from water_ambulance_routing import CSRGraph
+
+CH_FORMAT_VERSION = 1
+
+# ============================================================================
+# CONTRACTION (PREPROCESSING)
+# ============================================================================
+
+def _witness_search(out_adj: List[Dict], source: int, excluded: int,
+                    max_dist: float, settle_limit: int) -> Dict[int, float]:
+    """
+    Dijkstra lokal dari source tanpa melewati node excluded. Berhenti bila
+    jarak melebihi max_dist atau settle_limit node sudah diproses; jarak
+    tentatif yang ditemukan tetap merupakan panjang jalur nyata.
+    """
+    dist = {source: 0}
+    heap = [(0, source)]
+    settled = 0
+
+    while heap:
+        d, u = heapq.heappop(heap)
+        if d > dist[u]:
+            continue
+        if d > max_dist or settled >= settle_limit:
+            break
+        settled += 1
+
+        for v, (weight, _) in out_adj[u].items():
+            if v == excluded:
+                continue
+            nd = d + weight
+            if nd < dist.get(v, float('inf')):
+                dist[v] = nd
+                heapq.heappush(heap, (nd, v))
+
+    return dist
+
+
+def _required_shortcuts(out_adj: List[Dict], in_adj: List[Dict], v: int,
+                        settle_limit: int) -> List[Tuple[int, int, float]]:
+    """Shortcut (u, w, bobot) yang dibutuhkan bila node v dikontraksi"""
+    shortcuts = []
+    outgoing = out_adj[v]
+    if not outgoing:
+        return shortcuts
+
+    for u, (w_in, _) in in_adj[v].items():
+        max_dist = w_in + max(weight for weight, _ in outgoing.values())
+        witness = _witness_search(out_adj, u, v, max_dist, settle_limit)
+
+        for w, (w_out, _) in outgoing.items():
+            if w == u:
+                continue
+            candidate = w_in + w_out
+            if witness.get(w, float('inf')) > candidate:
+                shortcuts.append((u, w, candidate))
+
+    return shortcuts
+
+# ============================================================================
+# CONTRACTION HIERARCHY
+# ============================================================================
+
+class ContractionHierarchy:
+    """
+    Hasil preprocessing CH dalam format CSR. Graf "up" menyimpan arc u -> w
+    dengan rank[w] > rank[u]; graf "down" menyimpan arc asli w -> u (rank[w] >
+    rank[u]) dalam arah terbalik untuk pencarian mundur dari goal. middle
+    berisi node yang dilewati shortcut (-1 untuk edge asli).
+    """
+
+    def __init__(self, node_ids, rank, up_indptr, up_indices, up_weights, up_middle,
+                 down_indptr, down_indices, down_weights, down_middle, stats: Dict = None):
+        self.node_ids = list(node_ids)
+        self.index = {node: i for i, node in enumerate(self.node_ids)}
+        self.rank = np.asarray(rank, dtype=np.int64)
+        self.up = (np.asarray(up_indptr, dtype=np.int64), np.asarray(up_indices),
+                   np.asarray(up_weights, dtype=np.float64), np.asarray(up_middle))
+        self.down = (np.asarray(down_indptr, dtype=np.int64), np.asarray(down_indices),
+                     np.asarray(down_weights, dtype=np.float64), np.asarray(down_middle))
+        self.stats = dict(stats or {})
+        self._lists = (tuple(arr.tolist() for arr in self.up),
+                       tuple(arr.tolist() for arr in self.down))
+
+    @classmethod
+    def build(cls, graph, settle_limit: int = 60) -> 'ContractionHierarchy':
+        """
+        Preprocessing CH dari graf networkx (mis. JakartaWaterwaysNetwork.G)
+        atau CSRGraph. settle_limit membatasi witness search; batas yang
+        lebih kecil mempercepat preprocessing dengan risiko shortcut ekstra.
+        """
+        csr = graph if isinstance(graph, CSRGraph) else CSRGraph.from_networkx(graph)
+        n = csr.n_nodes
+        t0 = time.perf_counter()
+
+        out_adj = [dict() for _ in range(n)]
+        in_adj = [dict() for _ in range(n)]
+        for u, v, weight in zip(csr.tails.tolist(), csr.indices.tolist(), csr.weights.tolist()):
+            if u != v and weight < out_adj[u].get(v, (float('inf'), -1))[0]:
+                out_adj[u][v] = (weight, -1)
+                in_adj[v][u] = (weight, -1)
+
+        contracted_neighbors = [0] * n
+        level = [0] * n
+
+        def priority(v):
+            shortcuts = _required_shortcuts(out_adj, in_adj, v, settle_limit)
+            edge_difference = len(shortcuts) - len(out_adj[v]) - len(in_adj[v])
+            return edge_difference + contracted_neighbors[v] + level[v], shortcuts
+
+        heap = [(priority(v)[0], v) for v in range(n)]
+        heapq.heapify(heap)
+
+        rank = np.empty(n, dtype=np.int64)
+        up_arcs, down_arcs = [], []
+        shortcut_count = 0
+        order = 0
+
+        while heap:
+            _, v = heapq.heappop(heap)
+
+            # Lazy update: prioritas dihitung ulang sebelum kontraksi
+            current, shortcuts = priority(v)
+            if heap and current > heap[0][0]:
+                heapq.heappush(heap, (current, v))
+                continue
+
+            rank[v] = order
+            order += 1
+
+            for w, (weight, middle) in out_adj[v].items():
+                up_arcs.append((v, w, weight, middle))
+                del in_adj[w][v]
+            for u, (weight, middle) in in_adj[v].items():
+                down_arcs.append((v, u, weight, middle))
+                del out_adj[u][v]
+
+            for neighbor in set(out_adj[v]) | set(in_adj[v]):
+                contracted_neighbors[neighbor] += 1
+                level[neighbor] = max(level[neighbor], level[v] + 1)
+            out_adj[v] = {}
+            in_adj[v] = {}
+
+            for u, w, weight in shortcuts:
+                if weight < out_adj[u].get(w, (float('inf'), -1))[0]:
+                    if w not in out_adj[u]:
+                        shortcut_count += 1
+                    out_adj[u][w] = (weight, v)
+                    in_adj[w][u] = (weight, v)
+
+        stats = {
+            'nodes': n,
+            'original_arcs': csr.n_arcs,
+            'shortcuts': shortcut_count,
+            'preprocess_seconds': time.perf_counter() - t0,
+        }
+        return cls(csr.node_ids, rank, *cls._pack(n, up_arcs), *cls._pack(n, down_arcs), stats)
+
+    @staticmethod
+    def _pack(n: int, arcs: List[Tuple]) -> Tuple[np.ndarray, ...]:
+        """List arc (tail, head, weight, middle) -> array CSR"""
+        if not arcs:
+            return (np.zeros(n + 1, dtype=np.int64), np.empty(0, dtype=np.int64),
+                    np.empty(0), np.empty(0, dtype=np.int64))
+        tails, heads, weights, middles = (np.asarray(col) for col in zip(*arcs))
+        order = np.argsort(tails, kind='stable')
+        indptr = np.zeros(n + 1, dtype=np.int64)
+        np.cumsum(np.bincount(tails, minlength=n), out=indptr[1:])
+        return indptr, heads[order], weights[order].astype(np.float64), middles[order]
+
+    @property
+    def n_shortcuts(self) -> int:
+        return int(np.count_nonzero(self.up[3] >= 0) + np.count_nonzero(self.down[3] >= 0))
+
+    def _search(self, s: int, g: int):
+        """
+        Pencarian bidirectional pada graf up (maju) dan down (mundur) dengan
+        stall-on-demand. Setiap arah berhenti begitu key minimumnya >= jarak
+        terbaik yang diketahui.
+        """
+        adjacency = self._lists
+        dist = ({s: 0}, {g: 0})
+        parent = ({s: (-1, -1)}, {g: (-1, -1)})
+        heaps = ([(0, s)], [(0, g)])
+        best, meet = (0, s) if s == g else (float('inf'), -1)
+        iterations = 0
+
+        while heaps[0] or heaps[1]:
+            side = 0 if heaps[0] and (not heaps[1] or heaps[0][0][0] <= heaps[1][0][0]) else 1
+            d, u = heapq.heappop(heaps[side])
+            if d >= best:
+                heaps[side].clear()
+                continue
+            if d > dist[side][u]:
+                continue
+            iterations += 1
+
+            other = dist[1 - side].get(u)
+            if other is not None and d + other < best:
+                best, meet = d + other, u
+
+            # Stall-on-demand: u dapat dicapai lebih murah lewat node dengan
+            # rank lebih tinggi, jadi jaraknya bukan jarak terpendek
+            indptr, indices, weights, _ = adjacency[1 - side]
+            own = dist[side]
+            if any(own.get(indices[e], float('inf')) + weights[e] < d
+                   for e in range(indptr[u], indptr[u + 1])):
+                continue
+
+            indptr, indices, weights, middles = adjacency[side]
+            for e in range(indptr[u], indptr[u + 1]):
+                v = indices[e]
+                nd = d + weights[e]
+                if nd < own.get(v, float('inf')):
+                    own[v] = nd
+                    parent[side][v] = (u, middles[e])
+                    heapq.heappush(heaps[side], (nd, v))
+
+        return best, meet, parent, iterations
+
+    def _middle(self, a: int, b: int) -> int:
+        """Node tengah arc asli a -> b (-1 bila edge asli)"""
+        if self.rank[a] < self.rank[b]:
+            indptr, indices, _, middles = self._lists[0]
+            lo, hi, source, target = indptr[a], indptr[a + 1], a, b
+        else:
+            indptr, indices, _, middles = self._lists[1]
+            lo, hi, source, target = indptr[b], indptr[b + 1], b, a
+        for e in range(lo, hi):
+            if indices[e] == target:
+                return middles[e]
+        raise KeyError((self.node_ids[source], self.node_ids[target]))
+
+    def _unpack(self, a: int, b: int, middle: int, path: List[int]):
+        """Tambahkan node setelah a hingga b ke path, mengurai shortcut secara iteratif"""
+        stack = [(a, b, middle)]
+        while stack:
+            x, y, m = stack.pop()
+            if m == -1:
+                path.append(y)
+            else:
+                stack.append((m, y, self._middle(m, y)))
+                stack.append((x, m, self._middle(x, m)))
+
+    def distance(self, start: str, goal: str) -> float:
+        """Jarak terpendek tanpa unpacking path"""
+        return self._search(self.index[start], self.index[goal])[0]
+
+    def query(self, start: str, goal: str) -> Tuple[List[str], float, int]:
+        """Query CH dengan kontrak (path, total_time, iterations) seperti dijkstra"""
+        s, g = self.index[start], self.index[goal]
+        best, meet, parent, iterations = self._search(s, g)
+        if meet == -1:
+            return [], float('inf'), iterations
+
+        forward_arcs = []
+        node = meet
+        while parent[0][node][0] != -1:
+            prev, middle = parent[0][node]
+            forward_arcs.append((prev, node, middle))
+            node = prev
+
+        path = [s]
+        for a, b, middle in reversed(forward_arcs):
+            self._unpack(a, b, middle, path)
+
+        node = meet
+        while parent[1][node][0] != -1:
+            nxt, middle = parent[1][node]
+            self._unpack(node, nxt, middle, path)
+            node = nxt
+
+        return [self.node_ids[i] for i in path], best, iterations
+
+    def save(self, path: str):
+        """Serialisasi hierarchy ke file .npz"""
+        np.savez_compressed(
+            path,
+            format_version=CH_FORMAT_VERSION,
+            node_ids=np.asarray(self.node_ids),
+            rank=self.rank,
+            up_indptr=self.up[0], up_indices=self.up[1],
+            up_weights=self.up[2], up_middle=self.up[3],
+            down_indptr=self.down[0], down_indices=self.down[1],
+            down_weights=self.down[2], down_middle=self.down[3],
+            stats_keys=np.asarray(list(self.stats)),
+            stats_values=np.asarray(list(self.stats.values()), dtype=np.float64),
+        )
+
+    @classmethod
+    def load(cls, path: str) -> 'ContractionHierarchy':
+        """Memuat hierarchy yang disimpan dengan save()"""
+        with np.load(path, allow_pickle=False) as data:
+            version = int(data['format_version'])
+            if version != CH_FORMAT_VERSION:
+                raise ValueError(f"Unsupported CH format version: {version}")
+            stats = dict(zip(data['stats_keys'].tolist(), data['stats_values'].tolist()))
+            return cls(data['node_ids'].tolist(), data['rank'],
+                       data['up_indptr'], data['up_indices'], data['up_weights'], data['up_middle'],
+                       data['down_indptr'], data['down_indices'], data['down_weights'], data['down_middle'],
+                       stats)
+
+    def __repr__(self):
+        return (f"ContractionHierarchy({len(self.node_ids)} nodes, "
+                f"{self.n_shortcuts} shortcuts)")
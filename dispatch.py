@@ -0,0 +1,205 @@
+"""
+Fleet Dispatch - Jakarta Waterways
+==================================
+Penugasan N ambulans air (boat) yang tersedia di berbagai dermaga ke M
+insiden sekaligus, lalu dari insiden ke rumah sakit terdekat. Matriks
+biaya boat x insiden dibangun dengan pencarian one-to-many dari sisi yang
+lokasinya lebih sedikit (bukan N x M query terpisah) dan penugasan
+diselesaikan dengan algoritma Hungarian (scipy linear_sum_assignment).
+
+Contoh:
+    dispatcher = FleetDispatcher(RoutingAlgorithms(network.G))
+    plan = dispatcher.dispatch(boats=['D1', 'D4', 'D8'], incidents=['D3', 'D6'])
+    print(plan.to_dataframe().to_string(index=False))
+"""
+
+import time
+from typing import Dict, List, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+from scipy.optimize import linear_sum_assignment
+
+from water_ambulance_routing import RoutingAlgorithms
+
+
+class DispatchPlan:
+    """
+    Hasil satu siklus dispatch. assignments berisi satu dict per pasangan
+    boat -> insiden -> rumah sakit beserta rute dan waktu tempuh setiap leg.
+    """
+
+    def __init__(self, assignments: List[Dict], unassigned_boats: List[str],
+                 unassigned_incidents: List[str], response_matrix: np.ndarray,
+                 stats: Dict[str, float]):
+        self.assignments = assignments
+        self.unassigned_boats = unassigned_boats
+        self.unassigned_incidents = unassigned_incidents
+        self.response_matrix = response_matrix
+        self.stats = stats
+
+    def __len__(self) -> int:
+        return len(self.assignments)
+
+    @property
+    def total_response(self) -> float:
+        return sum(a['response_minutes'] for a in self.assignments)
+
+    def to_dataframe(self) -> pd.DataFrame:
+        """Tabel penugasan dengan rute sebagai string 'A -> B -> C'"""
+        rows = []
+        for a in self.assignments:
+            rows.append({
+                'Boat': a['boat'],
+                'Location': a['boat_location'],
+                'Incident': a['incident'],
+                'Hospital': a['hospital'],
+                'Response (min)': a['response_minutes'],
+                'To Hospital (min)': a['hospital_minutes'],
+                'Total (min)': a['response_minutes'] + a['hospital_minutes'],
+                'Route': ' -> '.join(a['route_to_incident'] + a['route_to_hospital'][1:]),
+            })
+        return pd.DataFrame(rows)
+
+
+class FleetDispatcher:
+    """
+    Dispatcher armada di atas RoutingAlgorithms. hospitals default: semua
+    node bertipe 'hospital' pada snapshot CSR.
+    """
+
+    def __init__(self, algorithms: RoutingAlgorithms, hospitals: Sequence[str] = None):
+        self.algorithms = algorithms
+        self.hospitals = list(hospitals) if hospitals is not None else None
+
+    def _hospital_ids(self) -> List[int]:
+        csr = self.algorithms.csr
+        if self.hospitals is None:
+            return csr.nodes_of_type('hospital').tolist()
+        return [csr.index[h] for h in self.hospitals]
+
+    def response_matrix(self, boats: Sequence[str],
+                        incidents: Sequence[str]) -> Tuple[np.ndarray, Dict, int]:
+        """
+        Matriks waktu tempuh boat x insiden. Pencarian dijalankan sekali per
+        lokasi unik: maju dari lokasi boat, atau mundur (graf reverse) dari
+        lokasi insiden bila jumlahnya lebih sedikit. Setiap pencarian berhenti
+        begitu semua target sisi lain settled. Mengembalikan (matrix,
+        shortest-path tree per lokasi, jumlah iterasi).
+        """
+        algorithms = self.algorithms
+        csr = algorithms.csr
+        boat_loc, boat_inv = np.unique([csr.index[b] for b in boats], return_inverse=True)
+        inc_loc, inc_inv = np.unique([csr.index[i] for i in incidents], return_inverse=True)
+
+        backward = len(inc_loc) < len(boat_loc)
+        sources, targets = (inc_loc, boat_loc) if backward else (boat_loc, inc_loc)
+        search_csr = csr.reverse() if backward else csr
+
+        unique = np.empty((len(sources), len(targets)))
+        trees = {}
+        iterations = 0
+        for k, source in enumerate(sources.tolist()):
+            distances, previous, pops = algorithms._dijkstra_tree(
+                source, csr=search_csr, targets=targets.tolist())
+            iterations += pops
+            unique[k] = np.asarray(distances)[targets]
+            trees[source] = previous
+
+        if backward:
+            unique = unique.T
+        matrix = unique[boat_inv][:, inc_inv]
+        return matrix, {'backward': backward, 'trees': trees}, iterations
+
+    def _route(self, search: Dict, boat: int, incident: int) -> List[int]:
+        """Path boat -> insiden dari tree maju (root boat) atau mundur (root insiden)"""
+        if search['backward']:
+            previous = search['trees'][incident]
+            path = [boat]
+            while path[-1] != incident:
+                path.append(previous[path[-1]])
+            return path
+
+        previous = search['trees'][boat]
+        path = [incident]
+        while path[-1] != boat:
+            path.append(previous[path[-1]])
+        path.reverse()
+        return path
+
+    def dispatch(self, boats: Sequence[str], incidents: Sequence[str],
+                 boat_names: Sequence[str] = None,
+                 max_response: float = None) -> DispatchPlan:
+        """
+        Tugaskan boat ke insiden dengan total waktu respons minimum, lalu
+        rutekan setiap insiden ke rumah sakit terdekat. boats berisi lokasi
+        node setiap boat (boleh berulang); boat_names opsional untuk label.
+        Pasangan yang tidak terjangkau atau melebihi max_response (menit)
+        tidak pernah ditugaskan.
+        """
+        algorithms = self.algorithms
+        csr = algorithms.csr
+        boat_names = list(boat_names) if boat_names is not None else [
+            f"Boat-{k + 1}" for k in range(len(boats))]
+
+        t0 = time.perf_counter()
+        matrix, search, iterations = self.response_matrix(boats, incidents)
+        matrix_ms = (time.perf_counter() - t0) * 1000
+
+        # Leg insiden -> rumah sakit: satu Multi-Source Dijkstra pada graf
+        # reverse dari semua rumah sakit sekaligus
+        t0 = time.perf_counter()
+        to_hospital, nearest, previous, pops = algorithms._multi_source_tree(
+            self._hospital_ids(), csr=csr.reverse())
+        iterations += pops
+        hospital_ms = (time.perf_counter() - t0) * 1000
+
+        t0 = time.perf_counter()
+        allowed = np.isfinite(matrix)
+        if max_response is not None:
+            allowed &= matrix <= max_response
+        assigned = []
+        if allowed.any():
+            # Pasangan terlarang diberi biaya lebih besar dari total semua
+            # pasangan valid sehingga hanya dipilih bila tidak ada pilihan lain
+            penalty = matrix[allowed].sum() + 1
+            rows, cols = linear_sum_assignment(np.where(allowed, matrix, penalty))
+            assigned = [(i, j) for i, j in zip(rows.tolist(), cols.tolist()) if allowed[i, j]]
+        assign_ms = (time.perf_counter() - t0) * 1000
+
+        node_ids = csr.node_ids
+        assignments = []
+        for i, j in assigned:
+            b, inc = csr.index[boats[i]], csr.index[incidents[j]]
+            route = self._route(search, b, inc)
+            hospital_route = [inc]
+            while previous[hospital_route[-1]] != -1:
+                hospital_route.append(previous[hospital_route[-1]])
+            assignments.append({
+                'boat': boat_names[i],
+                'boat_location': boats[i],
+                'incident': incidents[j],
+                'hospital': node_ids[nearest[inc]] if nearest[inc] >= 0 else None,
+                'response_minutes': float(matrix[i, j]),
+                'hospital_minutes': float(to_hospital[inc]),
+                'route_to_incident': [node_ids[u] for u in route],
+                'route_to_hospital': ([node_ids[u] for u in hospital_route]
+                                      if nearest[inc] >= 0 else []),
+            })
+
+        served_boats = {i for i, _ in assigned}
+        served_incidents = {j for _, j in assigned}
+        stats = {
+            'boats': len(boats),
+            'incidents': len(incidents),
+            'searches': len(search['trees']) + 1,
+            'iterations': iterations,
+            'matrix_ms': matrix_ms,
+            'hospital_ms': hospital_ms,
+            'assignment_ms': assign_ms,
+        }
+        return DispatchPlan(
+            assignments,
+            [boat_names[k] for k in range(len(boats)) if k not in served_boats],
+            [incidents[k] for k in range(len(incidents)) if k not in served_incidents],
+            matrix, stats)
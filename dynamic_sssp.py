@@ -0,0 +1,207 @@
+"""
+Dynamic Shortest Paths - Jakarta Waterways
+==========================================
+Shortest-path tree untuk source yang didaftarkan (mis. dermaga) dipelihara
+secara inkremental ketika bobot edge berubah (pasang surut, sampah, penutupan
+jalur). Hanya subtree yang terdampak yang diperbaiki, mengikuti pendekatan
+Ramalingam-Reps, alih-alih menjalankan ulang Dijkstra dari setiap source.
+"""
+
+import heapq
+from typing import Dict, Iterable, List, Tuple
+
+import numpy as np
+import networkx as nx
+
+from water_ambulance_routing import CSRGraph, RoutingAlgorithms
+
+
+class DynamicShortestPaths:
+    """
+    Pemelihara shortest-path tree dinamis di atas RoutingAlgorithms.
+    Tree awal dibangun dengan loop Dijkstra milik RoutingAlgorithms;
+    update_edges() memperbaiki tree semua source dalam satu batch.
+    """
+
+    def __init__(self, algorithms: RoutingAlgorithms, sources: Iterable[str] = (),
+                 sync_graph: bool = True):
+        self.algorithms = algorithms
+        self.base = algorithms.csr
+        self.sync_graph = sync_graph and isinstance(algorithms.graph, nx.Graph)
+        self.weights = self.base.weights.tolist()
+        self._snapshot = self.base
+
+        # Arc masuk per node (untuk menghitung ulang jarak node terdampak)
+        heads = self.base.indices
+        self._in_arcs = np.argsort(heads, kind='stable').tolist()
+        in_indptr = np.zeros(self.base.n_nodes + 1, dtype=np.int64)
+        np.cumsum(np.bincount(heads, minlength=self.base.n_nodes), out=in_indptr[1:])
+        self._in_indptr = in_indptr.tolist()
+        self._tails = self.base.tails.tolist()
+
+        self._arcs = {}
+        for e, (u, v) in enumerate(zip(self._tails, heads.tolist())):
+            self._arcs.setdefault((u, v), []).append(e)
+
+        self.dist: Dict[int, List[float]] = {}
+        self.parent_arc: Dict[int, List[int]] = {}
+        for source in sources:
+            self.add_source(source)
+
+    def _current_csr(self) -> CSRGraph:
+        """Snapshot CSR dengan bobot terbaru (dibuat ulang hanya setelah update)"""
+        if self._snapshot is None:
+            base = self.base
+            self._snapshot = CSRGraph(base.node_ids, base.indptr, base.indices, self.weights,
+                                      base.times, base.distances, base.lat, base.lon,
+                                      base.type_codes, base.type_labels, base.directed)
+            self._snapshot._index = base.index
+        return self._snapshot
+
+    def _tree_arc(self, u: int, v: int) -> int:
+        """Arc u -> v dengan bobot terkecil (menangani arc paralel)"""
+        return min(self._arcs[(u, v)], key=self.weights.__getitem__)
+
+    def add_source(self, source: str):
+        """Daftarkan source baru dan bangun shortest-path tree-nya"""
+        s = self.base.index[source]
+        distances, previous, _ = self.algorithms._dijkstra_tree(s, csr=self._current_csr())
+        self.dist[s] = distances
+        self.parent_arc[s] = [self._tree_arc(p, v) if p != -1 else -1
+                              for v, p in enumerate(previous)]
+
+    def remove_source(self, source: str):
+        s = self.base.index[source]
+        del self.dist[s]
+        del self.parent_arc[s]
+
+    @property
+    def sources(self) -> List[str]:
+        return [self.base.node_ids[s] for s in self.dist]
+
+    def distance(self, source: str, target: str) -> float:
+        return self.dist[self.base.index[source]][self.base.index[target]]
+
+    def path(self, source: str, target: str) -> List[str]:
+        """Path dari tree yang dipelihara untuk source terdaftar"""
+        s, t = self.base.index[source], self.base.index[target]
+        parent_arc = self.parent_arc[s]
+        if self.dist[s][t] == float('inf'):
+            return []
+        path = [t]
+        while path[-1] != s:
+            path.append(self._tails[parent_arc[path[-1]]])
+        path.reverse()
+        return [self.base.node_ids[i] for i in path]
+
+    def update_edge(self, u: str, v: str, weight: float) -> Dict[str, int]:
+        """Ubah bobot satu edge; lihat update_edges()"""
+        return self.update_edges([(u, v, weight)])
+
+    def update_edges(self, updates: List[Tuple[str, str, float]]) -> Dict[str, int]:
+        """
+        Terapkan batch perubahan bobot (u, v, weight_baru) lalu perbaiki
+        tree setiap source. Edge undirected diubah di kedua arah. Mengembalikan
+        statistik kerja perbaikan: jumlah node terdampak dan pop heap.
+        """
+        index = self.base.index
+        # Validasi seluruh batch dulu agar pasangan yang salah tidak
+        # meninggalkan bobot yang sudah berubah tanpa perbaikan tree
+        resolved = []
+        for u, v, weight in updates:
+            a, b = index.get(u), index.get(v)
+            if a is None or b is None or (a, b) not in self._arcs:
+                raise KeyError((u, v))
+            resolved.append((u, v, a, b, weight))
+
+        increased, decreased = [], []
+        for u, v, a, b, weight in resolved:
+            pairs = [(a, b)] if self.base.directed else [(a, b), (b, a)]
+            for pair in pairs:
+                for e in self._arcs.get(pair, ()):
+                    if weight > self.weights[e]:
+                        increased.append(e)
+                    elif weight < self.weights[e]:
+                        decreased.append(e)
+                    self.weights[e] = weight
+            if self.sync_graph:
+                self.algorithms.graph[u][v]['weight'] = weight
+
+        stats = {'changed_arcs': len(increased) + len(decreased), 'affected': 0, 'pops': 0}
+        if not increased and not decreased:
+            return stats
+
+        self._snapshot = None
+        for s in self.dist:
+            affected, pops = self._repair(s, increased, decreased)
+            stats['affected'] += affected
+            stats['pops'] += pops
+        return stats
+
+    def _repair(self, s: int, increased: List[int], decreased: List[int]) -> Tuple[int, int]:
+        """
+        Perbaikan satu tree. Node di subtree arc tree yang bobotnya naik
+        di-reset ke inf lalu diberi kandidat dari arc masuk; head arc yang
+        bobotnya turun di-seed bila jaraknya membaik. Satu pass Dijkstra
+        dari semua seed mengembalikan tree ke kondisi optimal.
+        """
+        indptr, indices, _ = self.base.adjacency_lists()
+        weights, tails = self.weights, self._tails
+        dist, parent_arc = self.dist[s], self.parent_arc[s]
+        INF = float('inf')
+
+        # 1. Kumpulkan subtree di bawah arc tree yang bobotnya naik
+        affected = []
+        is_affected = set()
+        stack = [indices[e] for e in increased if parent_arc[indices[e]] == e]
+        while stack:
+            x = stack.pop()
+            if x in is_affected:
+                continue
+            is_affected.add(x)
+            affected.append(x)
+            for e in range(indptr[x], indptr[x + 1]):
+                if parent_arc[indices[e]] == e:
+                    stack.append(indices[e])
+
+        for x in affected:
+            dist[x] = INF
+            parent_arc[x] = -1
+
+        # 2. Seed: kandidat terbaik dari node tidak terdampak
+        heap = []
+        for x in affected:
+            for k in range(self._in_indptr[x], self._in_indptr[x + 1]):
+                e = self._in_arcs[k]
+                candidate = dist[tails[e]] + weights[e]
+                if candidate < dist[x]:
+                    dist[x] = candidate
+                    parent_arc[x] = e
+            if dist[x] < INF:
+                heap.append((dist[x], x))
+
+        for e in decreased:
+            y = indices[e]
+            candidate = dist[tails[e]] + weights[e]
+            if candidate < dist[y]:
+                dist[y] = candidate
+                parent_arc[y] = e
+                heap.append((candidate, y))
+
+        # 3. Propagasi Dijkstra dari semua seed
+        heapq.heapify(heap)
+        pops = 0
+        while heap:
+            pops += 1
+            d, x = heapq.heappop(heap)
+            if d > dist[x]:
+                continue
+            for e in range(indptr[x], indptr[x + 1]):
+                y = indices[e]
+                candidate = d + weights[e]
+                if candidate < dist[y]:
+                    dist[y] = candidate
+                    parent_arc[y] = e
+                    heapq.heappush(heap, (candidate, y))
+
+        return len(affected), pops
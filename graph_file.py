@@ -0,0 +1,180 @@
+"""
+Graph File - Jakarta Waterways
+==============================
+Format file biner berversi untuk snapshot CSRGraph: node id, koordinat,
+tipe node dan adjacency CSR beserta kolom weight/time/distance per arc.
+Node id boleh string (blob UTF-8, di-decode lazy) atau integer (array int64,
+dimuat sebagai list saat dibuka); jenisnya dicatat di header (id_kind).
+open_graph() memetakan file dengan numpy.memmap, jadi membuka graf adalah
+operasi zero-copy dan waktu konstan (tidak ada parsing maupun objek
+networkx), dan beberapa worker proses berbagi page yang sama lewat page
+cache OS.
+
+Layout file (little-endian):
+    magic      8 byte  b'JKWGRAPH'
+    version    uint32  GRAPH_FORMAT_VERSION
+    header_len uint32  panjang header JSON
+    header     JSON    metadata graf + id_kind + {nama: [offset, dtype, shape]}
+    arrays     blok array, setiap offset align 64 byte
+
+Cara menjalankan:
+    python graph_file.py jakarta.wgraph     # tulis jaringan Jakarta
+
+Contoh:
+    write_graph(JakartaWaterwaysNetwork(), 'csv/jakarta.wgraph')
+    csr = open_graph('csv/jakarta.wgraph')
+    path, minutes, _ = RoutingAlgorithms(csr).dijkstra('D1', 'H1')
+"""
+
+import argparse
+import json
+import os
+import struct
+from typing import Dict
+
+import numpy as np
+
+from water_ambulance_routing import CSRGraph, JakartaWaterwaysNetwork, NodeIdTable
+
+GRAPH_MAGIC = b'JKWGRAPH'
+GRAPH_FORMAT_VERSION = 2
+# Versi 1 (tanpa id_kind, selalu id string) masih bisa dibaca
+READABLE_VERSIONS = (1, 2)
+
+_PREAMBLE = struct.Struct('<8sII')
+_ALIGN = 64
+
+# Kolom CSRGraph yang disimpan apa adanya
+_CSR_ARRAYS = ('indptr', 'indices', 'weights', 'times', 'distances', 'lat', 'lon',
+               'type_codes')
+
+
+def _aligned(offset: int) -> int:
+    return -(-offset // _ALIGN) * _ALIGN
+
+
+def node_id_kind(node_ids) -> str:
+    """'str' bila semua node id string, 'int' bila semua integer, selain itu None"""
+    if isinstance(node_ids, NodeIdTable) or all(isinstance(node, str) for node in node_ids):
+        return 'str'
+    if all(isinstance(node, (int, np.integer)) and not isinstance(node, bool)
+           for node in node_ids):
+        return 'int'
+    return None
+
+
+def _id_arrays(node_ids):
+    """Array node id + id_kind ('str' atau 'int'); tipe lain ditolak"""
+    kind = node_id_kind(node_ids)
+    if kind == 'str':
+        ids = node_ids if isinstance(node_ids, NodeIdTable) else NodeIdTable.from_ids(node_ids)
+        return kind, {'id_offsets': ids.offsets, 'id_blob': ids.blob, 'id_order': ids.order}
+    if kind == 'int':
+        return kind, {'id_values': np.asarray(node_ids, dtype=np.int64)}
+    raise TypeError("Graph files only support node ids that are all strings or all "
+                    "integers")
+
+
+def write_graph(graph, path: str) -> Dict:
+    """
+    Tulis graf networkx, JakartaWaterwaysNetwork atau CSRGraph ke file
+    biner. Ditulis ke file sementara lalu di-rename, sehingga proses lain
+    yang sedang membuka versi lama tidak melihat file setengah jadi.
+    Mengembalikan header yang ditulis. Node id harus semuanya string atau
+    semuanya integer (TypeError untuk tipe lain/campuran).
+    """
+    if hasattr(graph, 'to_csr'):
+        graph = graph.to_csr()
+    csr = graph if isinstance(graph, CSRGraph) else CSRGraph.from_networkx(graph)
+    id_kind, id_arrays = _id_arrays(csr.node_ids)
+
+    arrays = {name: getattr(csr, name) for name in _CSR_ARRAYS}
+    arrays.update(id_arrays)
+    arrays = {name: np.ascontiguousarray(arr, dtype=arr.dtype.newbyteorder('<'))
+              for name, arr in arrays.items()}
+
+    # Offset array relatif terhadap awal blok data (setelah header yang di-pad)
+    layout, offset = {}, 0
+    for name, arr in arrays.items():
+        layout[name] = [offset, arr.dtype.str, list(arr.shape)]
+        offset = _aligned(offset + arr.nbytes)
+    header = {
+        'n_nodes': csr.n_nodes,
+        'n_arcs': csr.n_arcs,
+        'directed': csr.directed,
+        'type_labels': list(csr.type_labels),
+        'id_kind': id_kind,
+        'arrays': layout,
+    }
+
+    encoded = json.dumps(header).encode('utf-8')
+    data_start = _aligned(_PREAMBLE.size + len(encoded))
+    tmp_path = f"{path}.tmp-{os.getpid()}"
+    with open(tmp_path, 'wb') as f:
+        f.write(_PREAMBLE.pack(GRAPH_MAGIC, GRAPH_FORMAT_VERSION, len(encoded)))
+        f.write(encoded)
+        for name, arr in arrays.items():
+            f.seek(data_start + layout[name][0])
+            arr.tofile(f)
+        f.truncate(data_start + offset)
+    os.replace(tmp_path, path)
+    return header
+
+
+def read_header(path: str) -> Dict:
+    """Baca dan validasi preamble + header JSON tanpa memetakan array"""
+    with open(path, 'rb') as f:
+        preamble = f.read(_PREAMBLE.size)
+        if len(preamble) < _PREAMBLE.size:
+            raise ValueError(f"Not a graph file: {path}")
+        magic, version, header_len = _PREAMBLE.unpack(preamble)
+        if magic != GRAPH_MAGIC:
+            raise ValueError(f"Not a graph file: {path}")
+        if version not in READABLE_VERSIONS:
+            raise ValueError(f"Unsupported graph format version: {version}")
+        header = json.loads(f.read(header_len).decode('utf-8'))
+    header['data_start'] = _aligned(_PREAMBLE.size + header_len)
+    return header
+
+
+def open_graph(path: str) -> CSRGraph:
+    """
+    Buka file graf sebagai CSRGraph read-only. Semua array adalah view
+    dari satu memmap; node id string di-decode saat diakses (NodeIdTable),
+    node id integer dimuat sebagai list int.
+    """
+    header = read_header(path)
+    data = np.memmap(path, dtype=np.uint8, mode='r')
+
+    arrays = {}
+    for name, (offset, dtype, shape) in header['arrays'].items():
+        dtype = np.dtype(dtype)
+        start = header['data_start'] + offset
+        if start + dtype.itemsize * int(np.prod(shape)) > len(data):
+            raise ValueError(f"Truncated graph file: {path} (array '{name}')")
+        arrays[name] = np.ndarray(shape, dtype=dtype, buffer=data, offset=start)
+
+    if header.get('id_kind', 'str') == 'int':
+        ids = arrays.pop('id_values').tolist()
+    else:
+        ids = NodeIdTable(arrays.pop('id_offsets'), arrays.pop('id_blob'),
+                          arrays.pop('id_order'))
+    if len(ids) != header['n_nodes'] or len(arrays['indices']) != header['n_arcs']:
+        raise ValueError(f"Corrupt graph file: {path}")
+    return CSRGraph(ids, directed=header['directed'], type_labels=header['type_labels'],
+                    **arrays)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Write the Jakarta network as a binary graph file")
+    parser.add_argument('path')
+    args = parser.parse_args()
+
+    header = write_graph(JakartaWaterwaysNetwork(), args.path)
+    print(f"Saved: {args.path} ({header['n_nodes']} nodes, {header['n_arcs']} arcs, "
+          f"{os.path.getsize(args.path)} bytes)")
+    print(open_graph(args.path))
+
+
+if __name__ == "__main__":
+    main()
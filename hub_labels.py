@@ -0,0 +1,269 @@
+"""
+Hub Labeling - Jakarta Waterways
+================================
+Distance oracle berbasis hub labeling yang dibangun dengan Pruned Landmark
+Labeling (PLL) di atas bobot edge jaringan waterways. Setiap node menyimpan
+label terurut (hub, jarak): label "out" berisi jarak node ke hub, label "in"
+berisi jarak hub ke node (pada graf undirected keduanya sama). Jarak s -> t
+adalah minimum d(s, h) + d(h, t) atas hub bersama, dihitung dengan merge
+linier dua array kecil tanpa menjelajah graf.
+"""
+
+import heapq
+import time
+from typing import Dict, List, Sequence, Tuple
+
+import numpy as np
+
+from water_ambulance_routing import CSRGraph
+
+HL_FORMAT_VERSION = 1
+
+# ============================================================================
+# PRUNED LANDMARK LABELING (PREPROCESSING)
+# ============================================================================
+
+def _pruned_search(adjacency: Tuple[List[int], List[int], List[float]], root: int, rank: int,
+                   root_label: Tuple[List[int], List[float]],
+                   labels: Tuple[List[List[int]], List[List[float]]],
+                   scratch: List[float]) -> int:
+    """
+    Dijkstra dari root yang dipangkas: node u yang jaraknya sudah tercakup
+    oleh label hub sebelumnya (query(root, u) <= d) tidak diberi label dan
+    tidak diekspansi. Label (rank, d) ditambahkan ke labels[u]. scratch
+    adalah array jarak hub -> root yang diisi dari root_label.
+    """
+    indptr, indices, weights = adjacency
+    label_hubs, label_dists = labels
+    for hub, d in zip(*root_label):
+        scratch[hub] = d
+
+    dist = {root: 0}
+    heap = [(0, root)]
+    added = 0
+    while heap:
+        d, u = heapq.heappop(heap)
+        if d > dist[u]:
+            continue
+
+        covered = min((scratch[h] + hd for h, hd in zip(label_hubs[u], label_dists[u])),
+                      default=float('inf'))
+        if covered <= d:
+            continue
+        label_hubs[u].append(rank)
+        label_dists[u].append(d)
+        added += 1
+
+        for e in range(indptr[u], indptr[u + 1]):
+            v = indices[e]
+            nd = d + weights[e]
+            if nd < dist.get(v, float('inf')):
+                dist[v] = nd
+                heapq.heappush(heap, (nd, v))
+
+    for hub in root_label[0]:
+        scratch[hub] = float('inf')
+    return added
+
+
+def _degree_order(csr: CSRGraph) -> np.ndarray:
+    """Urutan hub: derajat (in + out) terbesar lebih dulu"""
+    degree = np.diff(csr.indptr) + np.bincount(csr.indices, minlength=csr.n_nodes)
+    return np.argsort(-degree, kind='stable')
+
+# ============================================================================
+# HUB LABELS
+# ============================================================================
+
+class HubLabels:
+    """
+    Label hub dalam format CSR: out_indptr/out_hubs/out_dists dan
+    in_indptr/in_hubs/in_dists. Hub disimpan sebagai rank (posisi dalam
+    urutan pemrosesan), sehingga setiap label sudah terurut naik; order
+    memetakan rank -> integer id node.
+    """
+
+    def __init__(self, node_ids, order, out_indptr, out_hubs, out_dists,
+                 in_indptr=None, in_hubs=None, in_dists=None, stats: Dict = None):
+        self.node_ids = list(node_ids)
+        self.index = {node: i for i, node in enumerate(self.node_ids)}
+        self.order = np.asarray(order, dtype=np.int64)
+        self.out_labels = (np.asarray(out_indptr, dtype=np.int64),
+                           np.asarray(out_hubs, dtype=np.int32),
+                           np.asarray(out_dists, dtype=np.float64))
+        self.directed = in_indptr is not None
+        self.in_labels = self.out_labels if not self.directed else (
+            np.asarray(in_indptr, dtype=np.int64),
+            np.asarray(in_hubs, dtype=np.int32),
+            np.asarray(in_dists, dtype=np.float64))
+        self.stats = dict(stats or {})
+        self._lists = (tuple(arr.tolist() for arr in self.out_labels),
+                       tuple(arr.tolist() for arr in self.in_labels))
+
+    @classmethod
+    def build(cls, graph, order='ch') -> 'HubLabels':
+        """
+        Pruned Landmark Labeling dari graf networkx atau CSRGraph. order:
+        'ch' (node dengan rank Contraction Hierarchy tertinggi lebih dulu;
+        label jauh lebih kecil pada jaringan kanal), 'degree' (derajat
+        terbesar lebih dulu; urutan lebih cepat dihitung tetapi label lebih
+        besar), atau daftar node id eksplisit.
+        """
+        csr = graph if isinstance(graph, CSRGraph) else CSRGraph.from_networkx(graph)
+        n = csr.n_nodes
+        t0 = time.perf_counter()
+
+        if isinstance(order, str) and order == 'degree':
+            hub_order = _degree_order(csr)
+        elif isinstance(order, str) and order == 'ch':
+            from contraction_hierarchies import ContractionHierarchy
+            hub_order = np.argsort(-ContractionHierarchy.build(csr).rank, kind='stable')
+        else:
+            hub_order = np.asarray([csr.index[node] for node in order], dtype=np.int64)
+            if len(hub_order) != n or len(np.unique(hub_order)) != n:
+                raise ValueError("order must list every node exactly once")
+        order_seconds = time.perf_counter() - t0
+
+        forward = csr.adjacency_lists()
+        out_labels = ([[] for _ in range(n)], [[] for _ in range(n)])
+        in_labels = out_labels
+        backward = forward
+        if csr.directed:
+            in_labels = ([[] for _ in range(n)], [[] for _ in range(n)])
+            backward = csr.reverse().adjacency_lists()
+
+        scratch = [float('inf')] * n
+        for rank, root in enumerate(hub_order.tolist()):
+            # Maju: d(root, u) masuk label in(u); mundur: d(u, root) masuk label out(u)
+            _pruned_search(forward, root, rank,
+                           (out_labels[0][root], out_labels[1][root]), in_labels, scratch)
+            if csr.directed:
+                _pruned_search(backward, root, rank,
+                               (in_labels[0][root], in_labels[1][root]), out_labels, scratch)
+
+        packed = cls._pack(out_labels)
+        if csr.directed:
+            packed += cls._pack(in_labels)
+        stats = {
+            'nodes': n,
+            'order_seconds': order_seconds,
+            'preprocess_seconds': time.perf_counter() - t0,
+        }
+        return cls(csr.node_ids, hub_order, *packed, stats=stats)
+
+    @staticmethod
+    def _pack(labels: Tuple[List[List[int]], List[List[float]]]) -> Tuple[np.ndarray, ...]:
+        hubs, dists = labels
+        indptr = np.zeros(len(hubs) + 1, dtype=np.int64)
+        np.cumsum([len(label) for label in hubs], out=indptr[1:])
+        flat_hubs = np.fromiter((h for label in hubs for h in label), dtype=np.int32,
+                                count=int(indptr[-1]))
+        flat_dists = np.fromiter((d for label in dists for d in label), dtype=np.float64,
+                                 count=int(indptr[-1]))
+        return indptr, flat_hubs, flat_dists
+
+    def distance(self, start: str, goal: str) -> float:
+        """Jarak terpendek start -> goal dengan merge linier dua label terurut"""
+        s, g = self.index[start], self.index[goal]
+        (out_indptr, out_hubs, out_dists), (in_indptr, in_hubs, in_dists) = self._lists
+        i, i_end = out_indptr[s], out_indptr[s + 1]
+        j, j_end = in_indptr[g], in_indptr[g + 1]
+        best = float('inf')
+
+        while i < i_end and j < j_end:
+            a, b = out_hubs[i], in_hubs[j]
+            if a == b:
+                d = out_dists[i] + in_dists[j]
+                if d < best:
+                    best = d
+                i += 1
+                j += 1
+            elif a < b:
+                i += 1
+            else:
+                j += 1
+        return best
+
+    def distance_table(self, sources: Sequence[str], targets: Sequence[str]) -> np.ndarray:
+        """
+        Matriks jarak sources x targets (mis. dermaga x rumah sakit) secara
+        vectorized: label out setiap source disebar ke array per hub, lalu
+        semua label in target direduksi sekaligus dengan np.minimum.reduceat.
+        """
+        out_indptr, out_hubs, out_dists = self.out_labels
+        in_indptr, in_hubs, in_dists = self.in_labels
+        target_ids = np.asarray([self.index[t] for t in targets], dtype=np.int64)
+        table = np.full((len(sources), len(target_ids)), np.inf)
+        if len(target_ids) == 0:
+            return table
+
+        # Label in semua target digabung jadi satu array; offsets menandai
+        # awal segmen setiap target untuk reduceat
+        starts = in_indptr[target_ids]
+        lengths = in_indptr[target_ids + 1] - starts
+        offsets = np.cumsum(lengths) - lengths
+        positions = np.repeat(starts - offsets, lengths) + np.arange(lengths.sum())
+        hubs, dists = in_hubs[positions], in_dists[positions]
+        nonempty = lengths > 0
+
+        scratch = np.full(len(self.node_ids), np.inf)
+        for row, source in enumerate(sources):
+            s = self.index[source]
+            lo, hi = out_indptr[s], out_indptr[s + 1]
+            scratch[out_hubs[lo:hi]] = out_dists[lo:hi]
+            if len(hubs):
+                totals = scratch[hubs] + dists
+                table[row, nonempty] = np.minimum.reduceat(totals, offsets[nonempty])
+            scratch[out_hubs[lo:hi]] = np.inf
+        return table
+
+    def label_stats(self) -> Dict[str, float]:
+        """Statistik ukuran label (entry per node) dan memori array"""
+        labels = [self.out_labels] if not self.directed else [self.out_labels, self.in_labels]
+        sizes = np.concatenate([np.diff(indptr) for indptr, _, _ in labels])
+        return {
+            'nodes': len(self.node_ids),
+            'entries': int(sizes.sum()),
+            'avg_label': float(sizes.mean()) if len(sizes) else 0.0,
+            'median_label': float(np.median(sizes)) if len(sizes) else 0.0,
+            'p99_label': float(np.percentile(sizes, 99)) if len(sizes) else 0.0,
+            'max_label': int(sizes.max()) if len(sizes) else 0,
+            'megabytes': sum(arr.nbytes for label in labels for arr in label) / 2 ** 20,
+        }
+
+    def save(self, path: str):
+        """Serialisasi label ke file .npz"""
+        arrays = dict(
+            format_version=HL_FORMAT_VERSION,
+            node_ids=np.asarray(self.node_ids),
+            order=self.order,
+            out_indptr=self.out_labels[0], out_hubs=self.out_labels[1],
+            out_dists=self.out_labels[2],
+            stats_keys=np.asarray(list(self.stats)),
+            stats_values=np.asarray(list(self.stats.values()), dtype=np.float64),
+        )
+        if self.directed:
+            arrays.update(in_indptr=self.in_labels[0], in_hubs=self.in_labels[1],
+                          in_dists=self.in_labels[2])
+        np.savez_compressed(path, **arrays)
+
+    @classmethod
+    def load(cls, path: str) -> 'HubLabels':
+        """Memuat label yang disimpan dengan save()"""
+        with np.load(path, allow_pickle=False) as data:
+            version = int(data['format_version'])
+            if version != HL_FORMAT_VERSION:
+                raise ValueError(f"Unsupported hub label format version: {version}")
+            stats = dict(zip(data['stats_keys'].tolist(), data['stats_values'].tolist()))
+            directed = 'in_indptr' in data.files
+            return cls(data['node_ids'].tolist(), data['order'],
+                       data['out_indptr'], data['out_hubs'], data['out_dists'],
+                       data['in_indptr'] if directed else None,
+                       data['in_hubs'] if directed else None,
+                       data['in_dists'] if directed else None,
+                       stats)
+
+    def __repr__(self):
+        stats = self.label_stats()
+        return (f"HubLabels({stats['nodes']} nodes, {stats['entries']} entries, "
+                f"avg label {stats['avg_label']:.1f})")
@@ -0,0 +1,570 @@
+"""
+Multi-Level Overlay Routing - Jakarta Waterways
+===============================================
+Routing bergaya CRP (Customizable Route Planning) untuk bobot yang sering
+berubah. Preprocessing dibagi dua fase:
+
+1. Partisi (metric-independent, sekali saja): node dibagi menjadi cell
+   bersarang di beberapa level dengan recursive bisection koordinat
+   (atau urutan Reverse Cuthill-McKee bila koordinat tidak lengkap).
+2. Customization (setiap kali weight/time berubah): untuk setiap cell,
+   jarak antar boundary node dihitung ulang menjadi clique, bottom-up
+   dari level terendah di atas overlay level di bawahnya. Hanya cell yang
+   terkena perubahan yang dihitung ulang.
+
+Query menjalankan bidirectional Dijkstra di atas overlay: arc asli di cell
+level-1 milik start/goal, lalu clique level tertinggi yang tidak memuat
+start/goal. Arc clique pada path di-unpack kembali menjadi node asli.
+
+Contoh:
+    overlay = MultiLevelOverlay.build(network.G)
+    network.G['D1']['D5']['weight'] = 25      # overlay otomatis di-customize ulang
+    path, cost, _ = overlay.query('D1', 'H1')
+"""
+
+import heapq
+import time
+from typing import Dict, List, Sequence, Tuple
+
+import numpy as np
+import networkx as nx
+from scipy.sparse import csr_matrix
+from scipy.sparse.csgraph import dijkstra as csgraph_dijkstra, reverse_cuthill_mckee
+
+from water_ambulance_routing import CSRGraph
+
+# Atribut edge networkx -> kolom CSRGraph
+METRIC_COLUMNS = {'weight': 'weights', 'time': 'times'}
+
+# Di atas ukuran ini dominance check clique memakai loop per pivot (hemat memori)
+_BROADCAST_LIMIT = 48
+
+# ============================================================================
+# PARTITIONING (METRIC-INDEPENDENT)
+# ============================================================================
+
+def _bisect(points: np.ndarray, nodes: np.ndarray, max_size: int) -> List[np.ndarray]:
+    """Recursive bisection di median sumbu terpanjang hingga setiap part <= max_size"""
+    parts = []
+    stack = [nodes]
+    while stack:
+        part = stack.pop()
+        if len(part) <= max_size:
+            parts.append(part)
+            continue
+        coords = points[part]
+        axis = np.argmax(coords.max(axis=0) - coords.min(axis=0))
+        half = len(part) // 2
+        order = np.argpartition(coords[:, axis], half)
+        stack.append(part[order[half:]])
+        stack.append(part[order[:half]])
+    return parts
+
+
+def _partition_points(csr: CSRGraph) -> np.ndarray:
+    """Koordinat (lat, lon) bila lengkap, selain itu posisi urutan RCM"""
+    if np.all(np.isfinite(csr.lat)) and np.all(np.isfinite(csr.lon)):
+        return np.column_stack([csr.lat, csr.lon])
+    matrix = csr_matrix((np.ones(csr.n_arcs), csr.indices, csr.indptr),
+                        shape=(csr.n_nodes, csr.n_nodes))
+    order = reverse_cuthill_mckee((matrix + matrix.T).tocsr(), symmetric_mode=True)
+    position = np.empty(csr.n_nodes)
+    position[order] = np.arange(csr.n_nodes)
+    return position[:, None]
+
+
+def partition_cells(csr: CSRGraph, cell_sizes: Sequence[int]) -> np.ndarray:
+    """
+    Partisi bersarang: cells[l][u] adalah id cell node u di level l + 1.
+    cell_sizes urut naik (ukuran maksimum cell per level); setiap cell di
+    level l + 1 adalah gabungan cell di level l.
+    """
+    points = _partition_points(csr)
+    cells = np.empty((len(cell_sizes), csr.n_nodes), dtype=np.int64)
+    parts = [np.arange(csr.n_nodes)]
+    for level in range(len(cell_sizes) - 1, -1, -1):
+        parts = [sub for part in parts for sub in _bisect(points, part, cell_sizes[level])]
+        for cell, part in enumerate(parts):
+            cells[level, part] = cell
+    return cells
+
+
+def _prune_dominated(table: np.ndarray) -> np.ndarray:
+    """
+    Buang entry clique (i, j) yang tidak lebih pendek dari jalur lewat
+    boundary node lain k (d(i,k) + d(k,j), keduanya > 0). Jarak antar
+    boundary tetap sama, tetapi overlay di atasnya jauh lebih jarang.
+    """
+    hops = np.where(table > 0, table, np.inf)
+    if len(table) <= _BROADCAST_LIMIT:
+        via = np.min(hops[:, :, None] + hops[None, :, :], axis=1)
+    else:
+        via = np.full_like(table, np.inf)
+        for k in range(len(table)):
+            np.minimum(via, hops[:, k, None] + hops[None, k, :], out=via)
+    return np.where(table < via, table, np.inf)
+
+# ============================================================================
+# OVERLAY LEVEL
+# ============================================================================
+
+class _OverlayLevel:
+    """
+    Struktur satu level overlay. Graf level berisi arc asli di dalam cell
+    (level 1) atau arc overlay level bawah ditambah arc potong level bawah
+    yang berada di dalam cell (level > 1). sources memetakan setiap arc ke
+    posisi di vektor nilai (overlay level bawah diikuti bobot arc asli).
+    Clique setiap cell disimpan row-major (b x b) di self.clique.
+    """
+
+    def __init__(self, cells: np.ndarray, tails: np.ndarray, heads: np.ndarray,
+                 sources: np.ndarray, nodes: np.ndarray, boundary: np.ndarray):
+        n_cells = int(cells.max()) + 1 if len(cells) else 0
+        self.cells = cells
+        self.n_cells = n_cells
+
+        # Node level diurutkan per cell; local = posisi dalam cell
+        nodes = nodes[np.lexsort((nodes, cells[nodes]))]
+        self.node_ptr = np.zeros(n_cells + 1, dtype=np.int64)
+        np.cumsum(np.bincount(cells[nodes], minlength=n_cells), out=self.node_ptr[1:])
+        local = np.full(len(cells), -1, dtype=np.int64)
+        local[nodes] = np.arange(len(nodes)) - self.node_ptr[cells[nodes]]
+        self.nodes = nodes
+        self.n_rows = len(nodes)
+
+        # Arc paralel digabung (bobot minimum) lewat grup hasil sort
+        rows = self.node_ptr[cells[tails]] + local[tails]
+        heads_local = local[heads]
+        order = np.lexsort((heads_local, rows))
+        rows, heads_local = rows[order], heads_local[order]
+        self.sources = sources[order]
+        new_group = np.ones(len(order), dtype=bool)
+        new_group[1:] = (rows[1:] != rows[:-1]) | (heads_local[1:] != heads_local[:-1])
+        self.group_starts = np.flatnonzero(new_group)
+        self.rows = rows[self.group_starts]
+        self.indices = heads_local[self.group_starts].astype(np.int32)
+
+        # Boundary node per cell dan layout clique
+        self.boundary = boundary[np.lexsort((boundary, cells[boundary]))]
+        self.boundary_ptr = np.zeros(n_cells + 1, dtype=np.int64)
+        np.cumsum(np.bincount(cells[self.boundary], minlength=n_cells),
+                  out=self.boundary_ptr[1:])
+        self.boundary_local = local[self.boundary].astype(np.int32)
+        sizes = np.diff(self.boundary_ptr)
+        self.clique_ptr = np.zeros(n_cells + 1, dtype=np.int64)
+        np.cumsum(sizes ** 2, out=self.clique_ptr[1:])
+        self.clique = np.full(int(self.clique_ptr[-1]), np.inf)
+        self.overlay = self.clique.copy()
+
+        # Predecessor Dijkstra per boundary node (b x k per cell, index lokal)
+        # untuk unpacking arc clique tanpa pencarian ulang
+        self.predecessor_ptr = np.zeros(n_cells + 1, dtype=np.int64)
+        np.cumsum(sizes * np.diff(self.node_ptr), out=self.predecessor_ptr[1:])
+        self.predecessors = np.full(int(self.predecessor_ptr[-1]), -1, dtype=np.int32)
+
+        # Entry clique ke-k = (row, col) sebagai posisi di self.boundary;
+        # transpose[k] = posisi entry (col, row)
+        cell_of = np.repeat(np.arange(n_cells), sizes ** 2)
+        rank = np.arange(len(self.clique)) - self.clique_ptr[cell_of]
+        size = sizes[cell_of]
+        self.clique_rows = self.boundary_ptr[cell_of] + rank // size
+        self.clique_cols = self.boundary_ptr[cell_of] + rank % size
+        self.transpose = self.clique_ptr[cell_of] + (rank % size) * size + rank // size
+
+    def clique_arcs(self) -> Tuple[np.ndarray, np.ndarray]:
+        """(tails, heads) global semua entry clique, urut sesuai self.clique"""
+        return self.boundary[self.clique_rows], self.boundary[self.clique_cols]
+
+    def clique_path(self, u: int, v: int) -> List[int]:
+        """Node graf level (id global) pada jalur clique u -> v di cell-nya"""
+        cell = self.cells[u]
+        r_lo, r_hi = self.node_ptr[cell], self.node_ptr[cell + 1]
+        b_lo = self.boundary_ptr[cell]
+        row = np.searchsorted(self.boundary[b_lo:self.boundary_ptr[cell + 1]], u)
+        k = r_hi - r_lo
+        base = self.predecessor_ptr[cell] + row * k
+        predecessors = self.predecessors[base:base + k].tolist()
+
+        source = self.boundary_local[b_lo + row]
+        local = [int(np.searchsorted(self.nodes[r_lo:r_hi], v))]
+        while local[-1] != source:
+            local.append(predecessors[local[-1]])
+        local.reverse()
+        return self.nodes[r_lo + np.asarray(local)].tolist()
+
+    def customize(self, values: np.ndarray, dirty: np.ndarray, prune: bool) -> int:
+        """
+        Hitung ulang clique cell dalam dirty dengan scipy Dijkstra dari setiap
+        boundary node di graf lokal cell. Arc bernilai inf (entry overlay yang
+        dipangkas) tidak dimasukkan ke graf. Mengembalikan jumlah cell.
+        """
+        if not len(dirty):
+            return 0
+        data = (np.minimum.reduceat(values[self.sources], self.group_starts)
+                if len(self.group_starts) else np.empty(0))
+        finite = np.isfinite(data)
+        indptr = np.zeros(self.n_rows + 1, dtype=np.int64)
+        np.cumsum(np.bincount(self.rows[finite], minlength=self.n_rows), out=indptr[1:])
+        data, indices = data[finite], self.indices[finite]
+
+        count = 0
+        for cell in dirty.tolist():
+            b_lo, b_hi = self.boundary_ptr[cell], self.boundary_ptr[cell + 1]
+            if b_lo == b_hi:
+                continue
+            r_lo, r_hi = self.node_ptr[cell], self.node_ptr[cell + 1]
+            a_lo, a_hi = indptr[r_lo], indptr[r_hi]
+            block = csr_matrix((data[a_lo:a_hi], indices[a_lo:a_hi],
+                                (indptr[r_lo:r_hi + 1] - a_lo).astype(np.int32)),
+                               shape=(r_hi - r_lo, r_hi - r_lo))
+            local = self.boundary_local[b_lo:b_hi]
+            table, predecessors = csgraph_dijkstra(block, directed=True, indices=local,
+                                                   return_predecessors=True)
+            table = table[:, local]
+            self.predecessors[self.predecessor_ptr[cell]:self.predecessor_ptr[cell + 1]] = \
+                predecessors.ravel()
+
+            c_lo, c_hi = self.clique_ptr[cell], self.clique_ptr[cell + 1]
+            self.clique[c_lo:c_hi] = table.ravel()
+            self.overlay[c_lo:c_hi] = (_prune_dominated(table) if prune else table).ravel()
+            count += 1
+        return count
+
+# ============================================================================
+# MULTI-LEVEL OVERLAY
+# ============================================================================
+
+class MultiLevelOverlay:
+    """
+    Overlay multi-level di atas graf networkx (mis. JakartaWaterwaysNetwork.G)
+    atau CSRGraph. Untuk VersionedGraph, perubahan bobot terdeteksi lewat
+    version graf dan overlay di-customize ulang otomatis sebelum query.
+    """
+
+    def __init__(self, graph, csr: CSRGraph, cells: np.ndarray, metric: str = 'weight',
+                 stats: Dict = None):
+        if metric not in METRIC_COLUMNS:
+            raise ValueError(f"Unknown metric: {metric}")
+        self.graph = graph
+        self.csr = csr
+        self.metric = metric
+        self.cells = cells
+        self.version = getattr(graph, 'version', None)
+        self.stats = dict(stats or {})
+        self.weights = np.array(getattr(csr, METRIC_COLUMNS[metric]), dtype=np.float64)
+
+        tails, heads = csr.tails, csr.indices
+        self._inner = [level_cells[tails] == level_cells[heads] for level_cells in cells]
+        self.levels: List[_OverlayLevel] = []
+        for l, level_cells in enumerate(cells):
+            cut = ~self._inner[l]
+            boundary = np.unique(np.concatenate([tails[cut], heads[cut]]))
+            if l == 0:
+                arcs = np.flatnonzero(~cut)
+                level = _OverlayLevel(level_cells, tails[arcs], heads[arcs], arcs,
+                                      np.arange(csr.n_nodes), boundary)
+            else:
+                # Overlay level bawah + arc potong level bawah yang masih di dalam cell
+                below = self.levels[-1]
+                arcs = np.flatnonzero(~self._inner[l - 1] & ~cut)
+                clique_tails, clique_heads = below.clique_arcs()
+                level = _OverlayLevel(
+                    level_cells,
+                    np.concatenate([clique_tails, tails[arcs]]),
+                    np.concatenate([clique_heads, heads[arcs]]),
+                    np.concatenate([np.arange(len(clique_tails)), len(clique_tails) + arcs]),
+                    below.boundary, boundary)
+            self.levels.append(level)
+
+        self._lists = None
+        self.customize()
+
+    @classmethod
+    def build(cls, graph, cell_sizes: Sequence[int] = (128, 2048),
+              metric: str = 'weight') -> 'MultiLevelOverlay':
+        """
+        Partisi graf networkx atau CSRGraph lalu jalankan customization
+        pertama. cell_sizes: ukuran maksimum cell per level, urut naik.
+        metric: atribut edge yang dipakai, 'weight' atau 'time'.
+        """
+        t0 = time.perf_counter()
+        csr = graph if isinstance(graph, CSRGraph) else CSRGraph.from_networkx(graph)
+        sizes = sorted(int(size) for size in cell_sizes)
+        if not sizes or sizes[0] < 1:
+            raise ValueError("cell_sizes must contain positive sizes")
+        cells = partition_cells(csr, sizes)
+        stats = {'cell_sizes': sizes, 'partition_seconds': time.perf_counter() - t0}
+        return cls(graph, csr, cells, metric, stats)
+
+    @property
+    def n_levels(self) -> int:
+        return len(self.levels)
+
+    def customize(self, weights: np.ndarray = None, changed_arcs: np.ndarray = None) -> Dict:
+        """
+        Fase customization: hitung ulang clique boundary. weights (opsional)
+        adalah bobot baru per arc dalam urutan CSR. Bila changed_arcs
+        diberikan (atau weights dibandingkan dengan bobot lama), hanya cell
+        yang memuat arc tersebut beserta cell induknya yang dihitung ulang.
+        """
+        t0 = time.perf_counter()
+        if weights is not None:
+            weights = np.asarray(weights, dtype=np.float64)
+            if len(weights) != self.csr.n_arcs:
+                raise ValueError("weights must have one entry per arc")
+            if changed_arcs is None:
+                changed_arcs = np.flatnonzero(weights != self.weights)
+            self.weights = weights.copy()
+        if np.any(self.weights < 0):
+            raise ValueError("Overlay routing requires non-negative weights")
+
+        tails = self.csr.tails
+        recomputed = []
+        values = self.weights
+        dirty = None
+        for l, level in enumerate(self.levels):
+            if changed_arcs is None:
+                level_dirty = np.arange(level.n_cells)
+            else:
+                # Arc yang ikut graf level ini: di dalam cell level ini tetapi
+                # (untuk level > 1) memotong cell level bawah
+                mask = self._inner[l][changed_arcs]
+                if l > 0:
+                    mask &= ~self._inner[l - 1][changed_arcs]
+                hits = level.cells[tails[changed_arcs[mask]]]
+                if l > 0:
+                    # Cell induk dari cell level bawah yang clique-nya dihitung ulang
+                    below = self.levels[l - 1]
+                    starts = below.boundary_ptr[dirty]
+                    members = below.boundary[starts[starts < below.boundary_ptr[dirty + 1]]]
+                    hits = np.concatenate([hits, level.cells[members]])
+                level_dirty = np.unique(hits)
+            prune = l < len(self.levels) - 1
+            recomputed.append(level.customize(values, level_dirty, prune))
+            values = np.concatenate([level.overlay, self.weights])
+            dirty = level_dirty
+
+        self._lists = None
+        self.stats['customize_seconds'] = time.perf_counter() - t0
+        return {
+            'changed_arcs': len(self.weights) if changed_arcs is None else len(changed_arcs),
+            'cells': recomputed,
+            'seconds': self.stats['customize_seconds'],
+        }
+
+    def update_edges(self, updates: List[Tuple[str, str, float]]) -> Dict:
+        """
+        Terapkan batch perubahan bobot (u, v, bobot_baru) lalu customize
+        ulang cell yang terdampak. Edge undirected diubah di kedua arah; graf
+        networkx sumber ikut diperbarui.
+        """
+        csr = self.csr
+        index = csr.index
+        weights = self.weights.copy()
+        changed = []
+        for u, v, weight in updates:
+            a, b = index[u], index[v]
+            pairs = [(a, b)] if csr.directed else [(a, b), (b, a)]
+            for x, y in pairs:
+                lo, hi = csr.indptr[x], csr.indptr[x + 1]
+                arcs = lo + np.flatnonzero(csr.indices[lo:hi] == y)
+                if len(arcs) == 0:
+                    raise KeyError((u, v))
+                weights[arcs] = weight
+                changed.extend(arcs.tolist())
+            if isinstance(self.graph, nx.Graph):
+                self.graph[u][v][self.metric] = weight
+
+        self.version = getattr(self.graph, 'version', None)
+        return self.customize(weights, np.unique(np.asarray(changed, dtype=np.int64)))
+
+    def _graph_weights(self) -> np.ndarray:
+        """Bobot metric terbaru dari graf networkx dalam urutan arc CSR"""
+        G = self.graph
+        degrees = np.fromiter((len(nbrs) for nbrs in G.adj.values()), dtype=np.int64,
+                              count=G.number_of_nodes())
+        if (G.number_of_nodes() != self.csr.n_nodes
+                or not np.array_equal(degrees, np.diff(self.csr.indptr))):
+            raise ValueError("Graph topology changed; rebuild the overlay partition")
+        if self.metric == 'time':
+            values = (data.get('time', data.get('weight', 1))
+                      for nbrs in G.adj.values() for data in nbrs.values())
+        else:
+            values = (data.get('weight', 1) for nbrs in G.adj.values() for data in nbrs.values())
+        return np.fromiter(values, dtype=np.float64, count=self.csr.n_arcs)
+
+    def refresh(self) -> Dict:
+        """Customize ulang dari bobot terbaru graf networkx sumber"""
+        stats = self.customize(self._graph_weights())
+        self.version = getattr(self.graph, 'version', None)
+        return stats
+
+    def _sync(self):
+        version = getattr(self.graph, 'version', None)
+        if version is not None and version != self.version:
+            self.refresh()
+
+    def _query_lists(self):
+        """
+        Salinan Python list untuk loop query: adjacency asli maju/mundur dan,
+        per level, adjacency overlay maju/mundur per boundary node (entry
+        yang dipangkas dan diagonal dibuang).
+        """
+        if self._lists is None:
+            csr = self.csr
+            order = np.argsort(csr.indices, kind='stable')
+            reverse_indptr = np.zeros(csr.n_nodes + 1, dtype=np.int64)
+            np.cumsum(np.bincount(csr.indices, minlength=csr.n_nodes), out=reverse_indptr[1:])
+            adjacency = (
+                (csr.indptr.tolist(), csr.indices.tolist(), self.weights.tolist()),
+                (reverse_indptr.tolist(), csr.tails[order].tolist(), self.weights[order].tolist()),
+            )
+
+            levels = []
+            for level in self.levels:
+                position = np.full(csr.n_nodes, -1, dtype=np.int64)
+                position[level.boundary] = np.arange(len(level.boundary))
+                rows, cols = level.clique_rows, level.clique_cols
+                directions = []
+                # Arah mundur memakai transpose clique dengan layout yang sama
+                for values in (level.overlay, level.overlay[level.transpose]):
+                    keep = np.isfinite(values) & (rows != cols)
+                    ptr = np.zeros(len(level.boundary) + 1, dtype=np.int64)
+                    np.cumsum(np.bincount(rows[keep], minlength=len(level.boundary)), out=ptr[1:])
+                    directions.append((ptr.tolist(), level.boundary[cols[keep]].tolist(),
+                                       values[keep].tolist()))
+                levels.append((level.cells.tolist(), position.tolist(), directions))
+            self._lists = (adjacency, levels)
+        return self._lists
+
+    def _search(self, s: int, g: int):
+        """
+        Bidirectional Dijkstra di overlay. Level node u = level tertinggi di
+        mana cell u berbeda dari cell s dan g (0: semua arc asli; l > 0:
+        overlay cell level l plus arc asli yang keluar dari cell tersebut).
+        Mengembalikan (jarak, hops [(node, level arc masuk)], iterations).
+        """
+        adjacency, levels = self._query_lists()
+        home = [(cells[s], cells[g]) for cells, _, _ in levels]
+
+        dist = ({s: 0.0}, {g: 0.0})
+        previous = ({s: (-1, 0)}, {g: (-1, 0)})
+        queues = ([(0.0, s)], [(0.0, g)])
+        mu, meet = (0.0, s) if s == g else (float('inf'), -1)
+        iterations = 0
+
+        while queues[0] and queues[1]:
+            if queues[0][0][0] + queues[1][0][0] >= mu:
+                break
+
+            side = 0 if len(queues[0]) <= len(queues[1]) else 1
+            d, u = heapq.heappop(queues[side])
+            own, other = dist[side], dist[1 - side]
+            if d > own[u]:
+                continue
+            iterations += 1
+
+            level = 0
+            for l in range(len(levels) - 1, -1, -1):
+                cell = levels[l][0][u]
+                if cell != home[l][0] and cell != home[l][1]:
+                    level = l + 1
+                    break
+
+            relaxed = []
+            indptr, indices, weights = adjacency[side]
+            if level == 0:
+                for e in range(indptr[u], indptr[u + 1]):
+                    relaxed.append((indices[e], d + weights[e], 0))
+            else:
+                cells, position, directions = levels[level - 1]
+                cell = cells[u]
+                # Arc asli hanya yang keluar dari cell; di dalam cell lewat overlay
+                for e in range(indptr[u], indptr[u + 1]):
+                    v = indices[e]
+                    if cells[v] != cell:
+                        relaxed.append((v, d + weights[e], 0))
+                ptr, heads, overlay = directions[side]
+                k = position[u]
+                for e in range(ptr[k], ptr[k + 1]):
+                    relaxed.append((heads[e], d + overlay[e], level))
+
+            for v, nd, arc_level in relaxed:
+                if nd < own.get(v, float('inf')):
+                    own[v] = nd
+                    previous[side][v] = (u, arc_level)
+                    heapq.heappush(queues[side], (nd, v))
+                if v in other and nd + other[v] < mu:
+                    mu = nd + other[v]
+                    meet = v
+
+        if meet == -1:
+            return float('inf'), [], iterations
+
+        # hops maju s -> meet, lalu lanjut mengikuti previous mundur meet -> g
+        hops = []
+        current = meet
+        while current != -1:
+            parent, level = previous[0][current]
+            hops.append((current, level))
+            current = parent
+        hops.reverse()
+        current = meet
+        while previous[1][current][0] != -1:
+            current, level = previous[1][current]
+            hops.append((current, level))
+        return mu, hops, iterations
+
+    def _unpack(self, u: int, v: int, level: int) -> List[int]:
+        """Node asli setelah u pada arc overlay u -> v level tertentu (termasuk v)"""
+        path = []
+        nodes = self.levels[level - 1].clique_path(u, v)
+        below = self.cells[level - 2] if level > 1 else None
+        for x, y in zip(nodes, nodes[1:]):
+            if below is not None and below[x] == below[y]:
+                path.extend(self._unpack(x, y, level - 1))
+            else:
+                path.append(y)
+        return path
+
+    def distance(self, start: str, goal: str) -> float:
+        """Jarak terpendek start -> goal di overlay (tanpa unpacking path)"""
+        self._sync()
+        index = self.csr.index
+        return self._search(index[start], index[goal])[0]
+
+    def query(self, start: str, goal: str) -> Tuple[List[str], float, int]:
+        """Shortest path start -> goal: (path, cost, iterations) seperti RoutingAlgorithms"""
+        self._sync()
+        s, g = self.csr.index[start], self.csr.index[goal]
+        cost, hops, iterations = self._search(s, g)
+        if not hops:
+            return [], cost, iterations
+        path = [s]
+        for (u, _), (v, level) in zip(hops, hops[1:]):
+            if level == 0:
+                path.append(v)
+            else:
+                path.extend(self._unpack(u, v, level))
+        return [self.csr.node_ids[u] for u in path], cost, iterations
+
+    def level_stats(self) -> List[Dict]:
+        """Ukuran partisi dan overlay per level"""
+        rows = []
+        for l, level in enumerate(self.levels):
+            boundary = np.diff(level.boundary_ptr)
+            rows.append({
+                'level': l + 1,
+                'cells': level.n_cells,
+                'max_cell': int(np.bincount(level.cells).max()),
+                'boundary_nodes': len(level.boundary),
+                'max_boundary': int(boundary.max()) if len(boundary) else 0,
+                'clique_entries': len(level.clique),
+                'overlay_arcs': int(np.isfinite(level.overlay).sum()),
+            })
+        return rows
+
+    def __repr__(self):
+        cells = '/'.join(str(level.n_cells) for level in self.levels)
+        return (f"MultiLevelOverlay({self.csr.n_nodes} nodes, {self.n_levels} levels, "
+                f"cells {cells})")
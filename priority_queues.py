@@ -0,0 +1,172 @@
+"""
+Priority Queues - Jakarta Waterways
+===================================
+Backend priority queue yang bisa dipilih per pemanggilan dijkstra, a_star
+dan johnson (parameter queue='heap' | 'dial' | 'radix'). Semua backend
+menyimpan entry tuple dengan key di posisi pertama, mendukung duplikat
+(lazy deletion di sisi pemanggil) dan memakai antarmuka yang sama:
+push(entry), pop() -> entry, len(queue). CountingQueue membungkus backend
+mana pun untuk menghitung push/pop yang sebenarnya (dipakai benchmark).
+
+Dial dan radix heap hanya benar untuk key integer non-negatif yang
+monoton (key yang di-push tidak pernah lebih kecil dari key terakhir yang
+di-pop), seperti jarak Dijkstra pada bobot menit integer. Entry dengan key
+inf (mis. node yang menurut heuristic A* tidak bisa mencapai goal) tidak
+disimpan karena tidak akan pernah di-pop sebelum entry berkey finite.
+"""
+
+import heapq
+from functools import partial
+
+INF = float('inf')
+
+
+class BinaryHeap(list):
+    """Binary heap heapq: O(log n) per operasi, key boleh float"""
+
+    name = 'heap'
+    integer_keys = False
+
+    def __init__(self, span: int = None):
+        super().__init__()
+        # partial atas fungsi C heapq: tanpa overhead method Python di hot loop
+        self.push = partial(heapq.heappush, self)
+        self.pop = partial(heapq.heappop, self)
+
+
+class DialQueue:
+    """
+    Bucket queue Dial: array bucket sirkular sebesar bobot arc maksimum + 1,
+    dengan cursor yang hanya bergerak maju. Push O(1), pop amortized O(1)
+    plus langkah cursor (total <= jarak maksimum). Bucket diperbesar bila
+    ada key yang melewati jangkauan (mis. A* dengan reduced cost besar).
+    """
+
+    name = 'dial'
+    integer_keys = True
+
+    def __init__(self, span: int = 1):
+        self._buckets = [[] for _ in range(max(1, int(span or 1)) + 1)]
+        self._cursor = 0
+        self._top = 0
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def push(self, entry):
+        if entry[0] == INF:
+            return
+        key = int(entry[0])
+        # cursor <= semua key di queue, top >= semua key di queue
+        if not self._size:
+            self._cursor = self._top = key
+        elif key < self._cursor:
+            self._cursor = key
+        elif key > self._top:
+            self._top = key
+        if self._top - self._cursor >= len(self._buckets):
+            self._grow(self._top - self._cursor + 1)
+        self._buckets[key % len(self._buckets)].append(entry)
+        self._size += 1
+
+    def pop(self):
+        if not self._size:
+            raise IndexError("pop from empty queue")
+        buckets = self._buckets
+        capacity = len(buckets)
+        cursor = self._cursor
+        while not buckets[cursor % capacity]:
+            cursor += 1
+        self._cursor = cursor
+        self._size -= 1
+        return buckets[cursor % capacity].pop()
+
+    def _grow(self, needed: int):
+        old = self._buckets
+        capacity = max(needed, 2 * len(old))
+        self._buckets = [[] for _ in range(capacity)]
+        for bucket in old:
+            for entry in bucket:
+                self._buckets[int(entry[0]) % capacity].append(entry)
+
+
+class RadixHeap:
+    """
+    Radix heap monoton: entry ditempatkan di bucket sesuai bit tertinggi
+    yang berbeda dari key terakhir yang di-pop. Setiap entry berpindah
+    bucket paling banyak O(log C) kali, tanpa bergantung jumlah node.
+    """
+
+    name = 'radix'
+    integer_keys = True
+
+    def __init__(self, span: int = None):
+        self._buckets = [[] for _ in range(65)]
+        self._last = 0
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def push(self, entry):
+        if entry[0] == INF:
+            return
+        self._buckets[(int(entry[0]) ^ self._last).bit_length()].append(entry)
+        self._size += 1
+
+    def pop(self):
+        if not self._size:
+            raise IndexError("pop from empty queue")
+        buckets = self._buckets
+        if not buckets[0]:
+            i = 1
+            while not buckets[i]:
+                i += 1
+            moved, buckets[i] = buckets[i], []
+            last = self._last = int(min(entry[0] for entry in moved))
+            for entry in moved:
+                buckets[(int(entry[0]) ^ last).bit_length()].append(entry)
+        self._size -= 1
+        return buckets[0].pop()
+
+
+class CountingQueue:
+    """
+    Pembungkus backend mana pun yang menghitung pemanggilan push dan pop,
+    termasuk push berkey inf yang dibuang dan entry basi yang di-pop.
+    Untuk benchmark; hot loop biasa memakai backend langsung.
+    """
+
+    def __init__(self, queue):
+        self.queue = queue
+        self.name = queue.name
+        self.integer_keys = queue.integer_keys
+        self.pushes = 0
+        self.pops = 0
+
+    def __len__(self) -> int:
+        return len(self.queue)
+
+    def push(self, entry):
+        self.pushes += 1
+        self.queue.push(entry)
+
+    def pop(self):
+        entry = self.queue.pop()
+        self.pops += 1
+        return entry
+
+
+PRIORITY_QUEUES = {
+    'heap': BinaryHeap,
+    'dial': DialQueue,
+    'radix': RadixHeap,
+}
+
+
+def make_queue(name: str, span: int = None):
+    """Buat queue kosong berdasarkan nama backend"""
+    if name not in PRIORITY_QUEUES:
+        raise ValueError(f"Unknown priority queue: {name}")
+    return PRIORITY_QUEUES[name](span)
@@ -0,0 +1,133 @@
+"""
+Route Cache - Jakarta Waterways
+===============================
+Cache LRU/TTL di depan RoutingAlgorithms. Hasil query (algorithm, start, goal)
+disimpan bersama version graf; setiap mutasi JakartaWaterwaysNetwork.G
+(VersionedGraph) menaikkan version sehingga semua entry lama dibuang.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, List, Tuple
+
+from water_ambulance_routing import RoutingAlgorithms
+
+
+class RouteCache:
+    """
+    Cache hasil routing yang dibatasi ukuran (LRU) dan opsional umur entry
+    (TTL, detik). Statistik hit/miss/eviction tersedia lewat stats().
+
+    Contoh:
+        cache = RouteCache(RoutingAlgorithms(network.G), maxsize=4096)
+        path, minutes, _ = cache.query('dijkstra', 'D1', 'H1')
+        path, minutes, _ = cache.dijkstra('D1', 'H1')   # bentuk singkat
+
+    version (opsional): callable yang mengembalikan version data yang
+    di-cache, untuk pemanggil yang menghitung rute sendiri lewat
+    lookup()/store() (mis. routing_service). Default version graf algorithms.
+    """
+
+    def __init__(self, algorithms: RoutingAlgorithms = None, maxsize: int = 1024,
+                 ttl: float = None, version=None):
+        if maxsize <= 0:
+            raise ValueError("maxsize must be positive")
+        self.algorithms = algorithms
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._version_of = version
+        self._entries = OrderedDict()
+        self._version = self._graph_version()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+
+    def _graph_version(self):
+        if self._version_of is not None:
+            return self._version_of()
+        return getattr(self.algorithms.graph, 'version', None)
+
+    def _check_version(self):
+        """Buang semua entry bila graf sudah berubah sejak entry disimpan"""
+        version = self._graph_version()
+        if version != self._version:
+            self.invalidations += len(self._entries)
+            self._entries.clear()
+            self._version = version
+
+    def lookup(self, algorithm: str, start, goal, **kwargs) -> Tuple:
+        """
+        (hasil, version): hasil tersimpan (path, cost, iterations) atau None
+        bila miss, dan version saat lookup untuk diteruskan ke store()
+        """
+        key = (algorithm, start, goal, tuple(sorted(kwargs.items())))
+        now = time.monotonic()
+        with self._lock:
+            self._check_version()
+            entry = self._entries.get(key)
+            if entry is not None:
+                stored_at, result = entry
+                if self.ttl is None or now - stored_at <= self.ttl:
+                    self.hits += 1
+                    self._entries.move_to_end(key)
+                    return result, self._version
+                del self._entries[key]
+                self.expirations += 1
+            self.misses += 1
+            return None, self._version
+
+    def store(self, algorithm: str, start, goal, result: Tuple, version, **kwargs):
+        """Simpan hasil yang dihitung pada version; diabaikan bila version sudah berganti"""
+        key = (algorithm, start, goal, tuple(sorted(kwargs.items())))
+        path, total_time, iterations = result
+        with self._lock:
+            # Jangan simpan hasil yang dihitung dari graf versi lama
+            if self._graph_version() == version:
+                self._check_version()
+                self._entries[key] = (time.monotonic(), (tuple(path), total_time, iterations))
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.maxsize:
+                    self._entries.popitem(last=False)
+                    self.evictions += 1
+
+    def query(self, algorithm: str, start: str, goal: str,
+              **kwargs) -> Tuple[List[str], float, int]:
+        """Jalankan RoutingAlgorithms.<algorithm>(start, goal) lewat cache"""
+        result, version = self.lookup(algorithm, start, goal, **kwargs)
+        if result is None:
+            result = getattr(self.algorithms, algorithm)(start, goal, **kwargs)
+            self.store(algorithm, start, goal, result, version, **kwargs)
+        path, total_time, iterations = result
+        return list(path), total_time, iterations
+
+    def __getattr__(self, name: str):
+        """cache.dijkstra(start, goal) == cache.query('dijkstra', start, goal)"""
+        if name.startswith('_') or not callable(getattr(RoutingAlgorithms, name, None)):
+            raise AttributeError(name)
+        return lambda start, goal, **kwargs: self.query(name, start, goal, **kwargs)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> Dict[str, float]:
+        """Statistik cache: hits, misses, evictions, expirations, invalidations, hit_rate"""
+        lookups = self.hits + self.misses
+        return {
+            'size': len(self._entries),
+            'maxsize': self.maxsize,
+            'graph_version': self._version,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'expirations': self.expirations,
+            'invalidations': self.invalidations,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+        }
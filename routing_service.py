@@ -0,0 +1,668 @@
+"""
+Routing Service - Jakarta Waterways
+===================================
+Layanan HTTP/JSON asyncio yang berjalan terus untuk konsol dispatch.
+Jaringan waterways dan snapshot CSR disimpan di memori; pencarian jalur
+(CPU-bound) dijalankan di worker pool sehingga event loop tidak pernah
+terblokir. Request identik (start, goal, algorithm) yang sedang dihitung
+digabung menjadi satu komputasi, dan hasil terbaru disimpan di cache LRU
+yang dibuang otomatis begitu version graf berubah.
+
+Cara menjalankan:
+    python routing_service.py                      # http://127.0.0.1:8080
+    python routing_service.py --port 9000 --workers 4
+    python routing_service.py --check               # cek end-to-end di localhost
+
+Endpoint:
+    GET  /route?start=D1&goal=H1&algorithm=dijkstra
+    POST /route   {"start": "D1", "goal": "H1", "algorithm": "a_star"}
+    GET  /health
+    GET  /stats
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import os
+import shutil
+import tempfile
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Dict, List, Tuple
+from urllib.parse import parse_qsl, urlsplit
+
+import numpy as np
+
+from graph_file import node_id_kind, open_graph, write_graph
+from route_cache import RouteCache
+from water_ambulance_routing import JakartaWaterwaysNetwork, RoutingAlgorithms
+
+# Algoritma yang boleh dipanggil lewat HTTP (nama method RoutingAlgorithms)
+ALGORITHMS = (
+    'dfs', 'bfs', 'dijkstra', 'a_star', 'bidirectional_dijkstra', 'bidirectional_a_star',
+    'bellman_ford', 'floyd_warshall', 'johnson', 'topological_sort', 'multi_source_bfs',
+)
+
+STATUS_TEXT = {
+    200: 'OK', 400: 'Bad Request', 404: 'Not Found', 405: 'Method Not Allowed',
+    413: 'Payload Too Large', 500: 'Internal Server Error', 503: 'Service Unavailable',
+}
+
+MAX_BODY_BYTES = 64 * 1024
+LATENCY_WINDOW = 10_000
+
+# ============================================================================
+# WORKER
+# ============================================================================
+
+# Snapshot graf yang sedang dibuka worker proses: (path, RoutingAlgorithms)
+_worker_snapshot = (None, None)
+
+
+def _worker_algorithms(graph_path: str) -> RoutingAlgorithms:
+    """
+    RoutingAlgorithms worker untuk snapshot di graph_path. File dibuka
+    (memmap) sekali per snapshot per proses, jadi pool yang sama bisa
+    melayani version graf berikutnya tanpa proses baru.
+    """
+    global _worker_snapshot
+    if _worker_snapshot[0] != graph_path:
+        algorithms = RoutingAlgorithms(open_graph(graph_path))
+        algorithms.csr.adjacency_lists()
+        _worker_snapshot = (graph_path, algorithms)
+    return _worker_snapshot[1]
+
+
+def _run_route(graph_path: str, algorithm: str, start: str,
+               goal: str) -> Tuple[List[str], float, int]:
+    path, cost, iterations = getattr(_worker_algorithms(graph_path), algorithm)(start, goal)
+    return list(path), float(cost), int(iterations)
+
+
+class RequestError(Exception):
+    """Kesalahan request yang dikembalikan ke klien sebagai status HTTP"""
+
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+
+
+class _Snapshot:
+    """
+    Satu version graf yang dilayani: RoutingAlgorithms di atas CSR beku dan
+    (untuk worker proses) file graf yang dipetakan worker. File milik
+    service dihapus setelah snapshot diganti dan komputasinya selesai.
+    """
+
+    def __init__(self, version, algorithms: RoutingAlgorithms, path: str = None,
+                 owned: bool = False):
+        self.version = version
+        self.algorithms = algorithms
+        # 'int': parameter query string dikonversi ke int sebelum lookup id
+        self.id_kind = node_id_kind(algorithms.csr.node_ids)
+        self.path = path
+        self.owned = owned
+        self.pending = 0
+        self.retired = False
+
+    def release(self):
+        if self.owned and self.retired and self.pending == 0:
+            self.owned = False
+            try:
+                os.unlink(self.path)
+            except FileNotFoundError:
+                pass
+
+# ============================================================================
+# ROUTING SERVICE
+# ============================================================================
+
+class RoutingService:
+    """
+    Server HTTP/1.1 (keep-alive) di atas asyncio.start_server.
+
+    executor='process' menjalankan pencarian di ProcessPoolExecutor (paralel
+    penuh, lepas dari GIL); executor='thread' memakai ThreadPoolExecutor
+    dengan satu RoutingAlgorithms bersama (cocok untuk graf kecil/tes).
+    Hasil disimpan di RouteCache (LRU, dibuang saat version berganti).
+    max_pending membatasi komputasi yang antre; request di atas batas
+    langsung dijawab 503 agar latency ekor tetap stabil.
+
+    network boleh berupa path file graf (graph_file); worker proses lalu
+    memetakan file yang sama sehingga page graf dibagi lewat page cache.
+
+    Request dilayani dari snapshot (version + RoutingAlgorithms di atas CSR
+    beku) oleh satu worker pool yang hidup selama service berjalan. Begitu
+    version graf berubah, snapshot baru dikompilasi di thread terpisah
+    (untuk worker proses: ditulis sebagai file graf di /dev/shm, lalu
+    dipetakan worker saat task pertama untuk version itu) sementara request
+    tetap dilayani snapshot lama, jadi event loop tidak ikut mengompilasi
+    CSR dan tidak ada proses yang dibuat ulang.
+
+    Contoh:
+        service = RoutingService(JakartaWaterwaysNetwork())
+        asyncio.run(service.serve_forever('127.0.0.1', 8080))
+    """
+
+    def __init__(self, network=None, workers: int = None, executor: str = 'process',
+                 cache_size: int = 4096, max_pending: int = 1024):
+        if executor not in ('process', 'thread'):
+            raise ValueError(f"Unknown executor: {executor}")
+        self.graph_path = network if isinstance(network, str) else None
+        if self.graph_path:
+            network = open_graph(self.graph_path)
+        self.network = network if network is not None else JakartaWaterwaysNetwork()
+        self.graph = getattr(self.network, 'G', self.network)
+        self.algorithms = None          # RoutingAlgorithms snapshot yang sedang dilayani
+        self.workers = workers or os.cpu_count() or 1
+        self.executor_kind = executor
+        self.cache_size = cache_size
+        self.max_pending = max_pending
+
+        self._pool = None
+        self._snapshot = None
+        self._rebuild = None
+        self._snapshot_dir = None
+        self._inflight: Dict[Tuple, asyncio.Future] = {}
+        self.cache = RouteCache(maxsize=cache_size, version=self._snapshot_version) \
+            if cache_size else None
+        self._latencies = deque(maxlen=LATENCY_WINDOW)
+        self._server = None
+        self._connections: Dict[asyncio.Task, asyncio.StreamWriter] = {}
+        self.counters = {'requests': 0, 'computations': 0, 'coalesced': 0,
+                         'cache_hits': 0, 'rejected': 0, 'errors': 0}
+
+    # ------------------------------------------------------------------
+    # Worker pool
+    # ------------------------------------------------------------------
+
+    def _graph_version(self):
+        return getattr(self.graph, 'version', None)
+
+    def _snapshot_version(self):
+        return None if self._snapshot is None else self._snapshot.version
+
+    def _build_snapshot(self, version) -> _Snapshot:
+        """Kompilasi snapshot untuk satu version graf (di thread, bukan event loop)"""
+        csr = RoutingAlgorithms(self.graph).csr
+        if self.executor_kind == 'thread':
+            csr.adjacency_lists()
+            return _Snapshot(version, RoutingAlgorithms(csr))
+        if self.graph_path:
+            snapshot = _Snapshot(version, RoutingAlgorithms(csr), self.graph_path)
+        else:
+            path = os.path.join(self._snapshot_dir, f"graph-{version}.wgraph")
+            write_graph(csr, path)
+            snapshot = _Snapshot(version, RoutingAlgorithms(csr), path, owned=True)
+        # Worker dijalankan (dan file dicek) di sini, bukan saat request pertama
+        self._pool.submit(_worker_algorithms, snapshot.path).result()
+        return snapshot
+
+    def _install(self, future: asyncio.Future):
+        self._rebuild = None
+        if future.cancelled():
+            return
+        if future.exception() is not None:
+            # Mis. graf diubah saat dikompilasi; dicoba lagi pada request berikutnya
+            self.counters['errors'] += 1
+            return
+        old, self._snapshot = self._snapshot, future.result()
+        self.algorithms = self._snapshot.algorithms
+        if old is not None:
+            old.retired = True
+            old.release()
+
+    async def _current(self) -> _Snapshot:
+        """
+        Snapshot untuk melayani request. Bila graf berubah, rebuild dijalankan
+        di background dan snapshot lama tetap dipakai; hanya request pertama
+        (belum ada snapshot) yang menunggu.
+        """
+        version = self._graph_version()
+        if self._snapshot is not None and self._snapshot.version == version:
+            return self._snapshot
+        if self._pool is None:
+            if self.executor_kind == 'process':
+                self._pool = ProcessPoolExecutor(self.workers)
+                if not self.graph_path:
+                    shm = '/dev/shm' if os.path.isdir('/dev/shm') else None
+                    self._snapshot_dir = tempfile.mkdtemp(prefix='routing-service-', dir=shm)
+            else:
+                self._pool = ThreadPoolExecutor(self.workers)
+        if self._rebuild is None:
+            self._rebuild = asyncio.get_running_loop().run_in_executor(
+                None, self._build_snapshot, version)
+            self._rebuild.add_done_callback(self._install)
+        if self._snapshot is None:
+            await asyncio.shield(self._rebuild)
+        return self._snapshot
+
+    def _submit(self, snapshot: _Snapshot, algorithm: str, start: str, goal: str):
+        if self.executor_kind == 'process':
+            return self._pool.submit(_run_route, snapshot.path, algorithm, start, goal)
+        return self._pool.submit(getattr(snapshot.algorithms, algorithm), start, goal)
+
+    @staticmethod
+    def _finished(snapshot: _Snapshot):
+        snapshot.pending -= 1
+        snapshot.release()
+
+    def close(self):
+        if self._pool is not None:
+            self._pool.shutdown(wait=True, cancel_futures=True)
+            self._pool = None
+        self._snapshot = None
+        self.algorithms = None
+        if self._snapshot_dir is not None:
+            shutil.rmtree(self._snapshot_dir, ignore_errors=True)
+            self._snapshot_dir = None
+
+    # ------------------------------------------------------------------
+    # Routing
+    # ------------------------------------------------------------------
+
+    def _validate(self, params: Dict, snapshot: _Snapshot) -> Tuple:
+        """(start, goal, algorithm) dengan start/goal persis seperti key di csr.index"""
+        start, goal = params.get('start'), params.get('goal')
+        algorithm = params.get('algorithm', 'dijkstra')
+        if start is None or goal is None:
+            raise RequestError(400, "start and goal are required")
+        if algorithm not in ALGORITHMS:
+            raise RequestError(400, f"Unknown algorithm: {algorithm}")
+        index = snapshot.algorithms.csr.index
+        nodes = []
+        for node in (start, goal):
+            if isinstance(node, bool) or not isinstance(node, (str, int)):
+                raise RequestError(400, f"Node ids must be strings or integers: {node!r}")
+            if snapshot.id_kind == 'int' and isinstance(node, str):
+                try:
+                    node = int(node)
+                except ValueError:
+                    raise RequestError(404, f"Unknown node: {node}")
+            if node not in index:
+                raise RequestError(404, f"Unknown node: {node}")
+            nodes.append(node)
+        return nodes[0], nodes[1], algorithm
+
+    async def route(self, start: str, goal: str, algorithm: str = 'dijkstra') -> Dict:
+        """
+        Hitung rute lewat cache -> request in-flight yang sama -> worker pool.
+        Mengembalikan dict JSON-ready: path, cost (None bila tidak terjangkau),
+        iterations dan source ('cache', 'coalesced' atau 'computed').
+        """
+        snapshot = await self._current()
+        key = (algorithm, start, goal, snapshot.version)
+
+        result = None
+        if self.cache is not None:
+            result, _ = self.cache.lookup(algorithm, start, goal)
+        if result is not None:
+            self.counters['cache_hits'] += 1
+            source = 'cache'
+        elif key in self._inflight:
+            self.counters['coalesced'] += 1
+            result = await asyncio.shield(self._inflight[key])
+            source = 'coalesced'
+        else:
+            if len(self._inflight) >= self.max_pending:
+                self.counters['rejected'] += 1
+                raise RequestError(503, "Too many pending route computations")
+            future = asyncio.wrap_future(self._submit(snapshot, algorithm, start, goal))
+            snapshot.pending += 1
+            future.add_done_callback(lambda _: self._finished(snapshot))
+            self._inflight[key] = future
+            self.counters['computations'] += 1
+            try:
+                result = await asyncio.shield(future)
+            finally:
+                del self._inflight[key]
+            if self.cache is not None:
+                self.cache.store(algorithm, start, goal, result, snapshot.version)
+            source = 'computed'
+
+        path, cost, iterations = result
+        cost = float(cost)
+        return {
+            'start': start,
+            'goal': goal,
+            'algorithm': algorithm,
+            'path': list(path),
+            'cost': cost if math.isfinite(cost) else None,
+            'iterations': int(iterations),
+            'source': source,
+        }
+
+    def stats(self) -> Dict:
+        """Counter request serta latency p50/p99 (ms) dari window terakhir"""
+        latencies = np.asarray(self._latencies) * 1e3
+        return {
+            **self.counters,
+            'inflight': len(self._inflight),
+            'cache_size': len(self.cache) if self.cache is not None else 0,
+            'graph_version': self._graph_version(),
+            'workers': self.workers,
+            'executor': self.executor_kind,
+            'p50_ms': float(np.percentile(latencies, 50)) if len(latencies) else None,
+            'p99_ms': float(np.percentile(latencies, 99)) if len(latencies) else None,
+        }
+
+    # ------------------------------------------------------------------
+    # HTTP
+    # ------------------------------------------------------------------
+
+    async def _dispatch(self, method: str, target: str, body: bytes) -> Tuple[int, Dict]:
+        url = urlsplit(target)
+        if url.path == '/health':
+            snapshot = await self._current()
+            csr = snapshot.algorithms.csr
+            return 200, {'status': 'ok', 'nodes': csr.n_nodes, 'arcs': csr.n_arcs,
+                         'graph_version': self._graph_version(),
+                         'snapshot_version': snapshot.version}
+        if url.path == '/stats':
+            return 200, self.stats()
+        if url.path != '/route':
+            raise RequestError(404, f"Unknown path: {url.path}")
+
+        if method == 'GET':
+            params = dict(parse_qsl(url.query))
+        elif method == 'POST':
+            try:
+                params = json.loads(body or b'{}')
+            except ValueError:
+                raise RequestError(400, "Body must be valid JSON")
+            if not isinstance(params, dict):
+                raise RequestError(400, "Body must be a JSON object")
+        else:
+            raise RequestError(405, f"Method not allowed: {method}")
+        snapshot = await self._current()
+        return 200, await self.route(*self._validate(params, snapshot))
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        task = asyncio.current_task()
+        self._connections[task] = writer
+        try:
+            while True:
+                try:
+                    head = await reader.readuntil(b'\r\n\r\n')
+                except (asyncio.IncompleteReadError, asyncio.LimitOverrunError,
+                        ConnectionError):
+                    break
+
+                lines = head.decode('latin-1').split('\r\n')
+                try:
+                    method, target, version = lines[0].split(' ', 2)
+                except ValueError:
+                    break
+                headers = {}
+                for line in lines[1:]:
+                    name, _, value = line.partition(':')
+                    if name:
+                        headers[name.strip().lower()] = value.strip()
+
+                t0 = time.perf_counter()
+                # Koneksi hanya dipakai ulang bila body request terbaca utuh
+                framed = False
+                try:
+                    try:
+                        length = int(headers.get('content-length') or 0)
+                    except ValueError:
+                        length = -1
+                    if length < 0:
+                        raise RequestError(400, "Invalid Content-Length")
+                    if length > MAX_BODY_BYTES:
+                        raise RequestError(413, "Request body too large")
+                    body = await reader.readexactly(length) if length else b''
+                    framed = True
+                    self.counters['requests'] += 1
+                    status, payload = await self._dispatch(method.upper(), target, body)
+                except RequestError as exc:
+                    status, payload = exc.status, {'error': str(exc)}
+                except asyncio.IncompleteReadError:
+                    break
+                except Exception as exc:
+                    self.counters['errors'] += 1
+                    status, payload = 500, {'error': repr(exc)}
+                self._latencies.append(time.perf_counter() - t0)
+
+                keep_alive = (headers.get('connection', '').lower() != 'close'
+                              and version.upper() == 'HTTP/1.1' and framed)
+                data = json.dumps(payload).encode()
+                writer.write(
+                    f"HTTP/1.1 {status} {STATUS_TEXT.get(status, '')}\r\n"
+                    f"Content-Type: application/json\r\n"
+                    f"Content-Length: {len(data)}\r\n"
+                    f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n"
+                    .encode('latin-1') + data)
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except ConnectionError:
+            pass
+        finally:
+            del self._connections[task]
+            writer.close()
+
+    async def start(self, host: str = '127.0.0.1', port: int = 8080) -> asyncio.AbstractServer:
+        """Jalankan server (port=0: port bebas, lihat self.port) tanpa memblokir"""
+        await self._current()
+        self._server = await asyncio.start_server(self._handle, host, port)
+        return self._server
+
+    @property
+    def port(self) -> int:
+        return self._server.sockets[0].getsockname()[1]
+
+    async def stop(self):
+        if self._server is not None:
+            self._server.close()
+            # Tutup koneksi keep-alive yang masih terbuka; handler selesai lewat EOF
+            for writer in list(self._connections.values()):
+                writer.close()
+            await asyncio.gather(*self._connections, return_exceptions=True)
+            await self._server.wait_closed()
+            self._server = None
+        if self._rebuild is not None:
+            await asyncio.gather(self._rebuild, return_exceptions=True)
+        self.close()
+
+    async def serve_forever(self, host: str = '127.0.0.1', port: int = 8080):
+        server = await self.start(host, port)
+        print(f"Routing service listening on http://{host}:{self.port} "
+              f"({self.workers} {self.executor_kind} workers)")
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            self.close()
+
+# ============================================================================
+# LOAD GENERATOR
+# ============================================================================
+
+async def load_test(host: str, port: int, queries: List[Tuple[str, str, str]],
+                    concurrency: int = 64) -> Dict:
+    """
+    Kirim semua queries (start, goal, algorithm) lewat `concurrency` koneksi
+    keep-alive ke service yang berjalan. Mengembalikan throughput (req/s)
+    dan latency klien p50/p99/max (ms).
+    """
+    pending = deque(queries)
+    latencies = []
+    statuses = {}
+
+    async def client():
+        reader, writer = await asyncio.open_connection(host, port)
+        try:
+            while pending:
+                start, goal, algorithm = pending.popleft()
+                t0 = time.perf_counter()
+                writer.write(f"GET /route?start={start}&goal={goal}&algorithm={algorithm} "
+                             f"HTTP/1.1\r\nHost: {host}\r\n\r\n".encode('latin-1'))
+                head = await reader.readuntil(b'\r\n\r\n')
+                status = int(head.split(b' ', 2)[1])
+                length = int(head.lower().split(b'content-length:')[1].split(b'\r\n')[0])
+                await reader.readexactly(length)
+                latencies.append(time.perf_counter() - t0)
+                statuses[status] = statuses.get(status, 0) + 1
+        finally:
+            writer.close()
+            await writer.wait_closed()
+
+    t0 = time.perf_counter()
+    await asyncio.gather(*(client() for _ in range(min(concurrency, len(queries)) or 1)))
+    elapsed = time.perf_counter() - t0
+    latencies = np.asarray(latencies) * 1e3
+    return {
+        'requests': len(latencies),
+        'seconds': elapsed,
+        'throughput': len(latencies) / elapsed if elapsed else 0.0,
+        'p50_ms': float(np.percentile(latencies, 50)) if len(latencies) else None,
+        'p99_ms': float(np.percentile(latencies, 99)) if len(latencies) else None,
+        'max_ms': float(latencies.max()) if len(latencies) else None,
+        'statuses': statuses,
+    }
+
+
+async def _request(host: str, port: int, method: str, target: str, body: bytes = b'',
+                   headers: Dict[str, str] = None) -> Tuple[int, Dict]:
+    """Satu request HTTP di koneksi baru; mengembalikan (status, body JSON)"""
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        headers = {'Content-Length': str(len(body)), **(headers or {})}
+        writer.write((f"{method} {target} HTTP/1.1\r\nHost: {host}\r\nConnection: close\r\n"
+                      + "".join(f"{name}: {value}\r\n" for name, value in headers.items())
+                      + "\r\n").encode('latin-1') + body)
+        head = await reader.readuntil(b'\r\n\r\n')
+        status = int(head.split(b' ', 2)[1])
+        return status, json.loads(await reader.read())
+    finally:
+        writer.close()
+        await writer.wait_closed()
+
+
+async def check_service(nodes: int = 50_000, executor: str = 'thread') -> Dict:
+    """
+    Cek end-to-end di localhost: GET dan POST /route, dua request identik
+    yang bersamaan digabung jadi satu komputasi, hit cache, status 4xx untuk
+    input salah, snapshot (pool yang sama, cache dibuang) mengikuti
+    perubahan graf, dan file graf dengan node id integer. Gagal ->
+    AssertionError.
+    """
+    import networkx as nx
+
+    from synthetic_waterways import synthetic_network
+    from water_ambulance_routing import CSRGraph
+
+    network = synthetic_network(nodes)
+    service = RoutingService(network, workers=2, executor=executor)
+    await service.start('127.0.0.1', 0)
+    host, port = '127.0.0.1', service.port
+    hospital = network.tables.node_ids[int(np.flatnonzero(network.tables.type_codes == 2)[-1])]
+    try:
+        status, got = await _request(host, port, 'GET', f"/route?start=D1&goal={hospital}")
+        assert status == 200 and got['path'][0] == 'D1' and got['path'][-1] == hospital, got
+        status, posted = await _request(
+            host, port, 'POST', '/route',
+            json.dumps({'start': 'D1', 'goal': hospital, 'algorithm': 'dijkstra'}).encode())
+        assert status == 200 and posted['cost'] == got['cost'], posted
+        assert (got['source'], posted['source']) == ('computed', 'cache'), (got, posted)
+
+        computations = service.counters['computations']
+        both = await asyncio.gather(*(_request(host, port, 'GET', f"/route?start=D1&goal={hospital}"
+                                               "&algorithm=a_star") for _ in range(2)))
+        assert [status for status, _ in both] == [200, 200], both
+        assert service.counters['computations'] == computations + 1, service.counters
+        assert sorted(got['source'] for _, got in both) == ['coalesced', 'computed'], both
+
+        bad_requests = [
+            (400, 'GET', '/route?start=D1', b'', None),
+            (400, 'GET', f"/route?start=D1&goal={hospital}&algorithm=nope", b'', None),
+            (404, 'GET', f"/route?start=NOPE&goal={hospital}", b'', None),
+            (404, 'GET', '/nope', b'', None),
+            (405, 'PUT', '/route', b'', None),
+            (400, 'POST', '/route', b'{not json', None),
+            (400, 'POST', '/route', b'[]', None),
+            (400, 'POST', '/route', b'', {'Content-Length': 'abc'}),
+            (400, 'POST', '/route', b'', {'Content-Length': '-1'}),
+            (413, 'POST', '/route', b'', {'Content-Length': str(MAX_BODY_BYTES + 1)}),
+        ]
+        for expected, method, target, body, headers in bad_requests:
+            status, got = await _request(host, port, method, target, body, headers)
+            assert status == expected and 'error' in got, (method, target, headers, status, got)
+
+        # Perubahan graf: snapshot dikompilasi ulang di background
+        pool = service._pool
+        u, v = posted['path'][:2]
+        network.G.add_edge(u, v, weight=network.G[u][v]['weight'] + 1)
+        for _ in range(200):
+            status, health = await _request(host, port, 'GET', '/health')
+            assert status == 200, health
+            if health['snapshot_version'] == health['graph_version']:
+                break
+            await asyncio.sleep(0.05)
+        assert health['snapshot_version'] == health['graph_version'], health
+        status, got = await _request(host, port, 'GET', f"/route?start=D1&goal={hospital}")
+        assert status == 200 and got['cost'] >= posted['cost'], got
+        assert got['source'] == 'computed' and service._pool is pool, got
+    finally:
+        await service.stop()
+
+    # File graf dengan node id integer: parameter GET dikonversi ke int
+    grid = nx.convert_node_labels_to_integers(nx.grid_2d_graph(5, 5))
+    nx.set_edge_attributes(grid, 1.0, 'weight')
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'grid.wgraph')
+        write_graph(CSRGraph.from_networkx(grid), path)
+        int_service = RoutingService(path, workers=2, executor=executor)
+        await int_service.start('127.0.0.1', 0)
+        try:
+            for method, target, body in (
+                    ('GET', '/route?start=0&goal=4', b''),
+                    ('POST', '/route', b'{"start": 0, "goal": 4}'),
+                    ('POST', '/route', b'{"start": "0", "goal": 4}')):
+                status, got = await _request(host, int_service.port, method, target, body)
+                assert status == 200 and got['path'][0] == 0 and got['cost'] == 4.0, got
+            status, got = await _request(host, int_service.port, 'POST', '/route',
+                                         b'{"start": 1, "goal": 4}')
+            assert status == 200 and got['path'] == [1, 2, 3, 4], got
+            for expected, target, body in ((404, '/route?start=abc&goal=4', b''),
+                                           (404, '/route?start=0&goal=99', b''),
+                                           (400, '/route', b'{"start": true, "goal": 4}')):
+                status, got = await _request(host, int_service.port, 'POST' if body else 'GET',
+                                             target, body)
+                assert status == expected and 'error' in got, (target, body, status, got)
+        finally:
+            await int_service.stop()
+    return service.stats()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Jakarta waterways routing service")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8080)
+    parser.add_argument('--workers', type=int, default=None)
+    parser.add_argument('--executor', choices=('process', 'thread'), default='process')
+    parser.add_argument('--cache-size', type=int, default=4096)
+    parser.add_argument('--graph', default=None,
+                        help="file graf biner (graph_file); default jaringan Jakarta")
+    parser.add_argument('--check', action='store_true',
+                        help="jalankan cek end-to-end di localhost lalu keluar")
+    args = parser.parse_args()
+
+    if args.check:
+        print(asyncio.run(check_service(executor=args.executor)))
+        print("Routing service check passed")
+        return
+
+    service = RoutingService(args.graph, workers=args.workers, executor=args.executor,
+                             cache_size=args.cache_size)
+    try:
+        asyncio.run(service.serve_forever(args.host, args.port))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,310 @@
+"""
+Scenario Sweep - Jakarta Waterways
+==================================
+Menjalankan semua algoritma RoutingAlgorithms pada setiap (atau sampel)
+pasangan origin-destination di ProcessPoolExecutor, lalu merangkum
+distribusi optimality gap, iterations dan runtime per algoritma. Berbeda
+dengan main() yang hanya membandingkan satu pasangan D1 -> H1.
+
+Array CSR graf ditaruh sekali di satu blok multiprocessing.shared_memory;
+worker hanya menerima layout blok tersebut dan membangun CSRGraph di atas
+view zero-copy, sehingga graf tidak di-pickle per task maupun per worker.
+
+Cara menjalankan:
+    python scenario_sweep.py                         # semua pasangan Jakarta
+    python scenario_sweep.py --sample 100 --workers 4
+"""
+
+import argparse
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from typing import Dict, List, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from graph_file import open_graph
+from water_ambulance_routing import CSRGraph, JakartaWaterwaysNetwork, RoutingAlgorithms
+
+# (label, method RoutingAlgorithms) dengan urutan yang sama seperti main()
+SWEEP_ALGORITHMS = (
+    ('DFS', 'dfs'),
+    ('BFS', 'bfs'),
+    ('Dijkstra', 'dijkstra'),
+    ('A*', 'a_star'),
+    ('Bidirectional Dijkstra', 'bidirectional_dijkstra'),
+    ('Bidirectional A*', 'bidirectional_a_star'),
+    ('Bellman-Ford', 'bellman_ford'),
+    ('Floyd-Warshall', 'floyd_warshall'),
+    ('Johnson', 'johnson'),
+    ('Topological Sort', 'topological_sort'),
+    ('Multi-Source BFS', 'multi_source_bfs'),
+)
+
+# Floyd-Warshall butuh matriks n x n; di atas batas ini algoritma dilewati
+FLOYD_NODE_LIMIT = 3000
+
+GRAPH_ARRAYS = ('indptr', 'indices', 'weights', 'times', 'distances', 'lat', 'lon',
+                'type_codes')
+
+# ============================================================================
+# SHARED-MEMORY GRAPH
+# ============================================================================
+
+class SharedGraph:
+    """
+    Salinan array CSRGraph (plus node id sebagai array unicode) di satu blok
+    shared memory. layout berisi nama blok dan (offset, dtype, shape) setiap
+    array; cukup layout ini yang dikirim ke worker untuk attach().
+    """
+
+    def __init__(self, csr: CSRGraph):
+        arrays = {name: getattr(csr, name) for name in GRAPH_ARRAYS}
+        arrays['node_ids'] = np.asarray(csr.node_ids, dtype=str)
+
+        fields, size = {}, 0
+        for name, arr in arrays.items():
+            size = -(-size // 64) * 64          # setiap array align 64 byte
+            fields[name] = (size, arr.dtype.str, arr.shape)
+            size += arr.nbytes
+        self.shm = shared_memory.SharedMemory(create=True, size=max(size, 1))
+        for name, arr in arrays.items():
+            offset, dtype, shape = fields[name]
+            np.ndarray(shape, dtype=dtype, buffer=self.shm.buf, offset=offset)[...] = arr
+
+        self.layout = {
+            'name': self.shm.name,
+            'fields': fields,
+            'directed': csr.directed,
+            'type_labels': csr.type_labels,
+        }
+
+    @staticmethod
+    def attach(layout: Dict) -> Tuple[shared_memory.SharedMemory, CSRGraph]:
+        """Bangun CSRGraph read-only di atas view blok shared memory yang sudah ada"""
+        # Worker pool berbagi resource tracker dengan proses induk (pemilik
+        # blok), jadi attach tidak membuat blok terhapus saat worker selesai
+        shm = shared_memory.SharedMemory(name=layout['name'])
+        arrays = {name: np.ndarray(shape, dtype=dtype, buffer=shm.buf, offset=offset)
+                  for name, (offset, dtype, shape) in layout['fields'].items()}
+        node_ids = arrays.pop('node_ids').tolist()
+        csr = CSRGraph(node_ids, directed=layout['directed'],
+                       type_labels=layout['type_labels'], **arrays)
+        return shm, csr
+
+    def close(self):
+        self.shm.close()
+        self.shm.unlink()
+
+    def __enter__(self) -> 'SharedGraph':
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+# ============================================================================
+# WORKER
+# ============================================================================
+
+_worker = {}
+
+
+def _init_worker(layout: Dict, methods: Sequence[str]):
+    """
+    Attach ke graf bersama dan panaskan preprocessing per proses (landmark,
+    APSP, potensial Johnson) dengan satu query, sehingga runtime yang
+    diukur adalah latency query murni.
+    """
+    if 'path' in layout:
+        # File graf memmap: worker berbagi page lewat page cache OS
+        shm, csr = None, open_graph(layout['path'])
+    else:
+        shm, csr = SharedGraph.attach(layout)
+    algorithms = RoutingAlgorithms(csr)
+    csr.adjacency_lists()
+    warm_start, warm_goal = csr.node_ids[0], csr.node_ids[-1]
+    for method in methods:
+        getattr(algorithms, method)(warm_start, warm_goal)
+    _worker.update(shm=shm, csr=csr, algorithms=algorithms, pid=os.getpid())
+
+
+def _run_pairs(pairs: np.ndarray, methods: Sequence[str]) -> List[Tuple]:
+    """Satu task: semua algoritma untuk sekumpulan pasangan (s, g) integer id"""
+    algorithms, node_ids = _worker['algorithms'], _worker['csr'].node_ids
+    records = []
+    for s, g in pairs.tolist():
+        start, goal = node_ids[s], node_ids[g]
+        for method in methods:
+            t0 = time.perf_counter()
+            path, cost, iterations = getattr(algorithms, method)(start, goal)
+            runtime_ms = (time.perf_counter() - t0) * 1e3
+            records.append((s, g, method, float(cost), len(path) - 1 if path else -1,
+                            int(iterations), runtime_ms, _worker['pid']))
+    return records
+
+# ============================================================================
+# SWEEP
+# ============================================================================
+
+def sample_pairs(n_nodes: int, sample: int = None, seed: int = 0) -> np.ndarray:
+    """
+    Semua pasangan terurut (s, g) dengan s != g, atau `sample` pasangan acak
+    berbeda tanpa membentuk seluruh n^2 pasangan.
+    """
+    total = n_nodes * (n_nodes - 1)
+    if sample is None or sample >= total:
+        s, g = np.divmod(np.arange(total, dtype=np.int64), n_nodes - 1)
+    else:
+        rng = np.random.default_rng(seed)
+        flat = np.unique(rng.integers(0, total, size=sample))
+        while len(flat) < sample:
+            flat = np.unique(np.concatenate([flat, rng.integers(0, total, size=sample)]))
+        flat = rng.permutation(flat)[:sample]
+        s, g = np.divmod(flat, n_nodes - 1)
+    g = g + (g >= s)
+    return np.column_stack([s, g])
+
+
+def run_sweep(graph, pairs: np.ndarray = None, sample: int = None,
+              algorithms: Sequence[str] = None, workers: int = None,
+              chunk_size: int = None, seed: int = 0) -> pd.DataFrame:
+    """
+    Jalankan setiap algoritma pada setiap pasangan. graph: graf networkx,
+    JakartaWaterwaysNetwork, CSRGraph atau path file graf (graph_file; worker
+    membuka file dengan memmap alih-alih shared memory). pairs: array (k, 2) node id;
+    default semua pasangan (atau `sample` pasangan acak). algorithms: nama
+    method; default semua SWEEP_ALGORITHMS (Floyd-Warshall dilewati di atas
+    FLOYD_NODE_LIMIT node).
+
+    Mengembalikan DataFrame satu baris per (pasangan, algoritma) dengan
+    kolom Cost, Optimal Cost (Dijkstra), Gap (%), Hops, Iterations dan
+    Runtime (ms). Statistik sweep ada di df.attrs['stats'].
+    """
+    graph_path = graph if isinstance(graph, str) else None
+    if graph_path:
+        graph = open_graph(graph_path)
+    elif hasattr(graph, 'to_csr'):
+        graph = graph.to_csr()
+    csr = graph if isinstance(graph, CSRGraph) else CSRGraph.from_networkx(graph)
+    if algorithms is None:
+        algorithms = [method for _, method in SWEEP_ALGORITHMS
+                      if method != 'floyd_warshall' or csr.n_nodes <= FLOYD_NODE_LIMIT]
+    methods = list(algorithms)
+    labels = dict((method, label) for label, method in SWEEP_ALGORITHMS)
+    unknown = [method for method in methods if method not in labels]
+    if unknown:
+        raise ValueError(f"Unknown algorithms: {unknown}")
+    # Dijkstra selalu dijalankan sebagai referensi optimal
+    run_methods = methods if 'dijkstra' in methods else methods + ['dijkstra']
+
+    if pairs is None:
+        pair_ids = sample_pairs(csr.n_nodes, sample, seed)
+    else:
+        index = csr.index
+        pair_ids = np.asarray([(index[s], index[g]) for s, g in pairs],
+                              dtype=np.int64).reshape(-1, 2)
+    workers = workers or os.cpu_count() or 1
+    if chunk_size is None:
+        chunk_size = max(1, -(-len(pair_ids) // (workers * 8)))
+    chunks = [pair_ids[i:i + chunk_size] for i in range(0, len(pair_ids), chunk_size)]
+
+    t0 = time.perf_counter()
+    shared = SharedGraph(csr) if graph_path is None else None
+    layout = shared.layout if shared is not None else {'path': graph_path}
+    try:
+        with ProcessPoolExecutor(workers, initializer=_init_worker,
+                                 initargs=(layout, run_methods)) as pool:
+            results = list(pool.map(_run_pairs, chunks, [run_methods] * len(chunks)))
+    finally:
+        if shared is not None:
+            shared.close()
+    seconds = time.perf_counter() - t0
+
+    df = pd.DataFrame(
+        [record for records in results for record in records],
+        columns=['s', 'g', 'method', 'Cost', 'Hops', 'Iterations', 'Runtime (ms)', 'Worker'])
+    optimal = df[df['method'] == 'dijkstra'].set_index(['s', 'g'])['Cost']
+    df = df[df['method'].isin(methods)].reset_index(drop=True)
+    df['Optimal Cost'] = optimal.reindex(pd.MultiIndex.from_frame(df[['s', 'g']])).to_numpy()
+    with np.errstate(divide='ignore', invalid='ignore'):
+        gap = np.where(df['Cost'] == df['Optimal Cost'], 0.0,
+                       (df['Cost'] - df['Optimal Cost']) / df['Optimal Cost'] * 100)
+    df['Gap (%)'] = gap
+
+    node_ids = np.asarray(csr.node_ids, dtype=object)
+    df.insert(0, 'Start', node_ids[df['s'].to_numpy()])
+    df.insert(1, 'Goal', node_ids[df['g'].to_numpy()])
+    df.insert(2, 'Algorithm', df['method'].map(labels))
+    df = df.drop(columns=['s', 'g', 'method'])
+    df.attrs['stats'] = {
+        'nodes': csr.n_nodes,
+        'arcs': csr.n_arcs,
+        'pairs': len(pair_ids),
+        'algorithms': len(methods),
+        'workers': workers,
+        'tasks': len(chunks),
+        'seconds': seconds,
+        'pairs_per_second': len(pair_ids) / seconds if seconds else 0.0,
+    }
+    return df
+
+
+def summarize_sweep(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Distribusi per algoritma: persentase rute ditemukan/optimal, gap
+    (mean/p95/max, hanya rute yang ditemukan), iterations dan runtime.
+    """
+    rows = []
+    order = [label for label, _ in SWEEP_ALGORITHMS]
+    for label, group in sorted(df.groupby('Algorithm'), key=lambda item: order.index(item[0])):
+        reachable = np.isfinite(group['Optimal Cost'])
+        found = np.isfinite(group['Cost']) & reachable
+        gap = group.loc[found, 'Gap (%)']
+        runtime = group['Runtime (ms)']
+        iterations = group['Iterations']
+        rows.append({
+            'Algorithm': label,
+            'Pairs': len(group),
+            'Found (%)': round(found.sum() / max(reachable.sum(), 1) * 100, 1),
+            'Optimal (%)': round((gap <= 1e-9).sum() / max(reachable.sum(), 1) * 100, 1),
+            'Gap Mean (%)': round(gap.mean(), 2) if len(gap) else np.nan,
+            'Gap P95 (%)': round(gap.quantile(0.95), 2) if len(gap) else np.nan,
+            'Gap Max (%)': round(gap.max(), 2) if len(gap) else np.nan,
+            'Iter Median': iterations.median(),
+            'Iter P95': iterations.quantile(0.95),
+            'Runtime Median (ms)': round(runtime.median(), 3),
+            'Runtime P95 (ms)': round(runtime.quantile(0.95), 3),
+            'Runtime Max (ms)': round(runtime.max(), 3),
+        })
+    return pd.DataFrame(rows)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="All-pairs routing scenario sweep")
+    parser.add_argument('--sample', type=int, default=None,
+                        help="jumlah pasangan acak (default: semua pasangan)")
+    parser.add_argument('--workers', type=int, default=None)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--output', default='csv/ambulance_routing_sweep.csv')
+    parser.add_argument('--graph', default=None,
+                        help="file graf biner (graph_file); default jaringan Jakarta")
+    args = parser.parse_args()
+
+    print("=" * 80)
+    print("SCENARIO SWEEP - JAKARTA WATERWAYS")
+    print("=" * 80)
+    df = run_sweep(args.graph or JakartaWaterwaysNetwork(), sample=args.sample, workers=args.workers,
+                   seed=args.seed)
+    stats = df.attrs['stats']
+    print(f"\n{stats['pairs']} pairs x {stats['algorithms']} algorithms on "
+          f"{stats['workers']} workers: {stats['seconds']:.2f}s")
+    print(summarize_sweep(df).to_string(index=False))
+
+    df.to_csv(args.output, index=False)
+    print(f"\nResults saved to: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,236 @@
+"""
+Synthetic Waterways - Jakarta Waterways
+=======================================
+Generator seeded untuk jaringan waterways sintetis berbentuk koridor pesisir,
+dari 10^2 sampai 10^7 node. Hasilnya NetworkTables (lihat bulk_loader), jadi
+bisa langsung dikompilasi ke CSRGraph, dibungkus JakartaWaterwaysNetwork atau
+ditulis ke file graf biner, tanpa membangun graf networkx.
+
+Model jaringan:
+    - Lattice width x length: baris 0 adalah garis pantai, baris berikutnya
+      makin ke darat (selatan). Garis pantai berkelok (jumlah beberapa
+      sinusoida per kolom) dan posisi node di-jitter, tapi edge hanya ke
+      tetangga lattice + satu diagonal per sel sehingga graf tetap planar.
+    - Spanning tree acak (setiap node terhubung ke tetangga kiri atau atas)
+      menjamin graf terhubung; ruas lattice lain dibuka dengan peluang
+      canal_density.
+    - Dermaga di garis pantai setiap dermaga_every kolom, rumah sakit satu per
+      hospital_every kolom di baris darat acak.
+    - distance = haversine x faktor kelok sungai, time = distance / kecepatan
+      kelas ruas (laut pesisir > kanal > sungai) dengan noise, dibulatkan ke
+      menit integer seperti data Jakarta. weight = time.
+
+Node dan edge dibangkitkan per blok kolom dengan RNG per blok, jadi memori
+sementara dibatasi dan hasilnya hanya bergantung pada parameter + seed.
+
+Cara menjalankan:
+    python synthetic_waterways.py 1000000 --graph csv/synthetic.wgraph
+    python synthetic_waterways.py 10000 --csv csv/synthetic
+
+Contoh:
+    tables = generate_waterways(1_000_000, seed=7)
+    csr = tables.to_csr()
+    network = synthetic_network(500, seed=7)    # JakartaWaterwaysNetwork
+"""
+
+import argparse
+import os
+
+import numpy as np
+import pandas as pd
+
+from bulk_loader import NetworkTables, _Column
+from water_ambulance_routing import (EARTH_RADIUS_M, JakartaWaterwaysNetwork, NodeIdTable,
+                                     _haversine_m, _index_dtype)
+
+TYPE_LABELS = ('waypoint', 'dermaga', 'hospital')
+TYPE_PREFIXES = (b'W', b'D', b'H')
+
+# Titik awal garis pantai (sekitar Muara Angke) dan jarak antar node lattice
+ORIGIN_LAT, ORIGIN_LON = -6.10, 106.60
+SPACING_M = 500.0
+JITTER = 0.25                   # fraksi spacing, < 0.5 agar sel tetap konveks
+
+# Kecepatan dasar per kelas ruas (meter/menit)
+COAST_SPEED = 250.0             # jalur laut sepanjang pantai
+CANAL_SPEED = 150.0             # kanal sejajar pantai dan diagonal
+RIVER_SPEED = 120.0             # sungai tegak lurus pantai (melawan arus)
+SPEED_NOISE = 0.15              # sigma lognormal
+MEANDER = 0.08                  # rata-rata kelebihan panjang ruas vs garis lurus
+
+COASTAL_ASPECT = 8              # koridor default: length ~ 8 x width
+CHUNK_NODES = 1 << 20
+
+# ============================================================================
+# HELPERS
+# ============================================================================
+
+def _node_id_table(type_codes: np.ndarray) -> NodeIdTable:
+    """
+    Id prefix tipe + nomor urut per tipe (W1, D1, H1, ...) langsung sebagai
+    NodeIdTable: digit ditulis ke matriks byte lebar tetap, tanpa objek str.
+    """
+    n = len(type_codes)
+    numbers = np.zeros(n, dtype=np.int64)
+    for code in range(len(TYPE_PREFIXES)):
+        mask = type_codes == code
+        numbers[mask] = np.arange(1, int(mask.sum()) + 1)
+
+    powers = 10 ** np.arange(19, dtype=np.int64)
+    digits = np.searchsorted(powers, numbers, side='right')
+    width = 1 + int(digits.max(initial=1))
+    chars = np.zeros((n, width), dtype=np.uint8)
+    chars[:, 0] = np.frombuffer(b''.join(TYPE_PREFIXES), dtype=np.uint8)[type_codes]
+    for j in range(width - 1):
+        valid = j < digits
+        place = powers[np.where(valid, digits - 1 - j, 0)]
+        chars[:, j + 1] = np.where(valid, 48 + numbers // place % 10, 0)
+
+    lengths = 1 + digits
+    offsets = np.zeros(n + 1, dtype=np.int64)
+    np.cumsum(lengths, out=offsets[1:])
+    blob = chars[np.arange(width) < lengths[:, None]]
+    # Padding nol mengurutkan id pendek lebih dulu, sama seperti urutan str
+    order = np.argsort(chars.view(f'S{width}').ravel(), kind='stable')
+    return NodeIdTable(offsets, blob, order.astype(_index_dtype(n)))
+
+
+def _coast_offset(length: int, rng: np.random.Generator) -> np.ndarray:
+    """Pergeseran latitude garis pantai per kolom (derajat)"""
+    columns = np.arange(length)
+    offset = np.zeros(length)
+    for period, amplitude in ((600, 6.0), (150, 2.0), (40, 0.6)):
+        phase = rng.uniform(0, 2 * np.pi)
+        offset += amplitude * rng.uniform(0.5, 1.0) * np.sin(2 * np.pi * columns / period + phase)
+    return offset * SPACING_M / (EARTH_RADIUS_M * np.pi / 180)
+
+
+def _blocks(n: int, width: int):
+    """Rentang node [lo, hi) per blok kolom utuh (maks ~CHUNK_NODES node)"""
+    step = max(1, CHUNK_NODES // width) * width
+    for block, lo in enumerate(range(0, n, step)):
+        yield block, lo, min(lo + step, n)
+
+# ============================================================================
+# GENERATOR
+# ============================================================================
+
+def generate_waterways(n_nodes: int, width: int = None, canal_density: float = 0.85,
+                       diagonal: float = 0.05, dermaga_every: int = 40,
+                       hospital_every: int = 60, seed: int = 0) -> NetworkTables:
+    """
+    Bangkitkan jaringan koridor pesisir dengan n_nodes node.
+
+    width: jumlah baris dari pantai ke darat (default ~sqrt(n / 8)).
+    canal_density: peluang ruas lattice di luar spanning tree dibuka.
+    diagonal: peluang sel lattice punya kanal diagonal.
+    """
+    if n_nodes < 1:
+        raise ValueError("n_nodes must be positive")
+    if width is None:
+        width = max(1, round(np.sqrt(n_nodes / COASTAL_ASPECT)))
+    width = min(width, n_nodes)
+    length = -(-n_nodes // width)
+    layout = np.random.default_rng([seed, 0])
+
+    # Node: posisi lattice + pantai berkelok + jitter, lalu tipe
+    coast = _coast_offset(length, layout)
+    m_per_deg_lat = EARTH_RADIUS_M * np.pi / 180
+    m_per_deg_lon = m_per_deg_lat * np.cos(np.radians(ORIGIN_LAT))
+    lat = np.empty(n_nodes)
+    lon = np.empty(n_nodes)
+    for block, lo, hi in _blocks(n_nodes, width):
+        rng = np.random.default_rng([seed, 1, block])
+        c, r = np.divmod(np.arange(lo, hi), width)
+        jitter = rng.uniform(-JITTER, JITTER, size=(2, hi - lo)) * SPACING_M
+        lat[lo:hi] = ORIGIN_LAT + coast[c] - (r * SPACING_M + jitter[0]) / m_per_deg_lat
+        lon[lo:hi] = ORIGIN_LON + (c * SPACING_M + jitter[1]) / m_per_deg_lon
+
+    type_codes = np.zeros(n_nodes, dtype=np.int8)
+    type_codes[np.arange(0, length, dermaga_every) * width] = 1
+    columns = np.arange(min(hospital_every // 2, length - 1), length, hospital_every)
+    inland = layout.integers(1, width, size=len(columns)) if width > 1 else 0
+    hospitals = columns * width + inland
+    hospitals = hospitals[hospitals < n_nodes]
+    type_codes[hospitals[type_codes[hospitals] == 0]] = 2
+
+    # Edge: spanning tree (kiri/atas) + ruas lattice lain + diagonal, per blok
+    id_dtype = _index_dtype(n_nodes)
+    capacity = int(n_nodes * (1 + canal_density + diagonal))
+    sources, targets = _Column(capacity, id_dtype), _Column(capacity, id_dtype)
+    distances, times = _Column(capacity, np.float64), _Column(capacity, np.float64)
+    rad_lat, rad_lon = np.radians(lat), np.radians(lon)
+    for block, lo, hi in _blocks(n_nodes, width):
+        rng = np.random.default_rng([seed, 2, block])
+        node = np.arange(lo, hi)
+        c, r = np.divmod(node, width)
+        draws = rng.random((4, hi - lo))
+        choose_left = (r == 0) | ((c > 0) & (draws[0] < 0.5))
+        keep = np.column_stack([
+            (c > 0) & (choose_left | (draws[1] < canal_density)),
+            (r > 0) & (~choose_left | (draws[2] < canal_density)),
+            (c > 0) & (r > 0) & (draws[3] < diagonal),
+        ])
+        neighbor = node[:, None] - np.array([width, 1, width + 1])
+        base_speed = np.column_stack([np.where(r == 0, COAST_SPEED, CANAL_SPEED),
+                                      np.full(hi - lo, RIVER_SPEED),
+                                      np.full(hi - lo, CANAL_SPEED)])
+        u = np.broadcast_to(node[:, None], keep.shape)[keep]
+        v, speed = neighbor[keep], base_speed[keep]
+
+        span = _haversine_m(rad_lat[u], rad_lon[u], rad_lat[v], rad_lon[v])
+        distance = np.round(span * (1 + rng.exponential(MEANDER, size=len(u))))
+        speed = speed * rng.lognormal(0, SPEED_NOISE, size=len(u))
+        sources.extend(u)
+        targets.extend(v)
+        distances.extend(np.maximum(distance, 1))
+        times.extend(np.maximum(1, np.round(distance / speed)))
+
+    times = times.finish()
+    return NetworkTables(_node_id_table(type_codes), None, type_codes, TYPE_LABELS, lat, lon,
+                         sources.finish(), targets.finish(), distances.finish(), times, times)
+
+
+def synthetic_network(n_nodes: int, **kwargs) -> JakartaWaterwaysNetwork:
+    """JakartaWaterwaysNetwork di atas tabel sintetis (graf networkx dibangun lazy)"""
+    return JakartaWaterwaysNetwork(generate_waterways(n_nodes, **kwargs))
+
+
+def write_csv(tables: NetworkTables, directory: str):
+    """Tulis tabel dalam format csv/waterways_nodes.csv + csv/waterways_edges.csv"""
+    os.makedirs(directory, exist_ok=True)
+    ids = np.asarray(list(tables.node_ids), dtype=object)
+    pd.DataFrame({'Id': ids, 'Label': ids if tables.names is None else tables.names,
+                  'Type': np.asarray(tables.type_labels, dtype=object)[tables.type_codes],
+                  'Latitude': tables.lat, 'Longitude': tables.lon}).to_csv(
+        os.path.join(directory, 'waterways_nodes.csv'), index=False)
+    pd.DataFrame({'Source': ids[tables.sources], 'Target': ids[tables.targets],
+                  'Type': 'Undirected', 'Distance': tables.distances, 'Time': tables.times,
+                  'Weight': tables.weights}).to_csv(
+        os.path.join(directory, 'waterways_edges.csv'), index=False)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate a synthetic coastal waterway network")
+    parser.add_argument('nodes', type=int)
+    parser.add_argument('--width', type=int, default=None)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--graph', help="write a binary graph file (.wgraph)")
+    parser.add_argument('--csv', help="directory for waterways_nodes.csv / waterways_edges.csv")
+    args = parser.parse_args()
+
+    tables = generate_waterways(args.nodes, width=args.width, seed=args.seed)
+    counts = np.bincount(tables.type_codes, minlength=len(TYPE_LABELS))
+    print(f"{tables} - " + ", ".join(f"{label}: {count}"
+                                      for label, count in zip(TYPE_LABELS, counts)))
+    if args.graph:
+        from graph_file import write_graph
+        write_graph(tables.to_csr(), args.graph)
+        print(f"Saved: {args.graph}")
+    if args.csv:
+        write_csv(tables, args.csv)
+        print(f"Saved: {args.csv}/waterways_nodes.csv, {args.csv}/waterways_edges.csv")
+
+
+if __name__ == "__main__":
+    main()
@@ -12,26 +12,122 @@ import numpy as np
 import networkx as nx
 import matplotlib.pyplot as plt
 import plotly.graph_objects as go
+from bisect import bisect_left
 from collections import deque
+from collections.abc import Mapping, Sequence
+import functools
 import heapq
 import time
-from typing import Dict, List, Tuple, Set
+from typing import Dict, List, Optional, Tuple, Set
 import warnings
 warnings.filterwarnings('ignore')
 
+from priority_queues import make_queue, PRIORITY_QUEUES
+
 # ============================================================================
 # JAKARTA WATERWAYS NETWORK - GRAPH DEFINITION
 # ============================================================================
 
+class _TrackedDict(dict):
+    """Dict atribut node/edge yang menaikkan versi graf pemiliknya saat diubah"""
+    
+    def __init__(self, owner, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._owner = owner
+
+
+class VersionedGraph(nx.Graph):
+    """
+    nx.Graph dengan counter version yang naik pada setiap mutasi: tambah/hapus
+    node atau edge, maupun perubahan atribut seperti G[u][v]['weight'] = x.
+    Cache routing memakai version untuk mendeteksi hasil yang sudah basi.
+    """
+    
+    def __init__(self, incoming_graph_data=None, **attr):
+        self.version = 0
+        self.node_attr_dict_factory = functools.partial(_TrackedDict, self)
+        self.edge_attr_dict_factory = functools.partial(_TrackedDict, self)
+        super().__init__(incoming_graph_data, **attr)
+    
+    def _bump(self):
+        self.version += 1
+
+
+def _bumps_version(method):
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        result = method(self, *args, **kwargs)
+        # _owner belum ada selama unpickling dict (item diisi sebelum __dict__)
+        owner = getattr(self, '_owner', None) if isinstance(self, _TrackedDict) else self
+        if owner is not None:
+            owner._bump()
+        return result
+    return wrapper
+
+
+for _name in ('__setitem__', '__delitem__', '__ior__', 'update', 'pop',
+              'popitem', 'clear', 'setdefault'):
+    setattr(_TrackedDict, _name, _bumps_version(getattr(dict, _name)))
+
+for _name in ('add_node', 'add_nodes_from', 'remove_node', 'remove_nodes_from',
+              'add_edge', 'add_edges_from', 'add_weighted_edges_from',
+              'remove_edge', 'remove_edges_from', 'update', 'clear', 'clear_edges'):
+    setattr(VersionedGraph, _name, _bumps_version(getattr(nx.Graph, _name)))
+
+
 class JakartaWaterwaysNetwork:
     """
     Representasi jaringan jalur perairan Jakarta untuk ambulans air.
     Mencakup dermaga, rumah sakit, dan rute air antar lokasi.
+
+    tables (opsional): NetworkTables hasil bulk load (lihat bulk_loader).
+    Untuk jaringan bulk, to_csr() dikompilasi langsung dari kolom NumPy dan
+    graf networkx G baru dibangun saat pertama kali diakses.
     """
     
-    def __init__(self):
-        self.G = nx.Graph()
-        self._build_network()
+    def __init__(self, tables=None):
+        self.tables = tables
+        self._csr = None
+        self._tables_version = None
+        if tables is None:
+            self._G = VersionedGraph()
+            self._build_network()
+        else:
+            self._G = None
+    
+    @classmethod
+    def from_csv(cls, nodes_path: str = 'csv/waterways_nodes.csv',
+                 edges_path: str = 'csv/waterways_edges.csv',
+                 chunksize: int = None) -> 'JakartaWaterwaysNetwork':
+        """Jaringan dari CSV node/edge (format csv/waterways_*.csv) lewat bulk loader"""
+        from bulk_loader import DEFAULT_CHUNKSIZE, NetworkTables
+        return cls(NetworkTables.from_csv(nodes_path, edges_path,
+                                          chunksize or DEFAULT_CHUNKSIZE))
+    
+    @property
+    def G(self) -> 'VersionedGraph':
+        if self._G is None:
+            self._G = self._graph_from_tables()
+            self._tables_version = self._G.version
+        return self._G
+    
+    def _graph_from_tables(self) -> 'VersionedGraph':
+        """Graf networkx dari NetworkTables dengan add_*_from sekali jalan"""
+        t = self.tables
+        ids = np.asarray(list(t.node_ids), dtype=object)
+        names = ids.tolist() if t.names is None else t.names.tolist()
+        types = np.asarray(t.type_labels, dtype=object)[t.type_codes]
+        G = VersionedGraph()
+        G.add_nodes_from(
+            (node, {'name': name, 'type': node_type, 'lat': lat, 'lon': lon})
+            for node, name, node_type, lat, lon in zip(
+                ids.tolist(), names, types.tolist(), t.lat.tolist(), t.lon.tolist()))
+        G.add_edges_from(
+            (u, v, {'distance': distance, 'time': time_min, 'weight': weight})
+            for u, v, distance, time_min, weight in zip(
+                ids[t.sources].tolist(), ids[t.targets].tolist(), t.distances.tolist(),
+                t.times.tolist(), t.weights.tolist()))
+        return G
     
     def _build_network(self):
         """Membangun graf jaringan waterways Jakarta dengan lokasi riil"""
@@ -118,6 +214,23 @@ class JakartaWaterwaysNetwork:
         """Mendapatkan informasi lengkap edge"""
         return self.G[source][target]
     
+    @property
+    def version(self) -> int:
+        """Versi graf; naik setiap kali node/edge atau atributnya berubah"""
+        return self._G.version if self._G is not None else 0
+    
+    def to_csr(self) -> 'CSRGraph':
+        """
+        Snapshot CSR immutable dari graf untuk algoritma routing. Jaringan
+        bulk memakai CSR dari tabel selama G belum pernah diubah.
+        """
+        if self.tables is not None and (self._G is None
+                                        or self._G.version == self._tables_version):
+            if self._csr is None:
+                self._csr = self.tables.to_csr()
+            return self._csr
+        return CSRGraph.from_networkx(self.G)
+    
     def visualize_network(self, path=None, title="Jakarta Waterways Network"):
         """Visualisasi network dengan Plotly (interactive) - Enhanced dengan annotations"""
         
@@ -333,296 +446,1436 @@ class JakartaWaterwaysNetwork:
         
         return fig
 
+# ============================================================================
+# CSR GRAPH SNAPSHOT
+# ============================================================================
+
+def _index_dtype(n: int):
+    """Dtype integer terkecil yang cukup untuk menampung id node/edge"""
+    return np.int32 if n < np.iinfo(np.int32).max else np.int64
+
+
+def _require_integer_keys(queue: str, values: np.ndarray):
+    """Dial/radix queue hanya valid untuk key integer non-negatif"""
+    values = np.asarray(values)
+    finite = values[np.isfinite(values)]
+    if np.any(finite < 0) or not np.array_equal(finite, np.round(finite)):
+        raise ValueError(f"'{queue}' queue requires non-negative integer keys "
+                         "(integer weights and, for A*, an integer heuristic such as 'alt')")
+
+
+EARTH_RADIUS_M = 6371000.0
+
+
+def _haversine_m(lat1, lon1, lat2, lon2):
+    """Jarak great-circle (meter) antar koordinat dalam radian, vectorized"""
+    a = (np.sin((lat2 - lat1) / 2) ** 2
+         + np.cos(lat1) * np.cos(lat2) * np.sin((lon2 - lon1) / 2) ** 2)
+    return 2 * EARTH_RADIUS_M * np.arcsin(np.sqrt(np.clip(a, 0, 1)))
+
+
+class NodeIdTable(Sequence):
+    """
+    Node id string yang disimpan sebagai satu blob UTF-8 + offsets (mis. view
+    memmap dari file graf). Id di-decode saat diakses dan lookup id -> integer
+    memakai binary search di atas permutasi terurut (order), sehingga tidak
+    perlu membangun list/dict berukuran n saat graf dibuka.
+    """
+    
+    def __init__(self, offsets: np.ndarray, blob: np.ndarray, order: np.ndarray):
+        self.offsets = offsets
+        self.blob = blob
+        self.order = order
+    
+    @classmethod
+    def from_ids(cls, node_ids) -> 'NodeIdTable':
+        node_ids = list(node_ids)
+        if not all(isinstance(node, str) for node in node_ids):
+            raise TypeError("NodeIdTable only supports string node ids")
+        encoded = [node.encode('utf-8') for node in node_ids]
+        offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+        np.cumsum([len(e) for e in encoded], out=offsets[1:])
+        blob = np.frombuffer(b''.join(encoded), dtype=np.uint8)
+        order = np.argsort(np.asarray(node_ids, dtype=str), kind='stable') if node_ids \
+            else np.empty(0, dtype=np.int64)
+        return cls(offsets, blob, order.astype(_index_dtype(len(node_ids))))
+    
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+    
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self[j] for j in range(*i.indices(len(self)))]
+        if i < 0:
+            i += len(self)
+        return self.blob[self.offsets[i]:self.offsets[i + 1]].tobytes().decode('utf-8')
+    
+    @property
+    def index_map(self) -> '_NodeIdIndex':
+        return _NodeIdIndex(self)
+
+
+class _NodeIdIndex(Mapping):
+    """Mapping node id -> integer id di atas NodeIdTable (binary search)"""
+    
+    def __init__(self, table: NodeIdTable):
+        self.table = table
+        self._sorted = _SortedIds(table)
+    
+    def __getitem__(self, node) -> int:
+        try:
+            pos = bisect_left(self._sorted, node)
+        except TypeError:
+            raise KeyError(node) from None
+        if pos < len(self._sorted) and self._sorted[pos] == node:
+            return int(self.table.order[pos])
+        raise KeyError(node)
+    
+    def __len__(self) -> int:
+        return len(self.table)
+    
+    def __iter__(self):
+        return iter(self.table)
+
+
+class _SortedIds:
+    def __init__(self, table: NodeIdTable):
+        self.table = table
+    
+    def __len__(self) -> int:
+        return len(self.table)
+    
+    def __getitem__(self, k: int) -> str:
+        return self.table[int(self.table.order[k])]
+
+
+class CSRGraph:
+    """
+    Snapshot immutable graf dalam format CSR (Compressed Sparse Row).
+    Node diberi id integer 0..n-1; adjacency disimpan sebagai array NumPy
+    indptr/indices dengan kolom weight, time, dan distance per arc.
+    Graf undirected menyimpan setiap edge sebagai dua arc.
+    """
+    
+    def __init__(self, node_ids, indptr, indices, weights, times=None,
+                 distances=None, lat=None, lon=None, type_codes=None,
+                 type_labels=(), directed: bool = False):
+        n = len(node_ids)
+        # NodeIdTable (mis. dari file graf memmap) dipakai apa adanya tanpa decode
+        self.node_ids = node_ids if isinstance(node_ids, NodeIdTable) else list(node_ids)
+        self.directed = directed
+        self.indptr = np.ascontiguousarray(indptr, dtype=np.int64)
+        self.indices = np.ascontiguousarray(indices, dtype=_index_dtype(n))
+        self.weights = np.ascontiguousarray(weights, dtype=np.float64)
+        self.times = (self.weights if times is None
+                      else np.ascontiguousarray(times, dtype=np.float64))
+        self.distances = (np.zeros_like(self.weights) if distances is None
+                          else np.ascontiguousarray(distances, dtype=np.float64))
+        self.lat = (np.full(n, np.nan) if lat is None
+                    else np.ascontiguousarray(lat, dtype=np.float64))
+        self.lon = (np.full(n, np.nan) if lon is None
+                    else np.ascontiguousarray(lon, dtype=np.float64))
+        self.type_codes = (np.zeros(n, dtype=np.int8) if type_codes is None
+                           else np.ascontiguousarray(type_codes, dtype=np.int8))
+        self.type_labels = tuple(type_labels)
+        
+        for arr in (self.indptr, self.indices, self.weights, self.times,
+                    self.distances, self.lat, self.lon, self.type_codes):
+            arr.setflags(write=False)
+        
+        self._index = None
+        self._lists = None
+        self._tails = None
+        self._reverse = None
+    
+    @classmethod
+    def from_arcs(cls, node_ids, sources, targets, weights, times=None,
+                  distances=None, directed: bool = False, **node_attrs) -> 'CSRGraph':
+        """
+        Membangun CSR dari array arc (sudah lengkap dua arah untuk graf
+        undirected). Urutan arc per node dipertahankan (stable sort).
+        """
+        n = len(node_ids)
+        sources = np.asarray(sources, dtype=np.int64)
+        order = np.argsort(sources, kind='stable')
+        indptr = np.zeros(n + 1, dtype=np.int64)
+        np.cumsum(np.bincount(sources, minlength=n), out=indptr[1:])
+        
+        def take(col):
+            return None if col is None else np.asarray(col)[order]
+        
+        return cls(node_ids, indptr, np.asarray(targets)[order],
+                   np.asarray(weights)[order], take(times), take(distances),
+                   directed=directed, **node_attrs)
+    
+    @classmethod
+    def from_edges(cls, node_ids, sources, targets, weights, times=None,
+                   distances=None, directed: bool = False, **node_attrs) -> 'CSRGraph':
+        """Membangun CSR dari edge list; edge undirected dicerminkan jadi dua arc"""
+        if not directed:
+            def mirror(col):
+                return None if col is None else np.concatenate([col, col])
+            sources, targets = (np.concatenate([sources, targets]),
+                                np.concatenate([targets, sources]))
+            weights, times, distances = mirror(weights), mirror(times), mirror(distances)
+        return cls.from_arcs(node_ids, sources, targets, weights, times,
+                             distances, directed=directed, **node_attrs)
+    
+    @classmethod
+    def from_networkx(cls, G: nx.Graph) -> 'CSRGraph':
+        """Kompilasi graf networkx (mis. JakartaWaterwaysNetwork.G) menjadi CSR"""
+        node_ids = list(G.nodes())
+        index = {node: i for i, node in enumerate(node_ids)}
+        
+        # Iterasi G.adj menghasilkan arc dua arah dengan urutan tetangga
+        # yang sama seperti networkx
+        sources, targets, weights, times, distances = [], [], [], [], []
+        for u, nbrs in G.adj.items():
+            for v, data in nbrs.items():
+                sources.append(index[u])
+                targets.append(index[v])
+                weights.append(data.get('weight', 1))
+                times.append(data.get('time', data.get('weight', 1)))
+                distances.append(data.get('distance', 0))
+        
+        type_labels = []
+        type_codes = []
+        for node in node_ids:
+            label = G.nodes[node].get('type', '')
+            if label not in type_labels:
+                type_labels.append(label)
+            type_codes.append(type_labels.index(label))
+        
+        csr = cls.from_arcs(
+            node_ids, sources, targets, weights, times, distances,
+            directed=G.is_directed(),
+            lat=[G.nodes[node].get('lat', np.nan) for node in node_ids],
+            lon=[G.nodes[node].get('lon', np.nan) for node in node_ids],
+            type_codes=type_codes, type_labels=type_labels,
+        )
+        csr._index = index
+        return csr
+    
+    @property
+    def n_nodes(self) -> int:
+        return len(self.node_ids)
+    
+    @property
+    def n_arcs(self) -> int:
+        return len(self.indices)
+    
+    @property
+    def index(self) -> Dict:
+        """Mapping node id -> integer id"""
+        if self._index is None:
+            if isinstance(self.node_ids, NodeIdTable):
+                self._index = self.node_ids.index_map
+            else:
+                self._index = {node: i for i, node in enumerate(self.node_ids)}
+        return self._index
+    
+    @property
+    def tails(self) -> np.ndarray:
+        """Node asal untuk setiap arc (kebalikan dari indptr)"""
+        if self._tails is None:
+            self._tails = np.repeat(np.arange(self.n_nodes, dtype=self.indices.dtype),
+                                    np.diff(self.indptr))
+            self._tails.setflags(write=False)
+        return self._tails
+    
+    def adjacency_lists(self) -> Tuple[List[int], List[int], List[float]]:
+        """
+        Salinan Python list dari (indptr, indices, weights). Loop Python murni
+        jauh lebih cepat pada list dibanding indexing scalar array NumPy.
+        """
+        if self._lists is None:
+            self._lists = (self.indptr.tolist(), self.indices.tolist(),
+                           self.weights.tolist())
+        return self._lists
+    
+    def edge_arcs(self) -> np.ndarray:
+        """Index arc yang mewakili setiap edge satu kali (u <= v bila undirected)"""
+        if self.directed:
+            return np.arange(self.n_arcs)
+        return np.flatnonzero(self.tails <= self.indices)
+    
+    def reverse(self) -> 'CSRGraph':
+        """Graf transpose; untuk graf undirected adalah graf itu sendiri"""
+        if not self.directed:
+            return self
+        if self._reverse is None:
+            self._reverse = CSRGraph.from_arcs(
+                self.node_ids, self.indices, self.tails, self.weights,
+                self.times, self.distances, directed=True,
+                lat=self.lat, lon=self.lon, type_codes=self.type_codes,
+                type_labels=self.type_labels)
+            self._reverse._index = self._index
+            self._reverse._reverse = self
+        return self._reverse
+    
+    def node_type(self, u: int) -> str:
+        return self.type_labels[self.type_codes[u]] if self.type_labels else ''
+    
+    def nodes_of_type(self, label: str) -> np.ndarray:
+        """Integer id semua node dengan atribut type tertentu"""
+        if label not in self.type_labels:
+            return np.empty(0, dtype=self.indices.dtype)
+        return np.flatnonzero(self.type_codes == self.type_labels.index(label))
+    
+    def edge_weight(self, u: int, v: int, column: str = 'weights') -> float:
+        """Bobot arc u -> v (minimum bila ada arc paralel)"""
+        lo, hi = self.indptr[u], self.indptr[u + 1]
+        hits = np.flatnonzero(self.indices[lo:hi] == v)
+        if len(hits) == 0:
+            raise KeyError((self.node_ids[u], self.node_ids[v]))
+        return float(getattr(self, column)[lo + hits].min())
+    
+    def __repr__(self):
+        kind = 'directed' if self.directed else 'undirected'
+        return f"CSRGraph({self.n_nodes} nodes, {self.n_arcs} arcs, {kind})"
+
 # ============================================================================
 # ALGORITHM IMPLEMENTATIONS
 # ============================================================================
 
+class BatchRouteResult:
+    """
+    Hasil batch query. distances berbentuk array NumPy (1D untuk daftar
+    query, 2D sources x targets untuk many-to-many); path direkonstruksi
+    secara lazy dari shortest-path tree setiap source.
+    """
+    
+    def __init__(self, node_ids: List[str], starts: np.ndarray, goals: np.ndarray,
+                 distances: np.ndarray, trees: Dict[int, np.ndarray], iterations: int,
+                 shape: Tuple[int, ...] = None):
+        self.node_ids = node_ids
+        self.shape = shape if shape is not None else (len(starts),)
+        self.starts = starts
+        self.goals = goals
+        self.distances = distances.reshape(self.shape)
+        self.trees = trees
+        self.iterations = iterations
+    
+    def __len__(self) -> int:
+        return len(self.starts)
+    
+    def path(self, index) -> List[str]:
+        """Path untuk query ke-index (atau (i, j) pada hasil many-to-many)"""
+        k = np.ravel_multi_index(index, self.shape) if isinstance(index, tuple) else index
+        s, g = int(self.starts[k]), int(self.goals[k])
+        previous = self.trees[s]
+        if s != g and previous[g] == -1:
+            return []
+        
+        path = [g]
+        while path[-1] != s:
+            path.append(int(previous[path[-1]]))
+        path.reverse()
+        return [self.node_ids[i] for i in path]
+    
+    def paths(self) -> List[List[str]]:
+        """Rekonstruksi semua path sekaligus (urutan flat)"""
+        return [self.path(k) for k in range(len(self))]
+
+
 class RoutingAlgorithms:
-    """Implementasi 9 algoritma pencarian jalur untuk ambulans air"""
+    """
+    Implementasi 9 algoritma pencarian jalur untuk ambulans air.
+    Semua algoritma berjalan di atas snapshot CSRGraph; graf networkx
+    dikompilasi sekali saat inisialisasi.
+    """
     
-    def __init__(self, graph: nx.Graph):
+    def __init__(self, graph):
         self.graph = graph
+        self._csr = None
+        self._csr_version = None
+        self._apsp = None
+        self._johnson = None
+        self._landmarks = None
+        self._geometry = None
+        self._topological = None
+        self._unit = None
+        self.topological_fallback = None
+        self.refresh()
+    
+    @property
+    def csr(self) -> CSRGraph:
+        """
+        Snapshot CSR yang dipakai semua algoritma. Untuk VersionedGraph,
+        snapshot dikompilasi ulang otomatis begitu version graf berubah.
+        """
+        version = getattr(self.graph, 'version', None)
+        if version is not None and version != self._csr_version:
+            self.refresh()
+        return self._csr
+    
+    def refresh(self):
+        """Kompilasi ulang snapshot CSR setelah graf networkx berubah"""
+        if isinstance(self.graph, CSRGraph):
+            self._csr = self.graph
+        else:
+            self._csr_version = getattr(self.graph, 'version', None)
+            self._csr = CSRGraph.from_networkx(self.graph)
     
     def dfs(self, start: str, goal: str) -> Tuple[List[str], float, int]:
         """Depth-First Search"""
-        visited = set()
-        stack = [(start, [start])]
+        s, g = self.csr.index[start], self.csr.index[goal]
+        indptr, indices, _ = self.csr.adjacency_lists()
+        n = self.csr.n_nodes
+        visited = [False] * n
+        # Parent pointer menggantikan salinan path di setiap entry stack;
+        # path hanya direkonstruksi sekali saat goal ditemukan
+        parent = [-1] * n
+        stack = [(s, -1)]
         iterations = 0
         
         while stack:
             iterations += 1
-            node, path = stack.pop()
+            node, via = stack.pop()
             
-            if node == goal:
+            if node == g:
+                parent[g] = via
+                path = self._reconstruct_path(parent, s, g)
                 total_time = self._calculate_path_time(path)
-                return path, total_time, iterations
+                return self._to_ids(path), total_time, iterations
             
-            if node not in visited:
-                visited.add(node)
-                for neighbor in self.graph.neighbors(node):
-                    if neighbor not in visited:
-                        stack.append((neighbor, path + [neighbor]))
+            if not visited[node]:
+                visited[node] = True
+                parent[node] = via
+                for neighbor in indices[indptr[node]:indptr[node + 1]]:
+                    if not visited[neighbor]:
+                        stack.append((neighbor, node))
         
         return [], float('inf'), iterations
     
     def bfs(self, start: str, goal: str) -> Tuple[List[str], float, int]:
         """Breadth-First Search"""
-        visited = {start}
-        queue = deque([(start, [start])])
+        s, g = self.csr.index[start], self.csr.index[goal]
+        indptr, indices, _ = self.csr.adjacency_lists()
+        n = self.csr.n_nodes
+        visited = [False] * n
+        visited[s] = True
+        parent = [-1] * n
+        queue = deque([s])
         iterations = 0
         
         while queue:
             iterations += 1
-            node, path = queue.popleft()
+            node = queue.popleft()
             
-            if node == goal:
+            if node == g:
+                path = self._reconstruct_path(parent, s, g)
                 total_time = self._calculate_path_time(path)
-                return path, total_time, iterations
+                return self._to_ids(path), total_time, iterations
             
-            for neighbor in self.graph.neighbors(node):
-                if neighbor not in visited:
-                    visited.add(neighbor)
-                    queue.append((neighbor, path + [neighbor]))
+            for neighbor in indices[indptr[node]:indptr[node + 1]]:
+                if not visited[neighbor]:
+                    visited[neighbor] = True
+                    parent[neighbor] = node
+                    queue.append(neighbor)
         
         return [], float('inf'), iterations
     
-    def dijkstra(self, start: str, goal: str) -> Tuple[List[str], float, int]:
-        """Dijkstra's Algorithm"""
-        distances = {node: float('inf') for node in self.graph.nodes()}
-        distances[start] = 0
-        previous = {node: None for node in self.graph.nodes()}
-        pq = [(0, start)]
+    def dijkstra(self, start: str, goal: str, queue: str = 'heap') -> Tuple[List[str], float, int]:
+        """Dijkstra's Algorithm. queue: backend priority queue ('heap', 'dial', 'radix')"""
+        s, g = self.csr.index[start], self.csr.index[goal]
+        distances, previous, iterations = self._dijkstra_tree(s, goal=g, queue=queue)
+        
+        if distances[g] == float('inf'):
+            return [], float('inf'), iterations
+        
+        path = self._reconstruct_path(previous, s, g)
+        return self._to_ids(path), distances[g], iterations
+    
+    def k_shortest_paths(self, start: str, goal: str, k: int,
+                         max_detour: float = None) -> Tuple[List[Tuple[List[str], float]], int]:
+        """
+        Yen's k-shortest loopless paths: rute terbaik plus cadangan berurutan.
+        Spur search memakai loop _dijkstra_tree dengan mask node/arc terlarang,
+        hanya dimulai dari titik deviasi path sebelumnya (Lawler) dan dipangkas
+        oleh biaya kandidat yang sudah ada di heap.
+        max_detour (mis. 1.5) membuang rute yang lebih lama dari rasio itu
+        terhadap rute terbaik. Mengembalikan ([(path, total_time), ...], iterations).
+        """
+        s, g = self.csr.index[start], self.csr.index[goal]
+        indptr, indices, weights = self.csr.adjacency_lists()
+        distances, previous, iterations = self._dijkstra_tree(s, goal=g)
+        if k <= 0 or distances[g] == float('inf'):
+            return [], iterations
+        
+        limit = distances[g] * max_detour if max_detour is not None else float('inf')
+        
+        def prefix_costs(path):
+            costs = [0]
+            for u, v in zip(path, path[1:]):
+                costs.append(costs[-1] + min(weights[e] for e in range(indptr[u], indptr[u + 1])
+                                             if indices[e] == v))
+            return costs
+        
+        first = self._reconstruct_path(previous, s, g)
+        accepted = [(first, prefix_costs(first), 0)]
+        candidates = []
+        seen = {tuple(first)}
+        
+        while len(accepted) < k:
+            path, costs, deviation = accepted[-1]
+            for i in range(deviation, len(path) - 1):
+                spur, root = path[i], path[:i + 1]
+                
+                # Arc keluar dari spur node milik path terpilih dengan root yang sama
+                banned_arcs = set()
+                for other, _, _ in accepted:
+                    if len(other) > i + 1 and other[:i + 1] == root:
+                        banned_arcs.update(e for e in range(indptr[spur], indptr[spur + 1])
+                                           if indices[e] == other[i + 1])
+                
+                # Kandidat yang lebih mahal dari kandidat ke-(k - |accepted|)
+                # tidak akan pernah terpilih, jadi spur search dipangkas di sana
+                bound = limit
+                needed = k - len(accepted)
+                if len(candidates) >= needed:
+                    bound = min(bound, heapq.nsmallest(needed, candidates)[-1][0])
+                
+                spur_dist, spur_prev, spur_iterations = self._dijkstra_tree(
+                    spur, goal=g, banned_nodes=set(root[:-1]), banned_arcs=banned_arcs,
+                    limit=bound - costs[i])
+                iterations += spur_iterations
+                if spur_dist[g] == float('inf') or spur_dist[g] > bound - costs[i]:
+                    continue
+                
+                candidate = root[:-1] + self._reconstruct_path(spur_prev, spur, g)
+                key = tuple(candidate)
+                if key not in seen:
+                    seen.add(key)
+                    heapq.heappush(candidates, (costs[i] + spur_dist[g], key, i))
+            
+            if not candidates:
+                break
+            _, key, deviation = heapq.heappop(candidates)
+            path = list(key)
+            accepted.append((path, prefix_costs(path), deviation))
+        
+        return [(self._to_ids(path), costs[-1]) for path, costs, _ in accepted], iterations
+    
+    def _dijkstra_tree(self, s: int, goal: int = -1, csr: 'CSRGraph' = None,
+                       targets=None, banned_nodes=None, banned_arcs=None,
+                       limit: float = float('inf'), queue='heap') -> Tuple[List[float], List[int], int]:
+        """
+        Loop Dijkstra pada integer id. Tanpa goal, seluruh shortest-path tree
+        dari s dihitung; dengan targets, pencarian berhenti begitu semua
+        target sudah settled. csr dapat diganti (mis. graf reverse).
+        banned_nodes/banned_arcs (set id) mengecualikan node/arc tanpa
+        menyalin graf; pencarian berhenti setelah jarak melewati limit.
+        queue: nama backend atau instance queue kosong dari priority_queues.
+        """
+        csr = self.csr if csr is None else csr
+        indptr, indices, weights = csr.adjacency_lists()
+        n = csr.n_nodes
+        distances = [float('inf')] * n
+        distances[s] = 0
+        previous = [-1] * n
+        pq = self._make_queue(queue, csr.weights)
+        push, pop = pq.push, pq.pop
+        push((0, s))
+        remaining = set(targets) if targets is not None else None
+        masked = banned_nodes is not None or banned_arcs is not None
+        banned_nodes = banned_nodes or ()
+        banned_arcs = banned_arcs or ()
         iterations = 0
         
         while pq:
             iterations += 1
-            current_dist, current = heapq.heappop(pq)
+            current_dist, current = pop()
             
             if current == goal:
-                path = self._reconstruct_path(previous, start, goal)
-                return path, current_dist, iterations
+                break
             
             if current_dist > distances[current]:
                 continue
             
-            for neighbor in self.graph.neighbors(current):
-                weight = self.graph[current][neighbor]['weight']
-                distance = current_dist + weight
+            if current_dist > limit:
+                break
+            
+            if remaining is not None:
+                remaining.discard(current)
+                if not remaining:
+                    break
+            
+            for e in range(indptr[current], indptr[current + 1]):
+                neighbor = indices[e]
+                distance = current_dist + weights[e]
                 
                 if distance < distances[neighbor]:
+                    if masked and (neighbor in banned_nodes or e in banned_arcs):
+                        continue
                     distances[neighbor] = distance
                     previous[neighbor] = current
-                    heapq.heappush(pq, (distance, neighbor))
+                    push((distance, neighbor))
         
-        return [], float('inf'), iterations
+        return distances, previous, iterations
+    
+    def _make_queue(self, queue, weights, potential: np.ndarray = None):
+        """
+        Queue kosong untuk satu pencarian. Backend integer (dial, radix)
+        divalidasi terhadap bobot (dan potential A*) yang membentuk key:
+        keduanya harus integer non-negatif.
+        """
+        if not isinstance(queue, str):
+            return queue
+        if queue not in PRIORITY_QUEUES:
+            raise ValueError(f"Unknown priority queue: {queue}")
+        if not PRIORITY_QUEUES[queue].integer_keys:
+            return make_queue(queue)
+        
+        weights = np.asarray(weights)
+        _require_integer_keys(queue, weights)
+        if potential is not None:
+            _require_integer_keys(queue, potential)
+        return make_queue(queue, int(weights.max()) if len(weights) else 1)
+    
+    def prepare_landmarks(self, k: int = 8, seed_node: str = None) -> List[str]:
+        """
+        Preprocessing ALT: pilih k landmark dengan farthest selection lalu
+        simpan jarak dari dan ke setiap landmark sebagai array NumPy (k, n).
+        """
+        csr = self.csr
+        k = min(k, csr.n_nodes)
+        current = csr.index[seed_node] if seed_node is not None else 0
+        reverse = csr.reverse()
+        
+        landmarks = []
+        dist_from = np.empty((k, csr.n_nodes))
+        dist_to = np.empty((k, csr.n_nodes))
+        closest = np.full(csr.n_nodes, np.inf)
+        
+        # Landmark pertama adalah node terjauh dari seed_node
+        seed_dist = np.array(self._dijkstra_tree(current)[0])
+        current = int(np.argmax(np.where(np.isfinite(seed_dist), seed_dist, -1)))
+        
+        for i in range(k):
+            landmarks.append(current)
+            dist_from[i] = self._dijkstra_tree(current)[0]
+            dist_to[i] = self._dijkstra_tree(current, csr=reverse)[0]
+            closest = np.minimum(closest, dist_from[i])
+            # Node yang belum terjangkau (inf) diprioritaskan: komponen lain
+            closest[landmarks] = -1
+            current = int(np.argmax(closest))
+        
+        dist_from.setflags(write=False)
+        dist_to.setflags(write=False)
+        self._landmarks = (csr, np.array(landmarks), dist_from, dist_to)
+        return self._to_ids(landmarks)
+    
+    def _alt_heuristic(self, g: int, reverse: bool = False) -> np.ndarray:
+        """
+        Lower bound ALT ke goal untuk semua node (segitiga ketidaksamaan):
+        max_L max(d(L, g) - d(L, v), d(v, L) - d(g, L)). Dengan reverse=True
+        peran jarak dari/ke landmark ditukar sehingga hasilnya batas d(g, v).
+        """
+        _, _, dist_from, dist_to = self._landmarks
+        if reverse:
+            dist_from, dist_to = dist_to, dist_from
+        with np.errstate(invalid='ignore'):
+            forward = dist_from[:, g, None] - dist_from
+            backward = dist_to - dist_to[:, g, None]
+        bounds = np.fmax(np.nan_to_num(forward, nan=-np.inf, posinf=np.inf),
+                         np.nan_to_num(backward, nan=-np.inf, posinf=np.inf))
+        return np.maximum(bounds.max(axis=0), 0)
     
-    def a_star(self, start: str, goal: str) -> Tuple[List[str], float, int]:
-        """A* Algorithm with Euclidean heuristic"""
-        def heuristic(n1, n2):
-            lat1, lon1 = self.graph.nodes[n1]['lat'], self.graph.nodes[n1]['lon']
-            lat2, lon2 = self.graph.nodes[n2]['lat'], self.graph.nodes[n2]['lon']
-            return np.sqrt((lat1 - lat2)**2 + (lon1 - lon2)**2) * 100000
+    def _geometric_heuristic(self, g: int) -> np.ndarray:
+        """
+        Lower bound geometris dalam menit: jarak great-circle ke goal dibagi
+        kecepatan tercepat di jaringan (jarak lurus antar ujung edge per
+        satuan weight). Admissible karena berlaku triangle inequality.
+        """
+        if self._geometry is None or self._geometry[0] is not self.csr:
+            csr = self.csr
+            lat, lon = np.radians(csr.lat), np.radians(csr.lon)
+            span = _haversine_m(lat[csr.tails], lon[csr.tails],
+                                lat[csr.indices], lon[csr.indices])
+            with np.errstate(divide='ignore', invalid='ignore'):
+                speeds = np.where(csr.weights > 0, span / csr.weights, 0)
+            speeds = speeds[np.isfinite(speeds)]
+            max_speed = float(speeds.max()) if len(speeds) else 0.0
+            self._geometry = (csr, lat, lon, max_speed)
+        
+        _, lat, lon, max_speed = self._geometry
+        if max_speed <= 0:
+            return np.zeros(self.csr.n_nodes)
+        return np.nan_to_num(_haversine_m(lat, lon, lat[g], lon[g]) / max_speed)
+    
+    def _heuristic(self, g: int, heuristic: str = 'auto', reverse: bool = False) -> np.ndarray:
+        """
+        Array lower bound untuk semua node: d(v, g), atau d(g, v) bila
+        reverse=True (dipakai pencarian mundur pada bidirectional A*).
+        """
+        landmarks_ready = self._landmarks is not None and self._landmarks[0] is self.csr
+        if heuristic == 'alt' and not landmarks_ready:
+            self.prepare_landmarks(len(self._landmarks[1]) if self._landmarks else 8)
+            landmarks_ready = True
+        if heuristic == 'alt' or (heuristic == 'auto' and landmarks_ready):
+            return self._alt_heuristic(g, reverse=reverse)
+        if heuristic in ('auto', 'geometric'):
+            return self._geometric_heuristic(g)
+        raise ValueError(f"Unknown heuristic: {heuristic}")
+    
+    def a_star(self, start: str, goal: str, heuristic: str = 'auto',
+               queue: str = 'heap') -> Tuple[List[str], float, int]:
+        """
+        A* Algorithm. heuristic: 'alt' (landmark, butuh prepare_landmarks),
+        'geometric' (great-circle / kecepatan maksimum), atau 'auto' yang
+        memakai ALT bila landmark tersedia untuk snapshot CSR saat ini.
+        queue 'dial'/'radix' butuh key f integer, yaitu heuristic 'alt'.
+        """
+        s, g = self.csr.index[start], self.csr.index[goal]
+        indptr, indices, weights = self.csr.adjacency_lists()
+        n = self.csr.n_nodes
+        
+        h = self._heuristic(g, heuristic)
+        open_set = self._make_queue(queue, self.csr.weights, potential=h)
+        h = h.tolist()
         
-        open_set = [(0, start)]
+        push, pop = open_set.push, open_set.pop
+        push((h[s], 0, s))
         came_from = {}
-        g_score = {node: float('inf') for node in self.graph.nodes()}
-        g_score[start] = 0
-        f_score = {node: float('inf') for node in self.graph.nodes()}
-        f_score[start] = heuristic(start, goal)
+        g_score = [float('inf')] * n
+        g_score[s] = 0
         iterations = 0
         
         while open_set:
             iterations += 1
-            current = heapq.heappop(open_set)[1]
+            _, current_g, current = pop()
             
-            if current == goal:
-                path = self._reconstruct_path_astar(came_from, start, goal)
-                return path, g_score[goal], iterations
+            if current == g:
+                path = self._reconstruct_path_astar(came_from, s, g)
+                return self._to_ids(path), g_score[g], iterations
+            
+            if current_g > g_score[current]:
+                continue
             
-            for neighbor in self.graph.neighbors(current):
-                tentative_g = g_score[current] + self.graph[current][neighbor]['weight']
+            for e in range(indptr[current], indptr[current + 1]):
+                neighbor = indices[e]
+                tentative_g = current_g + weights[e]
                 
                 if tentative_g < g_score[neighbor]:
                     came_from[neighbor] = current
                     g_score[neighbor] = tentative_g
-                    f_score[neighbor] = tentative_g + heuristic(neighbor, goal)
-                    heapq.heappush(open_set, (f_score[neighbor], neighbor))
+                    push((tentative_g + h[neighbor], tentative_g, neighbor))
         
         return [], float('inf'), iterations
     
-    def bellman_ford(self, start: str, goal: str) -> Tuple[List[str], float, int]:
-        """Bellman-Ford Algorithm"""
-        distances = {node: float('inf') for node in self.graph.nodes()}
-        distances[start] = 0
-        previous = {node: None for node in self.graph.nodes()}
+    def bidirectional_dijkstra(self, start: str, goal: str) -> Tuple[List[str], float, int]:
+        """Bidirectional Dijkstra: pencarian maju dari start dan mundur dari goal"""
+        s, g = self.csr.index[start], self.csr.index[goal]
+        return self._bidirectional_search(s, g)
+    
+    def bidirectional_a_star(self, start: str, goal: str,
+                             heuristic: str = 'auto') -> Tuple[List[str], float, int]:
+        """
+        Bidirectional A* dengan average potential p(v) = (h_goal(v) - h_start(v)) / 2,
+        sehingga kedua arah memakai reduced cost yang konsisten dan kriteria
+        berhenti Dijkstra biasa tetap berlaku.
+        """
+        s, g = self.csr.index[start], self.csr.index[goal]
+        to_goal = self._heuristic(g, heuristic)
+        from_start = self._heuristic(s, heuristic, reverse=True)
+        with np.errstate(invalid='ignore'):
+            potential = np.nan_to_num((to_goal - from_start) / 2, posinf=0, neginf=0)
+        return self._bidirectional_search(s, g, potential.tolist())
+    
+    def _bidirectional_search(self, s: int, g: int,
+                              potential: List[float] = None) -> Tuple[List[str], float, int]:
+        """
+        Mesin bidirectional bersama. Key maju d_f(v) + p(v), key mundur
+        d_b(v) - p(v); berhenti begitu top_f + top_b >= mu (jarak terbaik
+        yang sudah diketahui lewat node pertemuan).
+        """
+        n = self.csr.n_nodes
+        adjacency = (self.csr.adjacency_lists(), self.csr.reverse().adjacency_lists())
+        p = potential if potential is not None else [0] * n
+        sign = (1, -1)
+        dist = ([float('inf')] * n, [float('inf')] * n)
+        previous = ([-1] * n, [-1] * n)
+        settled = ([False] * n, [False] * n)
+        dist[0][s] = 0
+        dist[1][g] = 0
+        queues = ([(p[s], s)], [(-p[g], g)])
+        mu, meet = (0, s) if s == g else (float('inf'), -1)
         iterations = 0
         
-        for _ in range(len(self.graph.nodes()) - 1):
-            for u, v, data in self.graph.edges(data=True):
-                iterations += 1
-                weight = data['weight']
+        while queues[0] and queues[1]:
+            if queues[0][0][0] + queues[1][0][0] >= mu:
+                break
+            
+            side = 0 if len(queues[0]) <= len(queues[1]) else 1
+            _, current = heapq.heappop(queues[side])
+            iterations += 1
+            
+            if settled[side][current]:
+                continue
+            settled[side][current] = True
+            
+            indptr, indices, weights = adjacency[side]
+            own, other = dist[side], dist[1 - side]
+            current_dist = own[current]
+            
+            for e in range(indptr[current], indptr[current + 1]):
+                neighbor = indices[e]
+                distance = current_dist + weights[e]
                 
-                if distances[u] + weight < distances[v]:
-                    distances[v] = distances[u] + weight
-                    previous[v] = u
+                if distance < own[neighbor]:
+                    own[neighbor] = distance
+                    previous[side][neighbor] = current
+                    heapq.heappush(queues[side], (distance + sign[side] * p[neighbor], neighbor))
                 
-                if distances[v] + weight < distances[u]:
-                    distances[u] = distances[v] + weight
-                    previous[u] = v
+                if distance + other[neighbor] < mu:
+                    mu = distance + other[neighbor]
+                    meet = neighbor
+        
+        if meet == -1:
+            return [], float('inf'), iterations
         
-        path = self._reconstruct_path(previous, start, goal)
-        return path, distances[goal], iterations
+        path = self._reconstruct_path(previous[0], s, meet)
+        current = previous[1][meet]
+        while current != -1:
+            path.append(current)
+            current = previous[1][current]
+        return self._to_ids(path), mu, iterations
     
-    def floyd_warshall(self, start: str, goal: str) -> Tuple[List[str], float, int]:
-        """Floyd-Warshall Algorithm"""
-        nodes = list(self.graph.nodes())
-        n = len(nodes)
-        dist = {(i, j): float('inf') for i in nodes for j in nodes}
-        next_node = {(i, j): None for i in nodes for j in nodes}
-        iterations = 0
+    def bellman_ford(self, start: str, goal: str,
+                     mode: str = 'rounds') -> Tuple[List[str], float, int]:
+        """
+        Bellman-Ford Algorithm. mode: 'rounds' (ronde penuh atas semua arc,
+        berhenti begitu satu ronde tidak mengubah jarak), 'spfa' (queue-based)
+        atau 'numpy' (relaksasi vectorized np.minimum.at). iterations = jumlah
+        node yang di-expand (arc keluarnya direlaksasi), sama seperti algoritma
+        lain; lihat _bellman_ford_tree untuk jumlah ronde dan relaksasi.
+        """
+        s, g = self.csr.index[start], self.csr.index[goal]
+        distances, previous, _, _, expanded = self._bellman_ford_tree(s, mode)
         
-        for node in nodes:
-            dist[(node, node)] = 0
+        if distances[g] == float('inf'):
+            return [], float('inf'), expanded
         
-        for u, v, data in self.graph.edges(data=True):
-            dist[(u, v)] = data['weight']
-            dist[(v, u)] = data['weight']
-            next_node[(u, v)] = v
-            next_node[(v, u)] = u
+        path = self._reconstruct_path(previous, s, g)
+        return self._to_ids(path), float(distances[g]), expanded
+    
+    def _bellman_ford_tree(self, s: int, mode: str = 'rounds') -> Tuple[List[float], List[int], int, int, int]:
+        """
+        Shortest-path tree Bellman-Ford dari s: (distances, previous, rounds,
+        relaxations, expanded). Arc CSR sudah memuat kedua arah edge undirected.
+        ValueError bila negative cycle terjangkau dari s.
+        """
+        if mode == 'rounds':
+            return self._bellman_ford_rounds(s)
+        if mode == 'spfa':
+            return self._bellman_ford_spfa(s)
+        if mode == 'numpy':
+            return self._bellman_ford_numpy(s)
+        raise ValueError(f"Unknown Bellman-Ford mode: {mode}")
+    
+    def _bellman_ford_rounds(self, s: int) -> Tuple[List[float], List[int], int, int, int]:
+        """Bellman-Ford klasik dengan early exit"""
+        csr = self.csr
+        n = csr.n_nodes
+        edges = list(zip(csr.tails.tolist(), csr.indices.tolist(), csr.weights.tolist()))
+        distances = [float('inf')] * n
+        distances[s] = 0
+        previous = [-1] * n
+        rounds = relaxations = 0
         
-        for k in nodes:
-            for i in nodes:
-                for j in nodes:
-                    iterations += 1
-                    if dist[(i, j)] > dist[(i, k)] + dist[(k, j)]:
-                        dist[(i, j)] = dist[(i, k)] + dist[(k, j)]
-                        next_node[(i, j)] = next_node[(i, k)]
+        # Tanpa negative cycle jarak konvergen dalam n - 1 ronde;
+        # perubahan pada ronde ke-n berarti ada negative cycle
+        for _ in range(n):
+            rounds += 1
+            relaxations += len(edges)
+            changed = False
+            for u, v, weight in edges:
+                distance = distances[u] + weight
+                if distance < distances[v]:
+                    distances[v] = distance
+                    previous[v] = u
+                    changed = True
+            if not changed:
+                break
+        else:
+            raise ValueError("Graph contains a negative-weight cycle")
         
-        path = self._reconstruct_path_floyd(next_node, start, goal)
-        return path, dist[(start, goal)], iterations
+        # Setiap ronde menscan arc keluar semua node
+        return distances, previous, rounds, relaxations, rounds * n
     
-    def johnson(self, start: str, goal: str) -> Tuple[List[str], float, int]:
-        """Johnson's Algorithm"""
-        iterations = 0
-        new_node = 'temp_source'
-        G_temp = self.graph.copy()
-        G_temp.add_node(new_node)
+    def _bellman_ford_spfa(self, s: int) -> Tuple[List[float], List[int], int, int, int]:
+        """
+        SPFA: hanya node yang jaraknya berubah masuk queue. Satu ronde = satu
+        gelombang queue; jumlah arc pada path >= n berarti negative cycle.
+        """
+        indptr, indices, weights = self.csr.adjacency_lists()
+        n = self.csr.n_nodes
+        distances = [float('inf')] * n
+        distances[s] = 0
+        previous = [-1] * n
+        hops = [0] * n
+        in_queue = [False] * n
+        queue = deque([s])
+        in_queue[s] = True
+        rounds = relaxations = expanded = 0
+        
+        while queue:
+            rounds += 1
+            for _ in range(len(queue)):
+                u = queue.popleft()
+                in_queue[u] = False
+                expanded += 1
+                for e in range(indptr[u], indptr[u + 1]):
+                    relaxations += 1
+                    v = indices[e]
+                    distance = distances[u] + weights[e]
+                    if distance < distances[v]:
+                        distances[v] = distance
+                        previous[v] = u
+                        hops[v] = hops[u] + 1
+                        if hops[v] >= n:
+                            raise ValueError("Graph contains a negative-weight cycle")
+                        if not in_queue[v]:
+                            in_queue[v] = True
+                            queue.append(v)
+        
+        return distances, previous, rounds, relaxations, expanded
+    
+    def _bellman_ford_numpy(self, s: int) -> Tuple[List[float], List[int], int, int, int]:
+        """
+        Bellman-Ford vectorized: setiap ronde merelaksasi sekaligus semua arc
+        yang tail-nya berubah pada ronde sebelumnya dengan np.minimum.at.
+        """
+        csr = self.csr
+        n = csr.n_nodes
+        tails, heads, weights = csr.tails, csr.indices, csr.weights
+        distances = np.full(n, np.inf)
+        distances[s] = 0
+        previous = np.full(n, -1, dtype=np.int64)
+        active = np.zeros(n, dtype=bool)
+        active[s] = True
+        rounds = relaxations = expanded = 0
+        
+        while active.any():
+            if rounds == n:
+                raise ValueError("Graph contains a negative-weight cycle")
+            rounds += 1
+            expanded += int(active.sum())
+            arcs = np.flatnonzero(active[tails])
+            relaxations += len(arcs)
+            candidate = distances[tails[arcs]] + weights[arcs]
+            updated = distances.copy()
+            np.minimum.at(updated, heads[arcs], candidate)
+            
+            improved = updated < distances
+            winners = arcs[improved[heads[arcs]] & (candidate == updated[heads[arcs]])]
+            previous[heads[winners]] = tails[winners]
+            distances = updated
+            active = improved
+        
+        return distances.tolist(), previous.tolist(), rounds, relaxations, expanded
+    
+    def all_pairs_shortest_paths(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Matriks all-pairs (dist, successor) hasil Floyd-Warshall vectorized.
+        Dihitung sekali per snapshot CSR lalu di-cache; successor[i, j] adalah
+        node berikutnya dari i menuju j (-1 bila tidak terjangkau).
+        """
+        if self._apsp is not None and self._apsp[0] is self.csr:
+            return self._apsp[1], self._apsp[2]
+        
+        csr = self.csr
+        n = csr.n_nodes
+        dist = np.full((n, n), np.inf)
+        np.fill_diagonal(dist, 0)
+        np.minimum.at(dist, (csr.tails, csr.indices), csr.weights)
+        
+        successor = np.where(np.isfinite(dist), np.arange(n, dtype=np.int32), -1).astype(np.int32)
+        
+        # Iterasi k: update seluruh matriks lewat broadcast kolom k + baris k
+        candidate = np.empty_like(dist)
+        improve = np.empty((n, n), dtype=bool)
+        for k in range(n):
+            np.add(dist[:, k, None], dist[None, k, :], out=candidate)
+            np.less(candidate, dist, out=improve)
+            np.copyto(dist, candidate, where=improve)
+            np.copyto(successor, successor[:, k, None], where=improve)
+        
+        dist.setflags(write=False)
+        successor.setflags(write=False)
+        self._apsp = (csr, dist, successor)
+        return dist, successor
+    
+    def floyd_warshall(self, start: str, goal: str) -> Tuple[List[str], float, int]:
+        """
+        Floyd-Warshall Algorithm. Query berikutnya pada graf yang sama hanya
+        lookup matriks all-pairs; iterations menghitung relaksasi yang
+        dilakukan pada pemanggilan ini (0 bila matriks sudah tersedia).
+        """
+        s, g = self.csr.index[start], self.csr.index[goal]
+        cached = self._apsp is not None and self._apsp[0] is self.csr
+        dist, successor = self.all_pairs_shortest_paths()
+        iterations = 0 if cached else self.csr.n_nodes ** 3
+        
+        path = self._reconstruct_path_floyd(successor, s, g)
+        return self._to_ids(path), float(dist[s, g]), iterations
+    
+    def johnson_potentials(self) -> np.ndarray:
+        """
+        Potensial reweighting h untuk Johnson, dihitung sekali per snapshot
+        CSR. Source virtual tidak dibuat secara eksplisit: terhubung ke semua
+        node dengan bobot 0, jadi cukup inisialisasi h = 0 lalu Bellman-Ford.
+        """
+        return self._johnson_reweighting()[0]
+    
+    def _johnson_reweighting(self) -> Tuple[np.ndarray, List[float], int]:
+        """Cache (h, bobot reweighted per arc, jumlah relaksasi Bellman-Ford)"""
+        if self._johnson is not None and self._johnson[0] is self.csr:
+            return self._johnson[1:]
         
-        for node in self.graph.nodes():
-            G_temp.add_edge(new_node, node, weight=0)
+        csr = self.csr
+        tails, heads, weights = csr.tails, csr.indices, csr.weights
+        h = np.zeros(csr.n_nodes)
+        relaxations = 0
         
-        h = {node: 0 for node in G_temp.nodes()}
-        for _ in range(len(G_temp.nodes()) - 1):
-            for u, v, data in G_temp.edges(data=True):
-                iterations += 1
-                if h[u] + data['weight'] < h[v]:
-                    h[v] = h[u] + data['weight']
+        # n + 1 node termasuk source virtual => konvergen dalam n ronde;
+        # perubahan pada ronde ke-(n + 1) berarti ada negative cycle
+        for _ in range(csr.n_nodes + 1):
+            relaxations += csr.n_arcs
+            updated = h.copy()
+            np.minimum.at(updated, heads, h[tails] + weights)
+            if np.array_equal(updated, h):
+                break
+            h = updated
+        else:
+            raise ValueError("Graph contains a negative-weight cycle")
         
-        distances = {node: float('inf') for node in self.graph.nodes()}
-        distances[start] = 0
-        previous = {node: None for node in self.graph.nodes()}
-        pq = [(0, start)]
+        h.setflags(write=False)
+        reweighted = (weights + h[tails] - h[heads]).tolist()
+        self._johnson = (csr, h, reweighted, relaxations)
+        return h, reweighted, relaxations
+    
+    def _reweighted_dijkstra(self, s: int, h: np.ndarray, reweighted: List[float],
+                             goal: int = -1, queue='heap') -> Tuple[List[float], List[int], int]:
+        """Dijkstra pada bobot reweighted; berhenti di goal bila diberikan"""
+        indptr, indices, _ = self.csr.adjacency_lists()
+        n = self.csr.n_nodes
+        distances = [float('inf')] * n
+        distances[s] = 0
+        previous = [-1] * n
+        pq = self._make_queue(queue, reweighted)
+        push, pop = pq.push, pq.pop
+        push((0, s))
+        iterations = 0
         
         while pq:
             iterations += 1
-            current_dist, current = heapq.heappop(pq)
+            current_dist, current = pop()
             
             if current == goal:
-                path = self._reconstruct_path(previous, start, goal)
-                return path, current_dist, iterations
+                break
+            
+            if current_dist > distances[current]:
+                continue
             
-            for neighbor in self.graph.neighbors(current):
-                weight = self.graph[current][neighbor]['weight']
-                reweighted = weight + h[current] - h[neighbor]
-                distance = current_dist + reweighted
+            for e in range(indptr[current], indptr[current + 1]):
+                neighbor = indices[e]
+                distance = current_dist + reweighted[e]
                 
                 if distance < distances[neighbor]:
                     distances[neighbor] = distance
                     previous[neighbor] = current
-                    heapq.heappush(pq, (distance, neighbor))
+                    push((distance, neighbor))
         
-        return [], float('inf'), iterations
+        return distances, previous, iterations
+    
+    def johnson(self, start: str, goal: str, queue: str = 'heap') -> Tuple[List[str], float, int]:
+        """
+        Johnson's Algorithm. Potensial h di-cache, sehingga query berikutnya
+        hanya menjalankan satu Dijkstra reweighted. queue: backend priority
+        queue untuk Dijkstra reweighted.
+        """
+        s, g = self.csr.index[start], self.csr.index[goal]
+        cached = self._johnson is not None and self._johnson[0] is self.csr
+        h, reweighted, relaxations = self._johnson_reweighting()
+        iterations = 0 if cached else relaxations
+        
+        distances, previous, pops = self._reweighted_dijkstra(s, h, reweighted, goal=g, queue=queue)
+        iterations += pops
+        
+        if distances[g] == float('inf'):
+            return [], float('inf'), iterations
+        
+        path = self._reconstruct_path(previous, s, g)
+        return self._to_ids(path), float(distances[g] - h[s] + h[g]), iterations
+    
+    def johnson_all_pairs(self) -> np.ndarray:
+        """
+        All-pairs Johnson: satu Dijkstra reweighted per source. Mengembalikan
+        tabel jarak n x n dengan urutan baris/kolom sesuai csr.node_ids.
+        """
+        h, reweighted, _ = self._johnson_reweighting()
+        n = self.csr.n_nodes
+        table = np.empty((n, n))
+        
+        for s in range(n):
+            distances, _, _ = self._reweighted_dijkstra(s, h, reweighted)
+            table[s] = distances
+        table += h[None, :] - h[:, None]
+        return table
+    
+    def topological_order(self) -> Optional[List[int]]:
+        """
+        Urutan topologis directed view CSR dengan Kahn iteratif (tanpa
+        rekursi), atau None bila ada cycle. Graf undirected selalu punya
+        cycle u -> v -> u sehingga tidak pernah dianggap DAG. Di-cache per
+        snapshot CSR.
+        """
+        if self._topological is not None and self._topological[0] is self.csr:
+            return self._topological[1]
+        
+        csr = self.csr
+        indptr, indices, _ = csr.adjacency_lists()
+        in_degree = np.bincount(csr.indices, minlength=csr.n_nodes).tolist()
+        order = [v for v in range(csr.n_nodes) if in_degree[v] == 0]
+        
+        i = 0
+        while i < len(order):
+            u = order[i]
+            i += 1
+            for v in indices[indptr[u]:indptr[u + 1]]:
+                in_degree[v] -= 1
+                if in_degree[v] == 0:
+                    order.append(v)
+        
+        if len(order) < csr.n_nodes:
+            order = None
+        self._topological = (csr, order)
+        return order
+    
+    def is_dag(self) -> bool:
+        return self.topological_order() is not None
     
     def topological_sort(self, start: str, goal: str) -> Tuple[List[str], float, int]:
-        """Topological Sort based pathfinding"""
-        visited = set()
-        stack = []
+        """
+        Shortest path DAG linear-time: relaksasi arc mengikuti urutan
+        topologis mulai dari start sampai goal. Bila directed view bukan DAG,
+        fallback ke Dijkstra (SPFA bila ada bobot negatif) dan nama algoritma
+        fallback dicatat di self.topological_fallback.
+        """
+        order = self.topological_order()
+        if order is None:
+            if self.csr.n_arcs and self.csr.weights.min() < 0:
+                self.topological_fallback = 'bellman_ford_spfa'
+                return self.bellman_ford(start, goal, mode='spfa')
+            self.topological_fallback = 'dijkstra'
+            return self.dijkstra(start, goal)
+        self.topological_fallback = None
+        
+        s, g = self.csr.index[start], self.csr.index[goal]
+        indptr, indices, weights = self.csr.adjacency_lists()
+        n = self.csr.n_nodes
+        distances = [float('inf')] * n
+        distances[s] = 0
+        previous = [-1] * n
         iterations = 0
         
-        def dfs_visit(node):
-            nonlocal iterations
+        # Node sebelum start dalam urutan topologis tidak terjangkau dari start,
+        # dan jarak goal sudah final begitu goal dicapai
+        for node in order[order.index(s):]:
             iterations += 1
-            visited.add(node)
-            for neighbor in self.graph.neighbors(node):
-                if neighbor not in visited:
-                    dfs_visit(neighbor)
-            stack.append(node)
-        
-        for node in self.graph.nodes():
-            if node not in visited:
-                dfs_visit(node)
+            if node == g:
+                break
+            if distances[node] == float('inf'):
+                continue
+            for e in range(indptr[node], indptr[node + 1]):
+                neighbor = indices[e]
+                if distances[node] + weights[e] < distances[neighbor]:
+                    distances[neighbor] = distances[node] + weights[e]
+                    previous[neighbor] = node
         
-        topo_order = stack[::-1]
+        if distances[g] == float('inf'):
+            return [], float('inf'), iterations
         
-        distances = {node: float('inf') for node in self.graph.nodes()}
-        distances[start] = 0
-        previous = {node: None for node in self.graph.nodes()}
+        path = self._reconstruct_path(previous, s, g)
+        return self._to_ids(path), distances[g], iterations
+    
+    def multi_source_bfs(self, start: str, goal: str) -> Tuple[List[str], float, int]:
+        """
+        Multi-Source BFS: satu frontier dari semua dermaga (plus start) lewat
+        _multi_source_tree dengan bobot satuan, jadi setiap node diklaim
+        source dengan jumlah hop paling sedikit. Bila goal diklaim start,
+        path diambil dari pohon itu; bila tidak, fallback ke BFS dari start.
+        """
+        s, g = self.csr.index[start], self.csr.index[goal]
+        sources = self.csr.nodes_of_type('dermaga').tolist() + [s]
+        _, nearest, previous, iterations = self._multi_source_tree(sources, self._unit_csr())
         
-        for node in topo_order:
-            if distances[node] != float('inf'):
-                for neighbor in self.graph.neighbors(node):
-                    weight = self.graph[node][neighbor]['weight']
-                    if distances[node] + weight < distances[neighbor]:
-                        distances[neighbor] = distances[node] + weight
-                        previous[neighbor] = node
+        if nearest[g] != s:
+            path, total_time, bfs_iterations = self.bfs(start, goal)
+            return path, total_time, iterations + bfs_iterations
         
-        path = self._reconstruct_path(previous, start, goal)
-        return path, distances[goal], iterations
+        path = self._reconstruct_path(previous, s, g)
+        return self._to_ids(path), self._calculate_path_time(path), iterations
     
-    def multi_source_bfs(self, start: str, goal: str) -> Tuple[List[str], float, int]:
-        """Multi-Source BFS"""
-        sources = [n for n in self.graph.nodes() 
-                  if self.graph.nodes[n]['type'] == 'dermaga']
+    def _unit_csr(self) -> 'CSRGraph':
+        """Snapshot CSR yang sama dengan semua bobot 1 (jarak = jumlah hop)"""
+        csr = self.csr
+        if self._unit is None or self._unit[0] is not csr:
+            unit = CSRGraph(csr.node_ids, csr.indptr, csr.indices,
+                            np.ones(len(csr.indices)), directed=csr.directed)
+            self._unit = (csr, unit)
+        return self._unit[1]
+    
+    def batch_query(self, queries: List[Tuple[str, str]]) -> BatchRouteResult:
+        """
+        Jawab banyak query (start, goal) sekaligus. Query dikelompokkan per
+        start; untuk setiap start yang berbeda hanya satu Dijkstra dijalankan
+        sampai semua goal-nya settled, lalu semua goal dijawab dari tree itu.
+        """
+        index = self.csr.index
+        starts = np.array([index[start] for start, _ in queries], dtype=np.int64)
+        goals = np.array([index[goal] for _, goal in queries], dtype=np.int64)
+        return self._batch(starts, goals)
+    
+    def one_to_many(self, start: str, goals: List[str]) -> BatchRouteResult:
+        """Satu source ke banyak tujuan dengan satu pencarian"""
+        return self.batch_query([(start, goal) for goal in goals])
+    
+    def many_to_many(self, starts: List[str], goals: List[str]) -> BatchRouteResult:
+        """Matriks jarak len(starts) x len(goals); satu pencarian per start"""
+        index = self.csr.index
+        s = np.array([index[node] for node in starts], dtype=np.int64)
+        g = np.array([index[node] for node in goals], dtype=np.int64)
+        return self._batch(np.repeat(s, len(g)), np.tile(g, len(s)),
+                           shape=(len(s), len(g)))
+    
+    def _batch(self, starts: np.ndarray, goals: np.ndarray,
+               shape: Tuple[int, ...] = None) -> BatchRouteResult:
+        distances = np.empty(len(starts))
+        trees = {}
+        iterations = 0
         
-        visited = {s: {s} for s in sources}
-        queues = {s: deque([(s, [s])]) for s in sources}
+        order = np.argsort(starts, kind='stable')
+        sources, first = np.unique(starts[order], return_index=True)
+        for source, group in zip(sources.tolist(), np.split(order, first[1:])):
+            tree_dist, previous, pops = self._dijkstra_tree(
+                source, targets=goals[group].tolist())
+            iterations += pops
+            distances[group] = np.asarray(tree_dist)[goals[group]]
+            trees[source] = np.asarray(previous, dtype=self.csr.indices.dtype)
+        
+        return BatchRouteResult(self.csr.node_ids, starts, goals, distances,
+                                trees, iterations, shape)
+    
+    def multi_source_dijkstra(self, sources: List[str] = None) -> Tuple[np.ndarray, np.ndarray, int]:
+        """
+        Multi-Source Dijkstra satu kali jalan: satu heap diisi semua source
+        (default semua dermaga), setiap node diberi label source terdekat.
+        Mengembalikan (jarak, integer id source terdekat / -1, iterations).
+        """
+        if sources is None:
+            seeds = self.csr.nodes_of_type('dermaga').tolist()
+        else:
+            seeds = [self.csr.index[node] for node in sources]
+        distances, nearest, _, iterations = self._multi_source_tree(seeds)
+        return np.array(distances), np.array(nearest), iterations
+    
+    def _multi_source_tree(self, sources: List[int],
+                           csr: 'CSRGraph' = None) -> Tuple[List[float], List[int], List[int], int]:
+        """Loop Dijkstra dengan banyak source sekaligus; O((V + E) log V)"""
+        csr = self.csr if csr is None else csr
+        indptr, indices, weights = csr.adjacency_lists()
+        n = csr.n_nodes
+        distances = [float('inf')] * n
+        nearest = [-1] * n
+        previous = [-1] * n
+        pq = []
+        for src in sources:
+            if distances[src] != 0:
+                distances[src] = 0
+                nearest[src] = src
+                pq.append((0, src))
+        heapq.heapify(pq)
         iterations = 0
         
-        while any(queues.values()):
+        while pq:
             iterations += 1
-            for source in sources:
-                if not queues[source]:
-                    continue
-                    
-                node, path = queues[source].popleft()
+            current_dist, current = heapq.heappop(pq)
+            
+            if current_dist > distances[current]:
+                continue
+            
+            for e in range(indptr[current], indptr[current + 1]):
+                neighbor = indices[e]
+                distance = current_dist + weights[e]
                 
-                if node == goal and source == start:
-                    total_time = self._calculate_path_time(path)
-                    return path, total_time, iterations
+                if distance < distances[neighbor]:
+                    distances[neighbor] = distance
+                    nearest[neighbor] = nearest[current]
+                    previous[neighbor] = current
+                    heapq.heappush(pq, (distance, neighbor))
+        
+        return distances, nearest, previous, iterations
+    
+    def nearest_facility(self, targets: List[str] = None,
+                         sources: List[str] = None) -> Dict[str, Tuple[str, float]]:
+        """
+        Source terdekat untuk setiap target, mis. dermaga terdekat ke setiap
+        rumah sakit (default targets: semua hospital). Target yang tidak
+        terjangkau mendapat (None, inf).
+        """
+        distances, nearest, _ = self.multi_source_dijkstra(sources)
+        if targets is None:
+            target_ids = self.csr.nodes_of_type('hospital').tolist()
+        else:
+            target_ids = [self.csr.index[node] for node in targets]
+        
+        node_ids = self.csr.node_ids
+        return {
+            node_ids[t]: ((node_ids[nearest[t]], float(distances[t])) if nearest[t] >= 0
+                          else (None, float('inf')))
+            for t in target_ids
+        }
+    
+    def voronoi_partition(self, sources: List[str] = None) -> Dict[str, List[str]]:
+        """Partisi Voronoi graf: source -> daftar node yang paling dekat ke source tersebut"""
+        _, nearest, _ = self.multi_source_dijkstra(sources)
+        node_ids = self.csr.node_ids
+        reachable = np.flatnonzero(nearest >= 0)
+        order = reachable[np.argsort(nearest[reachable], kind='stable')]
+        labels, starts = np.unique(nearest[order], return_index=True)
+        
+        return {node_ids[src]: [node_ids[i] for i in cell]
+                for src, cell in zip(labels, np.split(order, starts[1:]))}
+    
+    def reachable_within(self, start: str, budget: float) -> Dict[str, float]:
+        """
+        Isochrone: semua node yang terjangkau dari start dalam budget menit,
+        beserta waktu tibanya. Dijkstra berhenti begitu melewati budget dan
+        hanya menyimpan node yang disentuh, sehingga biayanya sebanding
+        dengan ukuran area yang terjangkau, bukan ukuran graf.
+        """
+        (reached,), _ = self._bounded_multi_source([self.csr.index[start]], budget)
+        node_ids = self.csr.node_ids
+        return {node_ids[u]: d for u, d in sorted(reached.items(), key=lambda item: item[1])}
+    
+    def isochrones(self, start: str,
+                   budgets: Tuple[float, ...] = (5, 10, 15, 30)) -> Dict[float, List[str]]:
+        """
+        Isochrone untuk beberapa budget dari satu pencarian (sampai budget
+        terbesar). Setiap budget berisi semua node dengan waktu tiba <= budget.
+        """
+        budgets = sorted(budgets)
+        if not budgets:
+            return {}
+        reached = self.reachable_within(start, budgets[-1])
+        times = np.fromiter(reached.values(), dtype=np.float64, count=len(reached))
+        nodes = list(reached)
+        return {budget: nodes[:int(np.searchsorted(times, budget, side='right'))]
+                for budget in budgets}
+    
+    def coverage_report(self, budget: float, sources: List[str] = None,
+                        targets: List[str] = None) -> pd.DataFrame:
+        """
+        Rumah sakit (targets) yang dapat dicapai setiap dermaga (sources)
+        dalam budget menit. Satu pencarian multi-source berlabel yang
+        dibatasi budget dijalankan dari sisi yang lebih sedikit (rumah
+        sakit memakai graf reverse), bukan query per pasangan.
+        """
+        csr = self.csr
+        source_ids = (csr.nodes_of_type('dermaga').tolist() if sources is None
+                      else [csr.index[node] for node in sources])
+        target_ids = (csr.nodes_of_type('hospital').tolist() if targets is None
+                      else [csr.index[node] for node in targets])
+        
+        minutes = np.full((len(source_ids), len(target_ids)), np.inf)
+        if len(target_ids) < len(source_ids):
+            reached, _ = self._bounded_multi_source(target_ids, budget, csr=csr.reverse())
+            for j, dist in enumerate(reached):
+                for i, src in enumerate(source_ids):
+                    minutes[i, j] = dist.get(src, np.inf)
+        else:
+            reached, _ = self._bounded_multi_source(source_ids, budget)
+            for i, dist in enumerate(reached):
+                for j, dst in enumerate(target_ids):
+                    minutes[i, j] = dist.get(dst, np.inf)
+        
+        node_ids = csr.node_ids
+        rows = []
+        for i, src in enumerate(source_ids):
+            order = np.argsort(minutes[i], kind='stable')
+            covered = [j for j in order.tolist() if np.isfinite(minutes[i, j])]
+            rows.append({
+                'Dermaga': node_ids[src],
+                f'Hospitals <= {budget:g} min': len(covered),
+                'Nearest Hospital': node_ids[target_ids[covered[0]]] if covered else None,
+                'Nearest (min)': minutes[i, covered[0]] if covered else np.inf,
+                'Reachable': ', '.join(f"{node_ids[target_ids[j]]} ({minutes[i, j]:g})"
+                                       for j in covered),
+            })
+        return pd.DataFrame(rows)
+    
+    def _bounded_multi_source(self, sources: List[int], budget: float,
+                              csr: 'CSRGraph' = None) -> Tuple[List[Dict[int, float]], int]:
+        """
+        Dijkstra multi-source berlabel: satu heap untuk semua source, setiap
+        entry membawa index source-nya dan label (source, node) di-settle
+        tepat sekali. Entry di atas budget tidak pernah di-push. Mengembalikan
+        (jarak per source sebagai dict node -> menit, iterations).
+        """
+        csr = self.csr if csr is None else csr
+        indptr, indices, weights = csr.adjacency_lists()
+        reached = [{} for _ in sources]
+        pq = []
+        for k, src in enumerate(sources):
+            reached[k][src] = 0
+            pq.append((0, k, src))
+        heapq.heapify(pq)
+        iterations = 0
+        
+        while pq:
+            iterations += 1
+            current_dist, k, current = heapq.heappop(pq)
+            dist = reached[k]
+            
+            if current_dist > dist[current]:
+                continue
+            
+            for e in range(indptr[current], indptr[current + 1]):
+                neighbor = indices[e]
+                distance = current_dist + weights[e]
                 
-                for neighbor in self.graph.neighbors(node):
-                    if neighbor not in visited[source]:
-                        visited[source].add(neighbor)
-                        queues[source].append((neighbor, path + [neighbor]))
+                if distance <= budget and distance < dist.get(neighbor, float('inf')):
+                    dist[neighbor] = distance
+                    heapq.heappush(pq, (distance, k, neighbor))
         
-        return self.bfs(start, goal)
+        return reached, iterations
     
-    def _calculate_path_time(self, path: List[str]) -> float:
+    def _to_ids(self, path: List[int]) -> List[str]:
+        """Konversi path integer id menjadi node id asli"""
+        node_ids = self.csr.node_ids
+        return [node_ids[i] for i in path]
+    
+    def _calculate_path_time(self, path: List[int]) -> float:
         """Menghitung total waktu tempuh untuk path"""
         if len(path) < 2:
             return 0
         
+        indptr, indices, weights = self.csr.adjacency_lists()
         total = 0
-        for i in range(len(path) - 1):
-            total += self.graph[path[i]][path[i+1]]['weight']
+        for u, v in zip(path, path[1:]):
+            total += min(weights[e] for e in range(indptr[u], indptr[u + 1])
+                         if indices[e] == v)
         return total
     
-    def _reconstruct_path(self, previous: Dict, start: str, goal: str) -> List[str]:
-        """Rekonstruksi path dari dictionary previous"""
+    def _reconstruct_path(self, previous, start: int, goal: int) -> List[int]:
+        """Rekonstruksi path dari array (atau dict) previous"""
         path = []
         current = goal
         
-        while current is not None:
+        while current != -1:
             path.append(current)
             current = previous[current]
         
@@ -633,7 +1886,7 @@ class RoutingAlgorithms:
         
         return path
     
-    def _reconstruct_path_astar(self, came_from: Dict, start: str, goal: str) -> List[str]:
+    def _reconstruct_path_astar(self, came_from: Dict, start: int, goal: int) -> List[int]:
         """Rekonstruksi path untuk A*"""
         path = [goal]
         current = goal
@@ -645,16 +1898,16 @@ class RoutingAlgorithms:
         path.reverse()
         return path
     
-    def _reconstruct_path_floyd(self, next_node: Dict, start: str, goal: str) -> List[str]:
-        """Rekonstruksi path untuk Floyd-Warshall"""
-        if next_node[(start, goal)] is None:
+    def _reconstruct_path_floyd(self, successor: np.ndarray, start: int, goal: int) -> List[int]:
+        """Rekonstruksi path untuk Floyd-Warshall dari matriks successor"""
+        if successor[start, goal] == -1:
             return []
         
         path = [start]
         current = start
         
         while current != goal:
-            current = next_node[(current, goal)]
+            current = int(successor[current, goal])
             path.append(current)
         
         return path
@@ -690,6 +1943,8 @@ def main():
         ('BFS', algorithms.bfs),
         ('Dijkstra', algorithms.dijkstra),
         ('A*', algorithms.a_star),
+        ('Bidirectional Dijkstra', algorithms.bidirectional_dijkstra),
+        ('Bidirectional A*', algorithms.bidirectional_a_star),
         ('Bellman-Ford', algorithms.bellman_ford),
         ('Floyd-Warshall', algorithms.floyd_warshall),
         ('Johnson', algorithms.johnson),
@@ -720,6 +1975,9 @@ def main():
             print(f"  Stops: {len(path) - 1}")
         else:
             print(f"  No path found!")
+        
+        if algo_name == 'Topological Sort' and algorithms.topological_fallback:
+            print(f"  Note: graph is not a DAG, fell back to {algorithms.topological_fallback}")
     
     # Create results DataFrame
     df_results = pd.DataFrame(results)
@@ -733,6 +1991,21 @@ def main():
     df_results.to_csv('csv/ambulance_routing_results.csv', index=False)
     print("\nResults saved to: csv/ambulance_routing_results.csv")
     
+    # Dermaga terdekat untuk setiap rumah sakit (satu Multi-Source Dijkstra)
+    print("\nNearest dermaga per hospital (single-pass Multi-Source Dijkstra):")
+    for hospital, (dermaga, minutes) in algorithms.nearest_facility().items():
+        print(f"  {hospital} <- {dermaga}: {minutes:.1f} minutes")
+    
+    # Cakupan rumah sakit per dermaga dalam 15 menit (satu pencarian multi-source)
+    print("\nHospital coverage per dermaga within 15 minutes:")
+    print(algorithms.coverage_report(15).to_string(index=False))
+    
+    # Rute cadangan untuk dispatcher (Yen k-shortest paths)
+    print(f"\nBackup routes {START} -> {GOAL} (Yen k-shortest paths):")
+    routes, _ = algorithms.k_shortest_paths(START, GOAL, 3)
+    for rank, (path, minutes) in enumerate(routes, 1):
+        print(f"  {rank}. {' -> '.join(path)}: {minutes:.1f} minutes")
+    
     # Visualizations
     print("\n" + "=" * 80)
     print("GENERATING VISUALIZATIONS")